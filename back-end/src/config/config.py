@@ -46,6 +46,37 @@ class GlobalConfig(BaseSettings):
     MONGO_DSN: Optional[MongoDsn] = None
     MONGO_USERNAME: Optional[str] = None
     MONGO_PASSWORD: Optional[str] = None
+    MONGO_MAX_POOL_SIZE: int = Field(default=100, ge=1)
+    MONGO_MIN_POOL_SIZE: int = Field(default=0, ge=0)
+    MONGO_MAX_IDLE_TIME_MS: Optional[int] = Field(default=300000)
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(default=10000)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(default=10000)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = Field(default=5000)
+    # Search text shorter than this is matched by regex instead of the text index
+    SEARCH_TEXT_MIN_LENGTH: int = Field(default=4, ge=1)
+    # In-process BM25 index, used for search instead of the text index
+    # once built
+    SEARCH_INDEX_ENABLED: bool = Field(default=True)
+    # Seconds between syncs with MongoDB, 0 to disable
+    SEARCH_INDEX_SYNC_INTERVAL: float = Field(default=60)
+    # e.g. /data/search-index.json.gz
+    SEARCH_INDEX_SNAPSHOT_PATH: Optional[str] = None
+    SEARCH_INDEX_MAX_CANDIDATES: int = Field(default=1000, ge=1)
+    COUNT_CACHE_TTL: float = Field(default=10)  # seconds, 0 to disable
+    COUNT_CACHE_SIZE: int = Field(default=1024, ge=1)
+    # Seconds between full rebuilds, 0 to only build on startup
+    FACET_CACHE_REFRESH_INTERVAL: float = Field(default=300)
+    # Seconds between full rebuilds, 0 to only build on startup
+    SUGGEST_INDEX_REFRESH_INTERVAL: float = Field(default=300)
+    # Search responses are cached until the next model card write, 0 to
+    # disable
+    SEARCH_CACHE_MAX_BYTES: int = Field(default=32 * 1024 * 1024, ge=0)
+    # Seconds, bounds how long results of a search racing a write are served
+    SEARCH_CACHE_MAX_AGE: Optional[float] = Field(default=60, gt=0)
+    # Shared cache backend, e.g. redis://localhost:6379/0 (requires the
+    # redis extra).
+    # Caches are kept in process if unset.
+    CACHE_REDIS_URL: Optional[str] = None
 
     # Object Storage Settings
     MINIO_DSN: Optional[str] = None
@@ -54,6 +85,17 @@ class GlobalConfig(BaseSettings):
     MINIO_TLS: bool = Field(default=False)
     MINIO_API_ACCESS_KEY: Optional[str] = None
     MINIO_API_SECRET_KEY: Optional[str] = None
+    MINIO_MAX_CONNECTIONS: int = Field(default=100, ge=1)
+    # Seconds between connection checks, 0 to disable
+    MINIO_HEALTH_CHECK_INTERVAL: float = Field(default=60)
+    # Seconds, at most 7 days
+    PRESIGNED_URL_EXPIRY: int = Field(
+        default=7 * 24 * 3600, ge=1, le=7 * 24 * 3600
+    )
+    # Cached presigned URLs are replaced this long before they expire
+    PRESIGNED_URL_REFRESH_MARGIN: int = Field(default=3600, ge=0)  # seconds
+    PRESIGNED_URL_CACHE_SIZE: int = Field(default=4096, ge=1)
+    PRESIGNED_URL_CONCURRENCY: int = Field(default=16, ge=1)  # per card view
 
     # Kubernetes and Inference Service Settings
     IE_NAMESPACE: Optional[str] = None
@@ -62,8 +104,16 @@ class GlobalConfig(BaseSettings):
     IE_DOMAIN: Optional[str] = None
     IE_INGRESS_NAME: Optional[str] = None  # TODO: Integrate this
     IE_INGRESS_NAMESPACE: Optional[str] = None  # TODO: Integrate this
+    IE_INGRESS_HOST_TTL: float = Field(default=300)  # seconds
     K8S_HOST: Optional[str] = None
     K8S_API_KEY: Optional[str] = None
+    K8S_MAX_CONCURRENT_CALLS: int = Field(default=16, ge=1)
+    K8S_REQUEST_TIMEOUT: float = Field(default=30)  # seconds
+    K8S_INFORMER_ENABLED: bool = Field(default=True)
+    K8S_WATCH_TIMEOUT: int = Field(default=300, ge=1)  # seconds
+    # Per viewer, 0 to disable
+    LOG_STREAM_MAX_BYTES_PER_SECOND: int = Field(default=65536, ge=0)
+    LOG_STREAM_BUFFER_LINES: int = Field(default=1000, ge=1)
 
     # ClearML Settings
     CLEARML_CONFIG_FILE: Optional[str] = None
@@ -79,6 +129,9 @@ class GlobalConfig(BaseSettings):
     KEYCLOAK_CLIENT_SECRET_KEY: Optional[str] = None
     KEYCLOAK_AUTHORIZATION_URL: Optional[str] = None
     KEYCLOAK_TOKEN_URL: Optional[str] = None
+    KEYCLOAK_JWKS_TTL: float = Field(default=300)  # seconds
+    KEYCLOAK_JWKS_MIN_REFRESH_INTERVAL: float = Field(default=10)  # seconds
+    TOKEN_CACHE_SIZE: int = Field(default=4096, ge=1)
 
     @validator("FRONTEND_HOST", pre=True)
     def assemble_cors_origins(
@@ -0,0 +1,303 @@
+"""Caches used to avoid repeating expensive work."""
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict:
+        """Get the counters as a JSON serializable dictionary.
+
+        Returns:
+            Dict: Counters and hit ratio
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hitRatio": self.hit_ratio,
+        }
+
+
+class LRUCache:
+    """Bounded least recently used cache with optional per entry expiry.
+
+    Expiry times are wall clock timestamps (seconds since epoch) so that
+    they can be taken directly from e.g. a JWT `exp` claim.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        maxbytes: Optional[int] = None,
+    ):
+        """Initialize an LRUCache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+            ttl (Optional[float], optional): Default seconds before an entry expires.
+                Defaults to None (entries only leave the cache when evicted).
+            maxbytes (Optional[int], optional): Maximum total size of the entries,
+                as given to `set`. Defaults to None (only bounded by maxsize).
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.stats = CacheStats()
+        # key -> (value, expires at, size)
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def _pop(self, key: Hashable):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value, marking it as recently used.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value to return on a miss. Defaults to None.
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._pop(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        expires_at: Optional[float] = None,
+        size: int = 0,
+    ):
+        """Add or replace a value, evicting the least recently used entries if full.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to cache
+            expires_at (Optional[float], optional): Timestamp when the entry expires.
+                Defaults to now + ttl if the cache has a ttl.
+            size (int, optional): Size of the value in bytes, counted towards
+                maxbytes. Defaults to 0.
+        """
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._pop(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return  # would evict everything else
+            self._data[key] = (value, expires_at, size)
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                self._pop(next(iter(self._data)))
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable):
+        """Remove a value if present.
+
+        Args:
+            key (Hashable): Cache key
+        """
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        """Remove all values."""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (
+                entry[1] is None or entry[1] > time.time()
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def info(self) -> Dict:
+        """Get size and usage counters of the cache.
+
+        Returns:
+            Dict: Cache size, capacity and counters
+        """
+        info = {"size": len(self), "maxSize": self.maxsize}
+        if self.maxbytes is not None:
+            info.update(bytes=self.nbytes, maxBytes=self.maxbytes)
+        return {**info, **self.stats.as_dict()}
+
+
+class CacheBackend(ABC):
+    """Asynchronous key-value store for values shared between requests.
+
+    Values must be JSON serializable, so that a backend can keep them
+    outside of the process and share them between workers.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Get a value.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Any: Cached value, or None on a miss
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Add or replace a value.
+
+        Args:
+            key (str): Cache key
+            value (Any): JSON serializable value
+            ttl (Optional[float], optional): Seconds until the value expires.
+                Defaults to None (the backend default).
+        """
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Remove a value if present.
+
+        Args:
+            key (str): Cache key
+        """
+
+    def info(self) -> Dict:
+        """Get information about the backend.
+
+        Returns:
+            Dict: Backend type and usage counters where available
+        """
+        return {"backend": type(self).__name__}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Cache backend keeping values in an in-process LRU cache."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """Initialize a MemoryCacheBackend.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+            ttl (Optional[float], optional): Default seconds before an entry expires.
+                Defaults to None.
+        """
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.cache.set(
+            key, value, time.time() + ttl if ttl is not None else None
+        )
+
+    async def delete(self, key: str):
+        self.cache.delete(key)
+
+    def info(self) -> Dict:
+        return {**super().info(), **self.cache.info()}
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend keeping values in Redis (or any server speaking its
+    protocol), so that all workers share them.
+    """
+
+    def __init__(self, client: Any, prefix: str = "aas:"):
+        """Initialize a RedisCacheBackend.
+
+        Args:
+            client (Any): Client with the `redis.asyncio.Redis` interface
+            prefix (str, optional): Prefix of all keys. Defaults to "aas:".
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any:
+        value = await self.client.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        await self.client.set(
+            self.prefix + key,
+            json.dumps(value),
+            px=int(ttl * 1000) if ttl is not None else None,
+        )
+
+    async def delete(self, key: str):
+        await self.client.delete(self.prefix + key)
+
+
+def create_cache_backend(
+    url: Optional[str] = None, maxsize: int = 1024
+) -> CacheBackend:
+    """Create the cache backend configured for the app.
+
+    Args:
+        url (Optional[str], optional): Redis URL, e.g. redis://localhost:6379/0.
+            Defaults to None (in-process cache).
+        maxsize (int, optional): Maximum number of entries of an in-process cache.
+            Defaults to 1024.
+
+    Raises:
+        RuntimeError: If a Redis URL is given but the redis extra is not installed
+
+    Returns:
+        CacheBackend: Cache backend
+    """
+    if not url:
+        return MemoryCacheBackend(maxsize=maxsize)
+    try:
+        from redis import asyncio as redis_asyncio
+    except ImportError as err:
+        raise RuntimeError(
+            "The redis package is required to use a Redis cache backend, "
+            "install the redis extra"
+        ) from err
+    return RedisCacheBackend(redis_asyncio.from_url(url))
@@ -0,0 +1,79 @@
+"""Base class for in-process data derived from all model cards."""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from colorama import Fore
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .card_events import add_card_listener, remove_card_listener
+
+
+class CardCache(ABC):
+    """Data derived from all model cards, e.g. counts or an index.
+
+    It is rebuilt from MongoDB on startup and every `refresh_interval`
+    seconds, and kept up to date in between by model card events.
+    """
+
+    # Shown in warnings, e.g. "model card suggestions"
+    description = "model card cache"
+
+    def __init__(self, refresh_interval: float = 300):
+        """Initialize a CardCache.
+
+        Args:
+            refresh_interval (float, optional): Seconds between full rebuilds,
+                0 to only rebuild on startup. Defaults to 300.
+        """
+        self.refresh_interval = refresh_interval
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def rebuild(self, db: AsyncIOMotorDatabase):
+        """Rebuild from all model cards.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+        """
+
+    @abstractmethod
+    def on_card_event(self, event: str, card: Dict, previous: Optional[Dict]):
+        """Update after a model card is written. May be a coroutine.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+
+    async def _refresh_periodically(self, db: AsyncIOMotorDatabase):
+        while True:
+            try:
+                await self.rebuild(db)
+            except Exception as err:
+                print(
+                    f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to rebuild {self.description}: {err}"
+                )
+            if self.refresh_interval <= 0:
+                return
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self, db: AsyncIOMotorDatabase):
+        """Start keeping up to date. Called on app startup.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+        """
+        add_card_listener(self.on_card_event)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._refresh_periodically(db)
+            )
+
+    def stop(self):
+        """Stop keeping up to date. Called on app shutdown."""
+        remove_card_listener(self.on_card_event)
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
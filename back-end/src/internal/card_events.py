@@ -0,0 +1,69 @@
+"""Notify in-process listeners (indexes, caches) of model card writes."""
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+
+from colorama import Fore
+
+UPSERTED = "upserted"
+DELETED = "deleted"
+
+# Called with the event type, the model card document as stored in MongoDB
+# and the previous version of the card (None if it was just created).
+# Listeners may be coroutine functions.
+CardListener = Callable[[str, Dict, Optional[Dict]], Any]
+
+_listeners: List[CardListener] = []
+
+
+def add_card_listener(listener: CardListener):
+    """Register a function to be called after a model card is written.
+
+    Args:
+        listener (CardListener): Called with the event type, the card and
+            its previous version
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_card_listener(listener: CardListener):
+    """Stop calling a listener.
+
+    Args:
+        listener (CardListener): Previously registered listener
+    """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+async def _notify(event: str, card: Dict, previous: Optional[Dict]):
+    for listener in list(_listeners):
+        try:
+            result = listener(event, card, previous)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as err:
+            # A stale index must never fail the write itself
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Model card listener failed on {event}: {err}"
+            )
+
+
+async def card_upserted(card: Dict, previous: Optional[Dict] = None):
+    """Notify listeners that a model card was created or updated.
+
+    Args:
+        card (Dict): Full model card document, including `_id`
+        previous (Optional[Dict], optional): Card before the update. Defaults to None
+            (the card was created).
+    """
+    await _notify(UPSERTED, card, previous)
+
+
+async def card_deleted(card: Dict):
+    """Notify listeners that a model card was deleted.
+
+    Args:
+        card (Dict): Model card document as it was before deletion
+    """
+    await _notify(DELETED, card, card)
@@ -0,0 +1,494 @@
+"""In-memory view of the inference engine resources in the cluster.
+
+Instead of calling the K8S API on every request, informers list and then
+watch the resources labelled `aas-ie-service=true` in `IE_NAMESPACE`,
+keeping a local copy that the routers and background tasks can read.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from colorama import Fore
+from kubernetes.client.rest import ApiException
+from kubernetes.watch import Watch
+
+from ..config.config import config
+from ..models.engine import ServiceBackend
+from .dependencies.k8s_client import AsyncK8sClient
+
+IE_LABEL_SELECTOR = "aas-ie-service=true"
+
+# Resource kinds tracked by the cache
+DEPLOYMENTS = "deployments"
+SERVICES = "services"
+PODS = "pods"
+KNATIVE_SERVICES = "knativeServices"
+MAPPINGS = "mappings"
+INGRESS = "ingress"
+
+
+def get_ingress_location(backend: ServiceBackend) -> Tuple[str, str]:
+    """Get the name and namespace of the ingress service of a backend.
+
+    Args:
+        backend (ServiceBackend): Inference service backend
+
+    Raises:
+        ValueError: If no ingress is known or configured for the backend
+
+    Returns:
+        Tuple[str, str]: Name and namespace of the ingress service
+    """
+    if backend == ServiceBackend.KNATIVE:
+        return "kourier", "kourier-system"
+    elif backend == ServiceBackend.EMISSARY:
+        return "emissary-ingress", "emissary"
+    elif config.IE_INGRESS_NAME and config.IE_INGRESS_NAMESPACE:
+        return config.IE_INGRESS_NAME, config.IE_INGRESS_NAMESPACE
+    raise ValueError("No Ingress specified")
+
+
+def _object_meta(obj: Any) -> Tuple[str, Dict[str, str]]:
+    """Get the name and labels of a K8S object.
+
+    Args:
+        obj (Any): API model (e.g. V1Pod) or dict for custom objects
+
+    Returns:
+        Tuple[str, Dict[str, str]]: Name and labels of the object
+    """
+    if isinstance(obj, dict):
+        metadata = obj.get("metadata", {})
+        return metadata.get("name"), metadata.get("labels") or {}
+    return obj.metadata.name, obj.metadata.labels or {}
+
+
+def _list_resource_version(result: Any) -> Optional[str]:
+    """Get the resource version of a list response.
+
+    Args:
+        result (Any): Response of a `list_*` call
+
+    Returns:
+        Optional[str]: Resource version to start watching from
+    """
+    if isinstance(result, dict):
+        return result.get("metadata", {}).get("resourceVersion")
+    return result.metadata.resource_version
+
+
+class ResourceStore:
+    """Thread safe store of K8S objects of one kind, keyed by name.
+
+    Objects can additionally be indexed by the value of a label, e.g.
+    pods by their `app` label.
+    """
+
+    def __init__(self, index_label: Optional[str] = None):
+        """Initialize a ResourceStore.
+
+        Args:
+            index_label (Optional[str], optional): Label to index objects by. Defaults to None.
+        """
+        self.index_label = index_label
+        self.synced = False
+        self.last_synced: Optional[float] = None
+        self.events = 0
+        self._items: Dict[str, Any] = {}
+        self._index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, obj: Any):
+        name, labels = _object_meta(obj)
+        self._remove(name)
+        self._items[name] = obj
+        if self.index_label and self.index_label in labels:
+            self._index.setdefault(labels[self.index_label], set()).add(name)
+
+    def _remove(self, name: str):
+        obj = self._items.pop(name, None)
+        if obj is None or not self.index_label:
+            return
+        value = _object_meta(obj)[1].get(self.index_label)
+        names = self._index.get(value)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._index[value]
+
+    def replace(self, objects: Iterable[Any]):
+        """Replace the contents of the store, e.g. after a full list.
+
+        Args:
+            objects (Iterable[Any]): Current objects in the cluster
+        """
+        with self._lock:
+            self._items = {}
+            self._index = {}
+            for obj in objects:
+                self._add(obj)
+            self.synced = True
+            self.last_synced = time.time()
+
+    def apply(self, event_type: str, obj: Any):
+        """Apply a watch event to the store.
+
+        Args:
+            event_type (str): ADDED, MODIFIED or DELETED
+            obj (Any): Object in the event
+        """
+        with self._lock:
+            self.events += 1
+            if event_type == "DELETED":
+                self._remove(_object_meta(obj)[0])
+            elif event_type in ("ADDED", "MODIFIED"):
+                self._add(obj)
+
+    def get(self, name: str) -> Optional[Any]:
+        """Get an object by name.
+
+        Args:
+            name (str): Name of the object
+
+        Returns:
+            Optional[Any]: Object, or None if it does not exist
+        """
+        with self._lock:
+            return self._items.get(name)
+
+    def get_by_label(self, value: str) -> List[Any]:
+        """Get all objects whose index label has the given value.
+
+        Args:
+            value (str): Value of the index label
+
+        Returns:
+            List[Any]: Matching objects
+        """
+        with self._lock:
+            return [
+                self._items[name]
+                for name in sorted(self._index.get(value, ()))
+            ]
+
+    def names(self) -> List[str]:
+        """Get the names of all objects in the store.
+
+        Returns:
+            List[str]: Object names
+        """
+        with self._lock:
+            return list(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ResourceInformer:
+    """Keeps a ResourceStore in sync with the cluster using list + watch.
+
+    The blocking watch runs on its own daemon thread. If the watch fails
+    the store is marked as not synced (so readers fall back to the API)
+    and the resources are listed again after a backoff.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        list_func: Callable[..., Any],
+        store: ResourceStore,
+        watch_timeout: int = 300,
+        **list_kwargs,
+    ):
+        """Initialize a ResourceInformer.
+
+        Args:
+            kind (str): Name of the resource kind, used for logging
+            list_func (Callable[..., Any]): Bound `list_namespaced_*` API method
+            store (ResourceStore): Store to keep in sync
+            watch_timeout (int, optional): Seconds before a watch is restarted. Defaults to 300.
+            **list_kwargs: Arguments for `list_func`, e.g. namespace and label selector
+        """
+        self.kind = kind
+        self.list_func = list_func
+        self.store = store
+        self.watch_timeout = watch_timeout
+        self.list_kwargs = list_kwargs
+        self.restarts = 0
+        self._watch: Optional[Watch] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _list(self) -> Optional[str]:
+        """List all objects and replace the contents of the store.
+
+        Returns:
+            Optional[str]: Resource version to start watching from
+        """
+        result = self.list_func(
+            _request_timeout=self.watch_timeout, **self.list_kwargs
+        )
+        items = result["items"] if isinstance(result, dict) else result.items
+        self.store.replace(items)
+        return _list_resource_version(result)
+
+    def _run(self):
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                resource_version = self._list()
+                backoff = 1
+                while not self._stop_event.is_set():
+                    self._watch = Watch()
+                    for event in self._watch.stream(
+                        self.list_func,
+                        resource_version=resource_version,
+                        timeout_seconds=self.watch_timeout,
+                        _request_timeout=self.watch_timeout + 30,
+                        **self.list_kwargs,
+                    ):
+                        self.store.apply(event["type"], event["object"])
+                        if self._stop_event.is_set():
+                            break
+                    resource_version = (
+                        self._watch.resource_version or resource_version
+                    )
+            except ApiException as err:
+                if err.status == 410:
+                    # History expired, relist to catch up
+                    continue
+                self._handle_error(err)
+            except Exception as err:
+                self._handle_error(err)
+            else:
+                continue
+            self._stop_event.wait(backoff)
+            backoff = min(backoff * 2, 60)
+
+    def _handle_error(self, err: Exception):
+        self.store.synced = False
+        self.restarts += 1
+        print(
+            f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Watch on {self.kind} failed, retrying: {err}"
+        )
+
+    def start(self):
+        """Start syncing on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{self.kind}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop syncing. The thread exits after the current watch event."""
+        self._stop_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+        self.store.synced = False
+
+
+class ClusterStateCache:
+    """Indexed in-memory view of the inference engine resources.
+
+    Readers should check `is_synced` before trusting a lookup, and fall
+    back to calling the K8S API when the relevant kinds are not synced
+    (e.g. the informers are disabled, or a watch is being restarted).
+    """
+
+    def __init__(self):
+        """Initialize a ClusterStateCache."""
+        self.stores: Dict[str, ResourceStore] = {
+            DEPLOYMENTS: ResourceStore(),
+            SERVICES: ResourceStore(),
+            PODS: ResourceStore(index_label="app"),
+            KNATIVE_SERVICES: ResourceStore(),
+            MAPPINGS: ResourceStore(),
+            INGRESS: ResourceStore(),
+        }
+        self._informers: List[ResourceInformer] = []
+
+    def start(
+        self,
+        k8s: AsyncK8sClient,
+        namespace: str,
+        backends: Iterable[ServiceBackend],
+        watch_timeout: int = 300,
+        ingress: Optional[Tuple[str, str]] = None,
+    ):
+        """Start informers for the resources used by the given backends.
+
+        Args:
+            k8s (AsyncK8sClient): Shared K8S client
+            namespace (str): Namespace the inference engines are deployed in
+            backends (Iterable[ServiceBackend]): Backends to track resources for
+            watch_timeout (int, optional): Seconds before a watch is restarted. Defaults to 300.
+            ingress (Optional[Tuple[str, str]], optional): Name and namespace of the
+                ingress service to watch. Defaults to None.
+        """
+        if self._informers:
+            return
+        common = dict(
+            namespace=namespace,
+            label_selector=IE_LABEL_SELECTOR,
+            watch_timeout=watch_timeout,
+        )
+        backends = set(backends)
+        if ServiceBackend.EMISSARY in backends:
+            self._informers.extend(
+                [
+                    ResourceInformer(
+                        DEPLOYMENTS,
+                        k8s.apps.list_namespaced_deployment,
+                        self.stores[DEPLOYMENTS],
+                        **common,
+                    ),
+                    ResourceInformer(
+                        SERVICES,
+                        k8s.core.list_namespaced_service,
+                        self.stores[SERVICES],
+                        **common,
+                    ),
+                    ResourceInformer(
+                        PODS,
+                        k8s.core.list_namespaced_pod,
+                        self.stores[PODS],
+                        **common,
+                    ),
+                    ResourceInformer(
+                        MAPPINGS,
+                        k8s.custom.list_namespaced_custom_object,
+                        self.stores[MAPPINGS],
+                        group="getambassador.io",
+                        version="v2",
+                        plural="mappings",
+                        **common,
+                    ),
+                ]
+            )
+        if ServiceBackend.KNATIVE in backends:
+            self._informers.append(
+                ResourceInformer(
+                    KNATIVE_SERVICES,
+                    k8s.custom.list_namespaced_custom_object,
+                    self.stores[KNATIVE_SERVICES],
+                    group="serving.knative.dev",
+                    version="v1",
+                    plural="services",
+                    **common,
+                )
+            )
+        if ingress is not None:
+            ingress_name, ingress_namespace = ingress
+            self._informers.append(
+                ResourceInformer(
+                    INGRESS,
+                    k8s.core.list_namespaced_service,
+                    self.stores[INGRESS],
+                    namespace=ingress_namespace,
+                    field_selector=f"metadata.name={ingress_name}",
+                    watch_timeout=watch_timeout,
+                )
+            )
+        for informer in self._informers:
+            informer.start()
+
+    def stop(self):
+        """Stop all informers."""
+        for informer in self._informers:
+            informer.stop()
+        self._informers = []
+
+    def is_synced(self, *kinds: str) -> bool:
+        """Check whether the given kinds can be read from the cache.
+
+        Args:
+            *kinds (str): Resource kinds, e.g. `PODS`
+
+        Returns:
+            bool: True if all the kinds are synced
+        """
+        return all(self.stores[kind].synced for kind in kinds)
+
+    def get(self, kind: str, name: str) -> Optional[Any]:
+        """Get an object by kind and name.
+
+        Args:
+            kind (str): Resource kind
+            name (str): Name of the object
+
+        Returns:
+            Optional[Any]: Object, or None if it does not exist
+        """
+        return self.stores[kind].get(name)
+
+    def get_pods(self, app: str) -> List[Any]:
+        """Get the pods of an inference engine.
+
+        Args:
+            app (str): Name of the service, i.e. the `app` label of its pods
+
+        Returns:
+            List[Any]: Pods of the service
+        """
+        return self.stores[PODS].get_by_label(app)
+
+    def names(self, kind: str) -> List[str]:
+        """Get the names of all objects of a kind.
+
+        Args:
+            kind (str): Resource kind
+
+        Returns:
+            List[str]: Object names
+        """
+        return self.stores[kind].names()
+
+    def info(self) -> Dict:
+        """Get the sync status of each store.
+
+        Returns:
+            Dict: Size, sync status and event counts per kind
+        """
+        restarts = {
+            informer.kind: informer.restarts for informer in self._informers
+        }
+        return {
+            kind: {
+                "watched": kind in restarts,
+                "synced": store.synced,
+                "size": len(store),
+                "events": store.events,
+                "lastSynced": store.last_synced,
+                "restarts": restarts.get(kind, 0),
+            }
+            for kind, store in self.stores.items()
+        }
+
+
+cluster_state = ClusterStateCache()
+
+
+def start_cluster_state(k8s: AsyncK8sClient):
+    """Start watching the inference engine resources, if enabled.
+
+    Args:
+        k8s (AsyncK8sClient): Shared K8S client
+    """
+    if not config.K8S_INFORMER_ENABLED or not config.IE_NAMESPACE:
+        return
+    ingress = None
+    if not config.IE_DOMAIN:
+        try:
+            ingress = get_ingress_location(config.IE_SERVICE_TYPE)
+        except ValueError:
+            pass
+    cluster_state.start(
+        k8s,
+        config.IE_NAMESPACE,
+        backends=[config.IE_SERVICE_TYPE],
+        watch_timeout=config.K8S_WATCH_TIMEOUT,
+        ingress=ingress,
+    )
@@ -0,0 +1,109 @@
+"""Count the documents matching a listing without counting on every request."""
+from typing import Dict, Optional
+
+from bson import json_util
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from ..config.config import config
+from .cache import LRUCache
+from .card_events import add_card_listener
+
+
+def normalize_query(query: Dict) -> str:
+    """Get a canonical string for a query, so that equivalent queries
+    share a cache entry regardless of key order.
+
+    Args:
+        query (Dict): Query filter
+
+    Returns:
+        str: Cache key
+    """
+    return json_util.dumps(query, sort_keys=True)
+
+
+class CountCache:
+    """Counts matching documents, choosing the cheapest accurate method.
+
+    Unfiltered listings use the collection metadata
+    (`estimated_document_count`), which does not scan anything. Filtered
+    counts are cached for `ttl` seconds per collection and normalized
+    filter, and dropped when the collection is written to.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 10):
+        """Initialize a CountCache.
+
+        Args:
+            maxsize (int, optional): Max number of cached counts per collection. Defaults to 1024.
+            ttl (float, optional): Seconds to cache a count, 0 to disable. Defaults to 10.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._caches: Dict[str, LRUCache] = {}
+
+    def _cache(self, collection: str) -> LRUCache:
+        cache = self._caches.get(collection)
+        if cache is None:
+            cache = self._caches[collection] = LRUCache(
+                maxsize=self.maxsize, ttl=self.ttl
+            )
+        return cache
+
+    async def count(
+        self, collection: AsyncIOMotorCollection, query: Dict
+    ) -> int:
+        """Count the documents matching a query.
+
+        Args:
+            collection (AsyncIOMotorCollection): Collection
+            query (Dict): Query filter
+
+        Returns:
+            int: Number of matching documents
+        """
+        if not query:
+            return await collection.estimated_document_count()
+        if self.ttl <= 0:
+            return await collection.count_documents(query)
+        cache = self._cache(collection.name)
+        key = normalize_query(query)
+        total = cache.get(key)
+        if total is None:
+            total = await collection.count_documents(query)
+            cache.set(key, total)
+        return total
+
+    def invalidate(self, collection: str):
+        """Forget the cached counts of a collection after it was written to.
+
+        Args:
+            collection (str): Collection name
+        """
+        cache = self._caches.get(collection)
+        if cache is not None:
+            cache.clear()
+
+    def on_card_event(self, event: str, card: Dict, previous: Optional[Dict]):
+        """Forget model card counts when a card is written.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+        self.invalidate("models")
+
+    def info(self) -> Dict:
+        """Get usage counters of the cached counts.
+
+        Returns:
+            Dict: Cache size, capacity and counters per collection
+        """
+        return {name: cache.info() for name, cache in self._caches.items()}
+
+
+count_cache = CountCache(
+    maxsize=config.COUNT_CACHE_SIZE, ttl=config.COUNT_CACHE_TTL
+)
+add_card_listener(count_cache.on_card_event)
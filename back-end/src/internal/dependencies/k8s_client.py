@@ -1,15 +1,30 @@
 """Create a K8S client for use in the app."""
-from kubernetes.client import ApiClient, Configuration
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from kubernetes.client import (
+    ApiClient,
+    AppsV1Api,
+    Configuration,
+    CoreV1Api,
+    CustomObjectsApi,
+)
+from kubernetes.client.rest import ApiException
 from kubernetes.config import ConfigException, load_incluster_config, load_kube_config
+from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
 
 from ...config.config import config
 
 
-def get_k8s_client() -> ApiClient:
-    """Create a K8S client to interact with the cluster.
+def _load_k8s_config() -> Configuration:
+    """Load cluster credentials, trying in-cluster config, then kubeconfig,
+    then the API key from the app config.
 
     Returns:
-        ApiClient: K8S client
+        Configuration: K8S client configuration
     """
     k8s_config = Configuration()
     try:
@@ -21,4 +36,128 @@ def get_k8s_client() -> ApiClient:
         except ConfigException:
             k8s_config.api_key["authorization"] = config.K8S_API_KEY
             k8s_config.host = config.K8S_HOST
-    return ApiClient(k8s_config)
+    # Allow one pooled connection per worker thread
+    k8s_config.connection_pool_maxsize = config.K8S_MAX_CONCURRENT_CALLS
+    return k8s_config
+
+
+_api_client: Optional[ApiClient] = None
+
+
+def get_k8s_client() -> ApiClient:
+    """Get the K8S client to interact with the cluster.
+
+    The configuration is only loaded once, and the client (and its
+    connection pool) is shared by the whole process.
+
+    Returns:
+        ApiClient: K8S client
+    """
+    global _api_client
+    if _api_client is None:
+        _api_client = ApiClient(_load_k8s_config())
+    return _api_client
+
+
+class AsyncK8sClient:
+    """Non-blocking access to the K8S API.
+
+    The official client is synchronous, so calls are run on a bounded
+    thread pool to keep the event loop free, and every call has a timeout
+    so a slow API server cannot hold up a request forever.
+    """
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        max_workers: int = 16,
+        timeout: float = 30,
+    ):
+        """Initialize an AsyncK8sClient.
+
+        Args:
+            api_client (ApiClient): Shared K8S client
+            max_workers (int, optional): Max number of concurrent calls. Defaults to 16.
+            timeout (float, optional): Default timeout per call, in seconds. Defaults to 30.
+        """
+        self.api_client = api_client
+        self.core = CoreV1Api(api_client)
+        self.apps = AppsV1Api(api_client)
+        self.custom = CustomObjectsApi(api_client)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="k8s"
+        )
+
+    async def call(
+        self,
+        method: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Any:
+        """Call a method of the K8S API without blocking the event loop.
+
+        Args:
+            method (Callable[..., Any]): Bound API method, e.g. `k8s.core.read_namespaced_service`
+            timeout (Optional[float], optional): Timeout in seconds. Defaults to the client timeout.
+
+        Raises:
+            ApiException: With status 504 if the call timed out
+
+        Returns:
+            Any: Result of the API call
+        """
+        timeout = timeout or self.timeout
+        kwargs.setdefault("_request_timeout", timeout)
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._executor, partial(method, *args, **kwargs)
+                ),
+                timeout=timeout,
+            )
+        except (asyncio.TimeoutError, Urllib3TimeoutError, MaxRetryError) as err:
+            if isinstance(err, MaxRetryError) and not isinstance(
+                err.reason, Urllib3TimeoutError
+            ):
+                raise
+            raise ApiException(
+                status=504,
+                reason=f"K8S API call {method.__name__} timed out after {timeout}s",
+            ) from err
+
+    def close(self):
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+
+_async_client: Optional[AsyncK8sClient] = None
+
+
+def get_async_k8s_client() -> AsyncK8sClient:
+    """Get the shared non-blocking K8S client.
+
+    Returns:
+        AsyncK8sClient: K8S client
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncK8sClient(
+            get_k8s_client(),
+            max_workers=config.K8S_MAX_CONCURRENT_CALLS,
+            timeout=config.K8S_REQUEST_TIMEOUT,
+        )
+    return _async_client
+
+
+def close_k8s_client():
+    """Release the shared K8S clients. Called on app shutdown."""
+    global _api_client, _async_client
+    if _async_client is not None:
+        _async_client.close()
+        _async_client = None
+    if _api_client is not None:
+        _api_client.close()
+        _api_client = None
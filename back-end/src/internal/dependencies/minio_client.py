@@ -1,7 +1,10 @@
 """Contains functions to connect to MinIO instance and upload data to it"""
+import asyncio
+import time
+from datetime import timedelta
 from io import BytesIO
-from typing import Optional
-from aiohttp import client_reqrep
+from typing import Dict, Optional
+from aiohttp import ClientSession, TCPConnector, client_reqrep
 
 import miniopy_async
 from miniopy_async.commonconfig import CopySource, ComposeSource
@@ -10,41 +13,206 @@ from colorama import Fore
 
 from ...config.config import config
 from ...models.common import S3Storage
+from ..cache import LRUCache
 
 
-async def minio_api_client() -> Optional[miniopy_async.Minio]:
-    """Create a MinIO API Client.
+class PooledMinio(miniopy_async.Minio):
+    """MinIO client that sends all requests through one shared HTTP session.
+
+    The upstream client opens a new aiohttp session for every request,
+    which means a new TCP (and TLS) handshake each time. Here the session
+    is kept per event loop and reused until the client is closed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> ClientSession:
+        """Get the HTTP session bound to the running event loop.
+
+        Returns:
+            ClientSession: Shared HTTP session
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = ClientSession(
+                connector=TCPConnector(limit=config.MINIO_MAX_CONNECTIONS)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _url_open(self, *args, session=None, **kwargs):
+        if session is None:
+            session = self._get_session()
+        return await super()._url_open(*args, session=session, **kwargs)
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+
+_minio_client: Optional[PooledMinio] = None
+_bucket_ready = False
+_last_health_check: Optional[float] = None
+_health_task: Optional[asyncio.Task] = None
+# (bucket, object) -> presigned URL, until shortly before the URL expires
+presigned_url_cache = LRUCache(maxsize=config.PRESIGNED_URL_CACHE_SIZE)
+
+
+async def _bootstrap_bucket(client: PooledMinio) -> bool:
+    """Make sure the app's bucket exists, creating it if needed.
+
+    Args:
+        client (PooledMinio): MinIO client
 
     Returns:
-        Optional[miniopy_async.Minio]: MinIO API Client. If connection fails, returns None.
+        bool: True if the bucket is available
     """
+    global _bucket_ready, _last_health_check
+    bucket_name = config.MINIO_BUCKET_NAME
     try:
-        print(
-            f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Attempting to connect to MinIO instance @ {config.MINIO_DSN}..."
-        )
-        minio_client = miniopy_async.Minio(
-            config.MINIO_DSN,  # use internal DNS name
-            config.MINIO_API_ACCESS_KEY,
-            config.MINIO_API_SECRET_KEY,
-            secure=config.MINIO_TLS,
-        )  # connect to minio using provided variables
-        print(f"{Fore.GREEN}INFO{Fore.WHITE}:\t  MinIO client connected!")
-        bucket_name = config.MINIO_BUCKET_NAME
-        found_bucket = await minio_client.bucket_exists(bucket_name)
+        found_bucket = await client.bucket_exists(bucket_name)
         # create the bucket from env variables if not already created
         if not found_bucket:
-            await minio_client.make_bucket(bucket_name)
+            await client.make_bucket(bucket_name)
             print(f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Bucket '{bucket_name}' created")
+        _bucket_ready = True
+    except Exception as err:
+        print(
+            f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to connect to MinIO instance: {err}"
+        )
+        _bucket_ready = False
+    _last_health_check = time.time()
+    return _bucket_ready
+
+
+async def connect_to_minio() -> Optional[PooledMinio]:
+    """Create the process wide MinIO client and bootstrap the bucket.
+    Called on app startup.
+
+    Returns:
+        Optional[PooledMinio]: MinIO API Client. If connection fails, returns None.
+    """
+    global _minio_client
+    if _minio_client is None:
+        print(
+            f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Attempting to connect to MinIO instance @ {config.MINIO_DSN}..."
+        )
+        try:
+            _minio_client = PooledMinio(
+                config.MINIO_DSN,  # use internal DNS name
+                config.MINIO_API_ACCESS_KEY,
+                config.MINIO_API_SECRET_KEY,
+                secure=config.MINIO_TLS,
+            )  # connect to minio using provided variables
+        except Exception as err:
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to create MinIO client: {err}"
+            )
+            return None
+    if not _bucket_ready and not await _bootstrap_bucket(_minio_client):
+        return None
+    return _minio_client
+
+
+async def _monitor_minio_health(interval: float):
+    """Periodically check that MinIO is reachable and the bucket exists.
+
+    Args:
+        interval (float): Seconds between checks
+    """
+    while True:
+        await asyncio.sleep(interval)
+        if _minio_client is None:
+            await connect_to_minio()
         else:
-            print(f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Bucket '{bucket_name}' already exists")
-        return minio_client
-    except :
-        print(f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to connect to MinIO instance")
+            await _bootstrap_bucket(_minio_client)
+
+
+async def start_minio_health_check():
+    """Connect to MinIO and start the periodic health check. Called on app startup."""
+    global _health_task
+    await connect_to_minio()
+    if _health_task is None and config.MINIO_HEALTH_CHECK_INTERVAL > 0:
+        _health_task = asyncio.create_task(
+            _monitor_minio_health(config.MINIO_HEALTH_CHECK_INTERVAL)
+        )
+
+
+async def close_minio_connection():
+    """Stop the health check and close the shared client. Called on app shutdown."""
+    global _minio_client, _health_task, _bucket_ready
+    if _health_task is not None:
+        _health_task.cancel()
+        _health_task = None
+    if _minio_client is not None:
+        await _minio_client.close()
+        _minio_client = None
+    _bucket_ready = False
+
+
+def get_minio_status() -> Dict:
+    """Get health information about the shared MinIO client
+
+    Returns:
+        Dict: Connection and bucket status, and presigned URL cache counters
+    """
+    return {
+        "connected": _minio_client is not None,
+        "healthy": _bucket_ready,
+        "bucket": config.MINIO_BUCKET_NAME,
+        "lastHealthCheck": _last_health_check,
+        "presignedUrlCache": presigned_url_cache.info(),
+    }
+
+
+async def minio_api_client() -> Optional[miniopy_async.Minio]:
+    """Get the shared MinIO API Client.
+
+    The bucket is only checked when the client is first created, or
+    again after a failed health check, so this is cheap to call.
+
+    Returns:
+        Optional[miniopy_async.Minio]: MinIO API Client. If connection fails, returns None.
+    """
+    if _minio_client is not None and _bucket_ready:
+        return _minio_client
+    return await connect_to_minio()
+
+
+def presign_epoch() -> int:
+    """Get the current presign epoch, for entity tags of responses that
+    contain presigned URLs.
+
+    Epochs last half as long as a returned URL is guaranteed to stay
+    valid, so a client revalidating its copy within the same epoch still
+    holds working URLs.
+
+    Returns:
+        int: Epoch number
+    """
+    if config.PRESIGNED_URL_EXPIRY > config.PRESIGNED_URL_REFRESH_MARGIN:
+        valid_for = config.PRESIGNED_URL_REFRESH_MARGIN  # URLs are cached
+    else:
+        valid_for = config.PRESIGNED_URL_EXPIRY
+    return int(time.time() // max(valid_for // 2, 1))
 
 
 async def get_presigned_url(client: miniopy_async.Minio, object_name: str, bucket_name: str) -> str:
     """Get presigned URL to object in S3 bucket
 
+    URLs are cached and reused until PRESIGNED_URL_REFRESH_MARGIN seconds
+    before they expire, so a returned URL is valid for at least that long.
+
     Args:
         client (miniopy_async.Minio): S3 Client
         object_name (str): Name of object to get signedurl for
@@ -53,13 +221,22 @@ async def get_presigned_url(client: miniopy_async.Minio, object_name: str, bucke
     Returns:
         str: presigned url
     """
+    key = (bucket_name, object_name)
+    url = presigned_url_cache.get(key)
+    if url is not None:
+        return url
+    signed_at = time.time()
     url = await client.presigned_get_object(
         bucket_name=bucket_name,
         object_name=object_name,
+        expires=timedelta(seconds=config.PRESIGNED_URL_EXPIRY),
     )
     url = url.removeprefix("https://")  # type: ignore #ignore
     url = url.removeprefix("http://")  # type: ignore #ignore
     url = url.replace(config.MINIO_DSN or "", config.MINIO_API_HOST or "")  # type: ignore #ignore
+    reuse_for = config.PRESIGNED_URL_EXPIRY - config.PRESIGNED_URL_REFRESH_MARGIN
+    if reuse_for > 0:
+        presigned_url_cache.set(key, url, expires_at=signed_at + reuse_for)
     return url  # type: ignore #ignore
 
 
@@ -80,6 +257,7 @@ async def remove_data(
         bucket_name=bucket_name,
         object_name=object_name,
     )
+    presigned_url_cache.delete((bucket_name, object_name))
 
 
 async def remove_data_from_prefix(
@@ -88,6 +266,8 @@ async def remove_data_from_prefix(
     bucket_name: str,
 ):
     objects_list = await client.list_objects(bucket_name=bucket_name, prefix=prefix, recursive=True)
+    for obj in objects_list:  # type: ignore #ignore
+        presigned_url_cache.delete((bucket_name, obj.object_name))
     delete_object_list = map(lambda x: DeleteObject(x.object_name), objects_list)  # type: ignore #ignore
     errors = await client.remove_objects(bucket_name, delete_object_list)
     return errors
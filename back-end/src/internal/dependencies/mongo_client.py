@@ -1,23 +1,163 @@
 """Database Connection to MongoDB"""
-from typing import Tuple
+from threading import Lock
+from typing import Dict, Optional, Tuple
 
+from colorama import Fore
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
 
 from ...config.config import config
 
 
-# TODO: Use Beanie ORM (https://beanie-odm.dev/) to reduce boilerplate code
-def get_db() -> Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]:
-    """Get MongoDB connection
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Collects connection pool usage counters for the shared client.
+
+    PyMongo publishes pool events from its own threads, so all counters
+    are guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.checkout_failures = 0
+        self.pools_cleared = 0
+
+    def _incr(self, attr: str):
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._incr("pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._incr("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._incr("connections_closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._incr("checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._incr("checkouts")
+
+    def connection_checked_in(self, event):
+        self._incr("checkins")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Get a point in time copy of the pool counters.
+
+        Returns:
+            Dict[str, int]: Pool counters, including derived open and in use connections
+        """
+        with self._lock:
+            return {
+                "connectionsCreated": self.connections_created,
+                "connectionsClosed": self.connections_closed,
+                "connectionsOpen": self.connections_created
+                - self.connections_closed,
+                "connectionsInUse": self.checkouts - self.checkins,
+                "checkouts": self.checkouts,
+                "checkoutFailures": self.checkout_failures,
+                "poolsCleared": self.pools_cleared,
+            }
+
+
+pool_metrics = PoolMetricsListener()
+
+_mongo_client: Optional[AsyncIOMotorClient] = None
+
+
+def _create_client() -> AsyncIOMotorClient:
+    """Create a MongoDB client using the pool settings from config.
 
     Returns:
-        Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]: Connection to MongoDB and Client
+        AsyncIOMotorClient: MongoDB client
     """
-    mongo_client = AsyncIOMotorClient(
+    return AsyncIOMotorClient(
         config.MONGO_DSN,
         username=config.MONGO_USERNAME,
         password=config.MONGO_PASSWORD,
         authSource=config.DB_NAME,
+        maxPoolSize=config.MONGO_MAX_POOL_SIZE,
+        minPoolSize=config.MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=config.MONGO_MAX_IDLE_TIME_MS,
+        connectTimeoutMS=config.MONGO_CONNECT_TIMEOUT_MS,
+        serverSelectionTimeoutMS=config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        waitQueueTimeoutMS=config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        event_listeners=[pool_metrics],
     )
+
+
+def connect_to_mongo() -> AsyncIOMotorClient:
+    """Create the process wide MongoDB client. Called on app startup.
+
+    Returns:
+        AsyncIOMotorClient: Shared MongoDB client
+    """
+    global _mongo_client
+    if _mongo_client is None:
+        print(
+            f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Creating MongoDB connection pool (max size {config.MONGO_MAX_POOL_SIZE})"
+        )
+        _mongo_client = _create_client()
+    return _mongo_client
+
+
+def close_mongo_connection():
+    """Close the process wide MongoDB client. Called on app shutdown."""
+    global _mongo_client
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+        print(
+            f"{Fore.GREEN}INFO{Fore.WHITE}:\t  MongoDB connection pool closed"
+        )
+
+
+def get_pool_stats() -> Dict:
+    """Get usage statistics of the shared MongoDB connection pool
+
+    Returns:
+        Dict: Pool configuration and usage counters
+    """
+    return {
+        "connected": _mongo_client is not None,
+        "maxPoolSize": config.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": config.MONGO_MIN_POOL_SIZE,
+        **pool_metrics.snapshot(),
+    }
+
+
+# TODO: Use Beanie ORM (https://beanie-odm.dev/) to reduce boilerplate code
+def get_db() -> Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]:
+    """Get MongoDB connection
+
+    The client is shared by the whole process, so this is cheap to call
+    from both request handlers and background tasks. If the app has not
+    been started (e.g. in scripts), the client is created on first use.
+
+    Returns:
+        Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]: Connection to MongoDB and Client
+    """
+    mongo_client = connect_to_mongo()
     db = mongo_client[config.DB_NAME]
     return db, mongo_client
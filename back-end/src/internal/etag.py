@@ -0,0 +1,69 @@
+"""Entity tags (ETags) for conditional GET requests."""
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+# Let clients store responses, but revalidate them on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong entity tag from the values that determine a response.
+
+    Args:
+        *parts (Any): Values that change whenever the response changes
+
+    Returns:
+        str: Quoted entity tag
+    """
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether the client already has the current response.
+
+    Args:
+        if_none_match (Optional[str]): Value of the If-None-Match header
+        etag (str): Entity tag of the current response
+
+    Returns:
+        bool: True if any of the client's entity tags matches. As required
+            for If-None-Match, weak tags (W/"...") are compared too.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str):
+    """Add an entity tag to a response.
+
+    Args:
+        response (Response): Response
+        etag (str): Entity tag
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 response, telling the client to reuse its copy.
+
+    Args:
+        etag (str): Entity tag of the current response
+
+    Returns:
+        Response: Response without a body
+    """
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
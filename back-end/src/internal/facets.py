@@ -0,0 +1,178 @@
+"""Cached filter options (facets) of the model zoo, with counts."""
+from typing import Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..config.config import config
+from .cache import CacheBackend, create_cache_backend
+from .card_cache import CardCache
+from .card_events import DELETED
+
+# Facet name -> model card field
+FACET_FIELDS = {"tags": "tags", "frameworks": "frameworks", "tasks": "task"}
+FACETS_CACHE_KEY = "models:facets"
+
+Facets = Dict[str, Dict[str, int]]
+
+
+def facet_pipeline(field: str) -> List[Dict]:
+    """Get the aggregation stages counting the cards with each value of a field.
+
+    Args:
+        field (str): Model card field, either a string or a list of strings
+
+    Returns:
+        List[Dict]: Aggregation stages producing `{_id: value, count: n}`
+    """
+    return [
+        {"$unwind": f"${field}"},  # also passes through single values
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+    ]
+
+
+def bucket_counts(buckets: List[Dict]) -> Dict[str, int]:
+    """Convert the output of `facet_pipeline` to a mapping.
+
+    Args:
+        buckets (List[Dict]): `{_id: value, count: n}` documents
+
+    Returns:
+        Dict[str, int]: Count of each value
+    """
+    return {
+        bucket["_id"]: bucket["count"]
+        for bucket in buckets
+        if bucket["_id"] is not None
+    }
+
+
+def card_facet_values(card: Optional[Dict]) -> Dict[str, set]:
+    """Get the facet values of a model card.
+
+    Args:
+        card (Optional[Dict]): Model card, or None
+
+    Returns:
+        Dict[str, set]: Values of each facet
+    """
+    values = {}
+    for facet, field in FACET_FIELDS.items():
+        value = (card or {}).get(field)
+        if value is None:
+            values[facet] = set()
+        elif isinstance(value, list):
+            values[facet] = {item for item in value if item is not None}
+        else:
+            values[facet] = {value}
+    return values
+
+
+def facet_options(facets: Facets) -> Dict[str, List[str]]:
+    """Get the available values of each facet, in alphabetical order.
+
+    Args:
+        facets (Facets): Count of each value of each facet
+
+    Returns:
+        Dict[str, List[str]]: Values of each facet
+    """
+    return {facet: sorted(counts) for facet, counts in facets.items()}
+
+
+class FacetCache(CardCache):
+    """Caches how many model cards have each tag, framework and task.
+
+    The counts are rebuilt with one aggregation on startup and every
+    `refresh_interval` seconds. Writes changing a card's facet values
+    drop the cached counts, and the next read rebuilds them. The backend
+    is pluggable so that the counts can be shared between workers, e.g.
+    through Redis.
+    """
+
+    description = "model card filter options"
+
+    def __init__(self, backend: CacheBackend, refresh_interval: float = 300):
+        """Initialize a FacetCache.
+
+        Args:
+            backend (CacheBackend): Where to keep the counts
+            refresh_interval (float, optional): Seconds between full rebuilds,
+                0 to only rebuild on startup. Defaults to 300.
+        """
+        super().__init__(refresh_interval)
+        self.backend = backend
+
+    async def rebuild(self, db: AsyncIOMotorDatabase) -> Facets:
+        """Count all facet values and replace the cached counts.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+
+        Returns:
+            Facets: Count of each value of each facet
+        """
+        result = (
+            await db["models"]
+            .aggregate(
+                [
+                    {
+                        "$facet": {
+                            facet: facet_pipeline(field)
+                            for facet, field in FACET_FIELDS.items()
+                        }
+                    }
+                ]
+            )
+            .to_list(length=1)
+        )
+        facets: Facets = {
+            facet: bucket_counts(result[0][facet]) for facet in FACET_FIELDS
+        }
+        await self.backend.set(FACETS_CACHE_KEY, facets)
+        return facets
+
+    async def get(self, db: AsyncIOMotorDatabase) -> Facets:
+        """Get the cached counts, rebuilding them on a miss.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+
+        Returns:
+            Facets: Count of each value of each facet
+        """
+        facets = await self.backend.get(FACETS_CACHE_KEY)
+        if facets is None:
+            facets = await self.rebuild(db)
+        return facets
+
+    async def on_card_event(
+        self, event: str, card: Dict, previous: Optional[Dict]
+    ):
+        """Drop the counts after a model card's facet values change.
+
+        Adjusting the cached counts would be a read-modify-write, losing
+        updates of other workers sharing the backend.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+        old = card_facet_values(previous)
+        new = card_facet_values(None if event == DELETED else card)
+        if old != new:
+            await self.backend.delete(FACETS_CACHE_KEY)
+
+    def info(self) -> Dict:
+        """Get information about the cache backend.
+
+        Returns:
+            Dict: Backend type and usage counters
+        """
+        return self.backend.info()
+
+
+facet_cache = FacetCache(
+    create_cache_backend(config.CACHE_REDIS_URL, maxsize=16),
+    refresh_interval=config.FACET_CACHE_REFRESH_INTERVAL,
+)
@@ -0,0 +1,247 @@
+"""Declarative MongoDB indexes of the app, and a checker for the queries
+that should use them.
+
+Indexes are applied idempotently on startup: existing indexes are left
+alone, and an index whose options changed (e.g. new text weights) is
+dropped and recreated.
+"""
+from typing import Any, Dict, List
+
+from colorama import Fore
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from .pagination import SORT_INDEXES
+from .search import PUBLIC_VISIBILITY, TEXT_INDEX_WEIGHTS
+
+TEXT_INDEX_NAME = "modelCardText"
+
+# Error codes of creating an index that conflicts with an existing one
+INDEX_CONFLICT_CODES = (85, 86)  # IndexOptionsConflict, IndexKeySpecsConflict
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "models": [
+        IndexModel(
+            [("creatorUserId", ASCENDING), ("modelId", ASCENDING)], unique=True
+        ),
+        IndexModel([("tags", ASCENDING)]),
+        IndexModel([("task", ASCENDING)]),
+        IndexModel([("frameworks", ASCENDING)]),
+        IndexModel([("inferenceServiceName", ASCENDING)]),
+        IndexModel([("visibleTo", ASCENDING)]),
+        IndexModel(
+            [(field, TEXT) for field in TEXT_INDEX_WEIGHTS],
+            name=TEXT_INDEX_NAME,
+            weights=TEXT_INDEX_WEIGHTS,
+        ),
+    ],
+    "services": [
+        IndexModel([("serviceName", ASCENDING)], unique=True),
+        IndexModel([("creatorUserId", ASCENDING), ("modelId", ASCENDING)]),
+    ],
+    "exports": [
+        IndexModel([("userId", ASCENDING), ("timeInitiated", DESCENDING)]),
+    ],
+}
+# Sorted listings (see pagination.py), with _id as a tie breaker.
+# Each also serves descending sorts, by scanning backwards.
+for _collection, _fields in SORT_INDEXES.items():
+    INDEXES.setdefault(_collection, []).extend(
+        IndexModel([(field, ASCENDING), ("_id", ASCENDING)])
+        for field in _fields
+    )
+
+# Queries the app runs on hot paths, checked by `explain_queries`
+CANONICAL_QUERIES: List[Dict[str, Any]] = [
+    {
+        "name": "Get model card",
+        "collection": "models",
+        "filter": {"creatorUserId": "user", "modelId": "model"},
+    },
+    {
+        "name": "Search model cards by text",
+        "collection": "models",
+        "filter": {"$text": {"$search": "detection"}},
+    },
+    {
+        "name": "Filter model cards by tag, task and framework",
+        "collection": "models",
+        "filter": {
+            "tags": {"$all": ["tag"]},
+            "task": {"$in": ["task"]},
+            "frameworks": {"$in": ["framework"]},
+        },
+    },
+    {
+        "name": "Model cards visible to a user",
+        "collection": "models",
+        "filter": {"visibleTo": {"$in": [PUBLIC_VISIBILITY, "user"]}},
+    },
+    {
+        "name": "Model cards by last modified",
+        "collection": "models",
+        "filter": {},
+        "sort": [("lastModified", DESCENDING), ("_id", DESCENDING)],
+        "limit": 10,
+    },
+    {
+        "name": "Model cards using an inference service",
+        "collection": "models",
+        "filter": {"inferenceServiceName": "service"},
+    },
+    {
+        "name": "Get inference service",
+        "collection": "services",
+        "filter": {"serviceName": "service"},
+    },
+    {
+        "name": "Inference services of a model card",
+        "collection": "services",
+        "filter": {"creatorUserId": "user", "modelId": "model"},
+    },
+    {
+        "name": "Exports by user",
+        "collection": "exports",
+        "filter": {"userId": "user"},
+        "sort": [("timeInitiated", DESCENDING), ("_id", DESCENDING)],
+        "limit": 5,
+    },
+]
+
+
+async def _replace_conflicting_index(
+    db: AsyncIOMotorDatabase, collection: str, index: IndexModel
+):
+    """Drop the existing index that conflicts with a declared index, and
+    create the declared one instead."""
+    spec = index.document
+    keys = list(spec["key"].items())
+    is_text = any(direction == TEXT for _, direction in keys)
+    existing = await db[collection].index_information()
+    for name, info in existing.items():
+        existing_is_text = any(
+            direction == TEXT for _, direction in info["key"]
+        )
+        # Only one text index is allowed per collection
+        if (
+            name == spec["name"]
+            or info["key"] == keys
+            or (is_text and existing_is_text)
+        ):
+            print(
+                f"{Fore.GREEN}INFO{Fore.WHITE}:\t  Replacing index {collection}.{name} with {spec['name']}"
+            )
+            await db[collection].drop_index(name)
+    await db[collection].create_indexes([index])
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase):
+    """Create the declared indexes that do not exist yet. Called on app startup.
+
+    Failures are reported and skipped, so that e.g. duplicate documents
+    preventing a unique index do not stop the other indexes being created.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+    """
+    for collection, indexes in INDEXES.items():
+        for index in indexes:
+            name = index.document["name"]
+            try:
+                try:
+                    await db[collection].create_indexes([index])
+                except OperationFailure as err:
+                    if err.code not in INDEX_CONFLICT_CODES:
+                        raise
+                    await _replace_conflicting_index(db, collection, index)
+            except DuplicateKeyError as err:
+                print(
+                    f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Unable to create unique index {collection}.{name} as there are duplicate documents: {err}"
+                )
+            except Exception as err:
+                print(
+                    f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to create index {collection}.{name}: {err}"
+                )
+
+
+def _plan_stages(plan: Any, stages: List[str], indexes: List[str]):
+    """Collect the stage and index names of a query plan, depth first."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        if "indexName" in plan:
+            indexes.append(plan["indexName"])
+        for key, value in plan.items():
+            if key != "slotBasedPlan":
+                _plan_stages(value, stages, indexes)
+    elif isinstance(plan, list):
+        for item in plan:
+            _plan_stages(item, stages, indexes)
+
+
+def summarize_explain(explain: Dict) -> Dict:
+    """Summarize the output of `explain` for a find query.
+
+    Args:
+        explain (Dict): Output of explain
+
+    Returns:
+        Dict: Stages and indexes of the winning plan, whether it scans the
+            whole collection, and how many keys and documents were examined
+    """
+    stages: List[str] = []
+    indexes: List[str] = []
+    _plan_stages(
+        explain.get("queryPlanner", {}).get("winningPlan"), stages, indexes
+    )
+    stats = explain.get("executionStats", {})
+    return {
+        "stages": stages,
+        "indexes": sorted(set(indexes)),
+        "collectionScan": "COLLSCAN" in stages,
+        "keysExamined": stats.get("totalKeysExamined"),
+        "docsExamined": stats.get("totalDocsExamined"),
+    }
+
+
+async def explain_queries(db: AsyncIOMotorDatabase) -> Dict:
+    """Explain the canonical queries of the app, to find the ones that
+    are missing an index.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+
+    Returns:
+        Dict: Plan summary per query, names of the queries scanning a
+            whole collection, and the existing indexes per collection
+    """
+    queries = []
+    for query in CANONICAL_QUERIES:
+        cursor = db[query["collection"]].find(query["filter"])
+        if "sort" in query:
+            cursor = cursor.sort(query["sort"])
+        if "limit" in query:
+            cursor = cursor.limit(query["limit"])
+        result = {
+            "name": query["name"],
+            "collection": query["collection"],
+        }
+        try:
+            result.update(summarize_explain(await cursor.explain()))
+        except OperationFailure as err:
+            # e.g. the text index does not exist yet
+            result["error"] = str(err)
+        queries.append(result)
+    return {
+        "queries": queries,
+        "collectionScans": [
+            query["name"] for query in queries if query.get("collectionScan")
+        ],
+        "indexes": {
+            collection: sorted(
+                (await db[collection].index_information()).keys()
+            )
+            for collection in INDEXES
+        },
+    }
@@ -0,0 +1,151 @@
+"""Resolve the external host of the ingress, and build inference URLs."""
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+from ..config.config import config
+from ..models.engine import ServiceBackend
+from .cache import LRUCache
+from .cluster_state import INGRESS, cluster_state, get_ingress_location
+from .dependencies.k8s_client import AsyncK8sClient
+
+
+def get_load_balancer_host(ingress: Any) -> str:
+    """Get the external host of a LoadBalancer service.
+
+    Args:
+        ingress (Any): Ingress service (V1Service)
+
+    Raises:
+        ValueError: If the service has no external address yet
+
+    Returns:
+        str: IP address or hostname
+    """
+    if ingress.spec.load_balancer_ip:
+        return ingress.spec.load_balancer_ip
+    load_balancers = ingress.status.load_balancer.ingress or []
+    for load_balancer in load_balancers:
+        if load_balancer.ip or load_balancer.hostname:
+            return load_balancer.ip or load_balancer.hostname
+    raise ValueError(
+        f"Ingress {ingress.metadata.name} has no external address"
+    )
+
+
+def build_inference_url(
+    protocol: str,
+    host: str,
+    backend: ServiceBackend,
+    service_name: str,
+    path: Optional[str] = None,
+) -> str:
+    """Build the URL an inference service is exposed at.
+
+    Args:
+        protocol (str): URL scheme, e.g. http
+        host (str): Ingress host
+        backend (ServiceBackend): Inference service backend
+        service_name (str): Name of the service
+        path (Optional[str], optional): Path of the service for Emissary.
+            Defaults to the service name.
+
+    Raises:
+        ValueError: If the backend is not supported
+
+    Returns:
+        str: Inference URL
+    """
+    if backend == ServiceBackend.EMISSARY:
+        # need to add trailing slash for ambassador
+        # else css and js files are not loaded properly
+        return f"{protocol}://{host}/{path or service_name}/"
+    elif backend == ServiceBackend.KNATIVE:
+        url = f"{protocol}://{service_name}.{config.IE_NAMESPACE}.{host}"
+        if not config.IE_DOMAIN:
+            # use sslip dns service to get a hostname for the service
+            url += ".sslip.io"
+        return url
+    raise ValueError("Invalid Service Backend")
+
+
+class IngressHostResolver:
+    """Caches the external host of the ingress of each backend.
+
+    When the ingress of the configured backend is watched by the cluster
+    state cache, changes are picked up as soon as they happen. Otherwise
+    the host is looked up through the K8S API and kept for `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 300):
+        """Initialize an IngressHostResolver.
+
+        Args:
+            ttl (float, optional): Seconds to cache a looked up host. Defaults to 300.
+        """
+        self.cache = LRUCache(maxsize=16, ttl=ttl)
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def _lookup(
+        self, k8s: AsyncK8sClient, name: str, namespace: str
+    ) -> str:
+        ingress = await k8s.call(
+            k8s.core.read_namespaced_service, name=name, namespace=namespace
+        )
+        host = get_load_balancer_host(ingress)
+        self.cache.set((name, namespace), host)
+        return host
+
+    async def get_host(
+        self, k8s: AsyncK8sClient, backend: ServiceBackend
+    ) -> str:
+        """Get the host inference services of a backend are exposed at.
+
+        Args:
+            k8s (AsyncK8sClient): K8S client
+            backend (ServiceBackend): Inference service backend
+
+        Raises:
+            ValueError: If the ingress is unknown or has no external address
+            ApiException: If the ingress could not be read
+
+        Returns:
+            str: IE_DOMAIN if configured, otherwise the ingress IP or hostname
+        """
+        if config.IE_DOMAIN:
+            return config.IE_DOMAIN
+        name, namespace = get_ingress_location(backend)
+        if cluster_state.is_synced(INGRESS):
+            ingress = cluster_state.get(INGRESS, name)
+            if ingress is not None and ingress.metadata.namespace == namespace:
+                return get_load_balancer_host(ingress)
+        key = (name, namespace)
+        host = self.cache.get(key)
+        if host is not None:
+            return host
+        # Concurrent misses share one lookup
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(
+                self._lookup(k8s, name, namespace)
+            )
+            self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._inflight.pop(key, None)
+
+    def invalidate(self):
+        """Forget all cached hosts."""
+        self.cache.clear()
+
+    def info(self) -> Dict:
+        """Get usage counters of the host cache.
+
+        Returns:
+            Dict: Cache size, capacity and counters
+        """
+        return self.cache.info()
+
+
+ingress_resolver = IngressHostResolver(ttl=config.IE_INGRESS_HOST_TTL)
@@ -0,0 +1,165 @@
+"""Cache of the identity provider's token signing keys (JWKS)."""
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+from colorama import Fore
+
+
+class JWKSCache:
+    """Caches the JSON Web Key Set of the identity provider, keyed by `kid`.
+
+    Keys are refreshed in the background once they are older than `ttl`,
+    and a refresh is forced when a token is signed with a `kid` that is not
+    in the cache (i.e. the provider rotated its keys). Forced refreshes are
+    rate limited so that tokens with made up `kid`s cannot be used to flood
+    the provider with requests.
+    """
+
+    def __init__(
+        self,
+        fetch_certs: Callable[[], Dict],
+        fetch_public_key: Optional[Callable[[], str]] = None,
+        ttl: float = 300,
+        min_refresh_interval: float = 10,
+    ):
+        """Initialize a JWKSCache.
+
+        Args:
+            fetch_certs (Callable[[], Dict]): Blocking function returning the JWKS, i.e. `{"keys": [...]}`
+            fetch_public_key (Optional[Callable[[], str]], optional): Blocking function returning the
+                realm public key, used for tokens without a `kid`. Defaults to None.
+            ttl (float, optional): Seconds before cached keys are refreshed. Defaults to 300.
+            min_refresh_interval (float, optional): Minimum seconds between forced refreshes. Defaults to 10.
+        """
+        self._fetch_certs = fetch_certs
+        self._fetch_public_key = fetch_public_key
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: Dict[str, Dict] = {}
+        self._public_key: Optional[str] = None
+        self._public_key_fetched_at: Optional[float] = None
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._last_forced_refresh: Optional[float] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._background_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cached keys are older than the TTL."""
+        return self._fetched_at is None or (
+            time.monotonic() - self._fetched_at > self.ttl
+        )
+
+    async def _fetch(self):
+        """Fetch the key set off the event loop and replace the cache."""
+        jwks = await asyncio.get_running_loop().run_in_executor(
+            None, self._fetch_certs
+        )
+        self._keys = {
+            key["kid"]: key
+            for key in jwks.get("keys", [])
+            if "kid" in key and key.get("use", "sig") == "sig"
+        }
+        self._fetched_at = time.monotonic()
+
+    async def refresh(self) -> bool:
+        """Refresh the cached keys. Concurrent callers share one fetch.
+
+        Returns:
+            bool: True if the refresh succeeded
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._inflight is None
+            or self._inflight.done()
+            or self._inflight.get_loop() is not loop
+        ):
+            self._inflight = loop.create_task(self._fetch())
+            self._attempted_at = time.monotonic()
+        try:
+            await asyncio.shield(self._inflight)
+            return True
+        except Exception as err:
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to refresh identity provider keys: {err}"
+            )
+            return False
+
+    async def get_key(self, kid: Optional[str]) -> Optional[Dict]:
+        """Get the signing key for a token.
+
+        Args:
+            kid (Optional[str]): Key ID from the token header
+
+        Returns:
+            Optional[Dict]: JWK, or None if no key with that ID is known
+        """
+        now = time.monotonic()
+        if (
+            self._keys
+            and self.is_stale
+            and (
+                self._attempted_at is None
+                or now - self._attempted_at >= self.min_refresh_interval
+            )
+        ):
+            # Serve the current keys while refreshing in the background,
+            # a rotated key will still trigger a forced refresh below
+            asyncio.get_running_loop().create_task(self.refresh())
+        if kid in self._keys:
+            return self._keys[kid]
+        if (
+            self._last_forced_refresh is None
+            or now - self._last_forced_refresh >= self.min_refresh_interval
+        ):
+            self._last_forced_refresh = now
+            await self.refresh()
+        return self._keys.get(kid)
+
+    async def get_public_key(self) -> Optional[str]:
+        """Get the realm public key in PEM format.
+
+        Returns:
+            Optional[str]: Public key, or None if it could not be fetched
+        """
+        if self._fetch_public_key is None:
+            return None
+        if (
+            self._public_key_fetched_at is None
+            or time.monotonic() - self._public_key_fetched_at > self.ttl
+        ):
+            try:
+                public_key = await asyncio.get_running_loop().run_in_executor(
+                    None, self._fetch_public_key
+                )
+                self._public_key = (
+                    "-----BEGIN PUBLIC KEY-----\n"
+                    f"{public_key}"
+                    "\n-----END PUBLIC KEY-----"
+                )
+                self._public_key_fetched_at = time.monotonic()
+            except Exception as err:
+                print(
+                    f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to fetch identity provider public key: {err}"
+                )
+        return self._public_key
+
+    async def _refresh_periodically(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.ttl)
+
+    def start_background_refresh(self):
+        """Start refreshing the keys every `ttl` seconds."""
+        if self._background_task is None or self._background_task.done():
+            self._background_task = asyncio.get_running_loop().create_task(
+                self._refresh_periodically()
+            )
+
+    def stop_background_refresh(self):
+        """Stop the periodic refresh."""
+        if self._background_task is not None:
+            self._background_task.cancel()
+            self._background_task = None
@@ -1,3 +1,5 @@
+from hashlib import sha256
+
 from fastapi import Depends, HTTPException, Request, status
 from jose import ExpiredSignatureError, JWTError, jwt
 
@@ -9,6 +11,8 @@ from passlib.context import CryptContext
 
 from ..config.config import config
 from ..models.iam import TokenData, UserRoles
+from .cache import LRUCache
+from .jwks import JWKSCache
 
 from keycloak import KeycloakAdmin
 from keycloak import KeycloakOpenIDConnection
@@ -36,15 +40,35 @@ CREDENTIALS_EXCEPTION = HTTPException(
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Signing keys are cached so that verifying a token does not need a
+# (blocking) round trip to Keycloak on every request
+jwks_cache = JWKSCache(
+    fetch_certs=keycloak_bearer_only.certs,
+    fetch_public_key=keycloak_bearer_only.public_key,
+    ttl=config.KEYCLOAK_JWKS_TTL,
+    min_refresh_interval=config.KEYCLOAK_JWKS_MIN_REFRESH_INTERVAL,
+)
+
+# Tokens that have already been verified, keyed by the digest of the token
+# and evicted when the token expires. The frontend reuses the same token
+# for many requests, so this skips signature verification for most of them
+token_cache = LRUCache(maxsize=config.TOKEN_CACHE_SIZE)
+
 async def get_idp_public_key():
     '''
     Obtain the public key of the keycloak
     '''
-    return (
-        "-----BEGIN PUBLIC KEY-----\n"
-        f"{keycloak_bearer_only.public_key()}"
-        "\n-----END PUBLIC KEY-----"
-    )
+    return await jwks_cache.get_public_key()
+
+async def get_signing_key(token: str):
+    '''
+    Obtain the key that the token was signed with, based on
+    the `kid` in the token header
+    '''
+    kid = jwt.get_unverified_header(token).get("kid")
+    if kid is None:
+        return await get_idp_public_key()
+    return await jwks_cache.get_key(kid)
 
 async def get_tokendata(identity: Json) -> TokenData:
     role_list = identity['resource_access']['ai-appstore-frontend']['roles']
@@ -75,9 +99,16 @@ async def get_current_user(
     Returns:
         TokenData: _description_
     """
+    digest = sha256(token.encode("utf-8")).hexdigest()
+    cached_token_data = token_cache.get(digest)
+    if cached_token_data is not None:
+        return cached_token_data
     identity = {}
     try:
-        identity = keycloak_bearer_only.decode_token(token, key=await get_idp_public_key())
+        key = await get_signing_key(token)
+        if key is None:
+            raise CREDENTIALS_EXCEPTION
+        identity = keycloak_bearer_only.decode_token(token, key=key)
         token_data = await get_tokendata(identity)
         # But userid and role will never be empty unless user did not sign up properly.
         if token_data.user_id is None or token_data.role is None: 
@@ -92,6 +123,8 @@ async def get_current_user(
     except (JWTError) as err: # base error for JWT
         raise CREDENTIALS_EXCEPTION from err
     
+    if identity.get('exp') is not None:
+        token_cache.set(digest, token_data, expires_at=identity['exp'])
     return token_data
 
 async def initialize_keycloak_admin() -> KeycloakAdmin:
@@ -0,0 +1,197 @@
+"""Cursor based (keyset) pagination.
+
+Instead of skipping over the previous pages, the next page starts right
+after the last document of the current page, identified by its sort key
+and `_id`. With a compound index on the sort key and `_id` every page is
+an index range scan, and pages do not shift when documents are added.
+"""
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from pymongo import ASCENDING, DESCENDING
+
+# Fields that listings can be sorted by, per collection.
+# Each is indexed together with `_id` as a tie breaker (see indexes.py).
+SORT_INDEXES = {
+    "models": ["lastModified", "created", "title", "modelId", "creatorUserId"],
+    "exports": ["timeInitiated", "timeCompleted", "userId"],
+}
+
+
+def encode_cursor(payload: Dict) -> str:
+    """Encode the position of a page as an opaque token.
+
+    Args:
+        payload (Dict): Position
+
+    Returns:
+        str: URL safe token
+    """
+    data = json_util.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_by: str, descending: bool) -> Dict:
+    """Decode a token created by `encode_cursor`.
+
+    Args:
+        token (str): Cursor token
+        sort_by (str): Sort field of the current request
+        descending (bool): Sort order of the current request
+
+    Raises:
+        ValueError: If the token is malformed or was created for another
+            sort order
+
+    Returns:
+        Dict: Position
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json_util.loads(data)
+    except (binascii.Error, ValueError, UnicodeDecodeError) as err:
+        raise ValueError("Malformed cursor") from err
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed cursor")
+    if payload.get("s") != sort_by or payload.get("d") != descending:
+        raise ValueError("Cursor was created for a different sort order")
+    return payload
+
+
+def _get_field(doc: Dict, path: str) -> Any:
+    value = doc
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def keyset_sort(sort_by: str, descending: bool) -> List[Tuple[str, int]]:
+    """Get the sort specification for keyset pagination, i.e. the sort
+    field followed by `_id` so that the order is total.
+
+    Args:
+        sort_by (str): Sort field
+        descending (bool): Whether to sort in descending order
+
+    Returns:
+        List[Tuple[str, int]]: Sort specification
+    """
+    direction = DESCENDING if descending else ASCENDING
+    if sort_by == "_id":
+        return [("_id", direction)]
+    return [(sort_by, direction), ("_id", direction)]
+
+
+def keyset_cursor(doc: Dict, sort_by: str, descending: bool) -> str:
+    """Create the cursor of the page following a document.
+
+    Args:
+        doc (Dict): Last document of the current page, including the sort
+            field and `_id`
+        sort_by (str): Sort field
+        descending (bool): Whether the results are in descending order
+
+    Returns:
+        str: Cursor token
+    """
+    return encode_cursor(
+        {
+            "s": sort_by,
+            "d": descending,
+            "v": _get_field(doc, sort_by),
+            "id": doc["_id"],
+        }
+    )
+
+
+def offset_cursor(offset: int, sort_by: str, descending: bool) -> str:
+    """Create the cursor of a page of results in an order that cannot be
+    expressed as a range of keys (e.g. relevance).
+
+    Args:
+        offset (int): Number of results before the page
+        sort_by (str): Sort field
+        descending (bool): Whether the results are in descending order
+
+    Returns:
+        str: Cursor token
+    """
+    return encode_cursor({"s": sort_by, "d": descending, "o": offset})
+
+
+def cursor_offset(payload: Dict) -> int:
+    """Get the offset of a cursor created by `offset_cursor`.
+
+    Args:
+        payload (Dict): Decoded cursor
+
+    Raises:
+        ValueError: If the cursor is not an offset cursor
+
+    Returns:
+        int: Number of results to skip
+    """
+    offset = payload.get("o")
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Cursor does not hold an offset")
+    return offset
+
+
+def keyset_filter(payload: Dict, sort_by: str, descending: bool) -> Dict:
+    """Get the filter matching the documents after a cursor.
+
+    Args:
+        payload (Dict): Decoded cursor created by `keyset_cursor`
+        sort_by (str): Sort field
+        descending (bool): Whether the results are in descending order
+
+    Raises:
+        ValueError: If the cursor is not a keyset cursor
+
+    Returns:
+        Dict: Query filter
+    """
+    if "id" not in payload:
+        raise ValueError("Cursor does not hold a position")
+    after = "$lt" if descending else "$gt"
+    last_id = payload["id"]
+    if sort_by == "_id":
+        return {"_id": {after: last_id}}
+    value = payload.get("v")
+    if value is None:
+        # Missing and null values sort before all others
+        if descending:
+            return {sort_by: None, "_id": {after: last_id}}
+        return {
+            "$or": [
+                {sort_by: {"$ne": None}},
+                {sort_by: None, "_id": {after: last_id}},
+            ]
+        }
+    return {
+        "$or": [
+            {sort_by: {after: value}},
+            {sort_by: value, "_id": {after: last_id}},
+        ]
+    }
+
+
+def with_sort_field(
+    projection: Optional[List[str]], sort_by: str
+) -> Optional[List[str]]:
+    """Make sure a projection includes the sort field needed for the cursor.
+
+    Args:
+        projection (Optional[List[str]]): Fields to return, None for all
+        sort_by (str): Sort field
+
+    Returns:
+        Optional[List[str]]: Fields to return
+    """
+    if projection is None or sort_by in projection:
+        return projection
+    return [*projection, sort_by]
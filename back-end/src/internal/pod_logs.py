@@ -0,0 +1,591 @@
+"""Incremental streaming of inference service pod logs."""
+import asyncio
+import concurrent.futures
+import datetime
+import socket
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from colorama import Fore
+from kubernetes.client.rest import ApiException
+from kubernetes.watch.watch import iter_resp_lines
+
+from .dependencies.k8s_client import AsyncK8sClient
+
+_END = object()
+
+
+def split_timestamp(line: str) -> Tuple[Optional[str], str]:
+    """Split the RFC3339 timestamp added by `timestamps=True` from a log line.
+
+    Args:
+        line (str): Log line
+
+    Returns:
+        Tuple[Optional[str], str]: Timestamp (None if missing) and message
+    """
+    timestamp, sep, message = line.partition(" ")
+    if not sep or not timestamp.endswith("Z") or "T" not in timestamp:
+        return None, line
+    return timestamp, message
+
+
+def timestamp_key(timestamp: str) -> Tuple[str, int]:
+    """Get a sortable key for an RFC3339Nano timestamp.
+
+    Trailing zeros of the fraction are trimmed by K8S, so the timestamps
+    cannot be compared as strings.
+
+    Args:
+        timestamp (str): e.g. 2023-01-01T00:00:00.12Z
+
+    Returns:
+        Tuple[str, int]: Timestamp to the second, and nanoseconds
+    """
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return seconds, int(fraction.ljust(9, "0")[:9] or 0)
+
+
+def close_response(response: Any):
+    """Close a streaming HTTP response, interrupting a read blocked on
+    another thread.
+
+    Args:
+        response (Any): urllib3 response read with `_preload_content=False`
+    """
+    try:
+        if hasattr(response, "shutdown"):  # urllib3 >= 2.3
+            response.shutdown()
+        else:
+            sock = getattr(getattr(response, "connection", None), "sock", None)
+            if sock is not None:
+                sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # already closed
+    response.close()
+
+
+def seconds_since(timestamp: str) -> float:
+    """Get the number of seconds elapsed since a timestamp.
+
+    Args:
+        timestamp (str): RFC3339 timestamp
+
+    Returns:
+        float: Elapsed seconds
+    """
+    seconds, _ = timestamp_key(timestamp)
+    then = datetime.datetime.strptime(seconds, "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=datetime.timezone.utc
+    )
+    return time.time() - then.timestamp()
+
+
+class ByteRateLimiter:
+    """Token bucket limiting the number of bytes sent per second."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize a ByteRateLimiter.
+
+        Args:
+            rate (float): Bytes per second, 0 to disable the limit
+            burst (Optional[float], optional): Max bytes sent at once. Defaults to `rate`.
+        """
+        self.rate = rate
+        self.burst = burst or rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    async def wait(self, amount: int):
+        """Wait until `amount` bytes may be sent.
+
+        Args:
+            amount (int): Number of bytes to send
+        """
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens < 0:
+            # Pay off the debt before sending more
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class ContainerLogFollower:
+    """Follows the logs of one container of an inference service.
+
+    Starts with the last `tail_lines` lines, then only new lines are
+    returned. When the stream ends (e.g. the container restarts or the
+    pod is replaced) the pod is looked up again and the stream resumes
+    from the last line seen, so lines are neither lost nor repeated.
+    """
+
+    def __init__(
+        self,
+        k8s: AsyncK8sClient,
+        namespace: str,
+        get_pods: Callable[[], Awaitable[List[Any]]],
+        container: Optional[str] = None,
+        tail_lines: int = 100,
+        reconnect_delay: float = 2,
+        read_timeout: float = 300,
+    ):
+        """Initialize a ContainerLogFollower.
+
+        Args:
+            k8s (AsyncK8sClient): K8S client
+            namespace (str): Namespace of the pods
+            get_pods (Callable[[], Awaitable[List[Any]]]): Function returning the current pods of the service
+            container (Optional[str], optional): Container name, required if the pod has
+                more than one container. Defaults to None.
+            tail_lines (int, optional): Number of existing lines to start with. Defaults to 100.
+            reconnect_delay (float, optional): Seconds to wait before reconnecting. Defaults to 2.
+            read_timeout (float, optional): Seconds without output before reconnecting. Defaults to 300.
+        """
+        self.k8s = k8s
+        self.namespace = namespace
+        self.get_pods = get_pods
+        self.container = container
+        self.tail_lines = tail_lines
+        self.reconnect_delay = reconnect_delay
+        self.read_timeout = read_timeout
+        self.reconnects = 0
+
+    async def _select_pod(self) -> Optional[Any]:
+        pods = await self.get_pods()
+        running = [pod for pod in pods if pod.status.phase == "Running"]
+        return (running or pods or [None])[0]
+
+    async def _stream(self, pod_name: str, **kwargs) -> AsyncIterator[str]:
+        """Stream lines of a pod's log, reading the blocking response on a
+        dedicated thread so that long lived streams do not tie up the
+        shared K8S worker pool.
+        """
+        loop = asyncio.get_running_loop()
+        # Small queue so that a slow reader slows down the upstream read
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        stopped = threading.Event()
+        # Kept to close the connection when the stream is stopped, rather
+        # than waiting for the next line (or read timeout) to notice
+        response_lock = threading.Lock()
+        response: List[Any] = []
+
+        def close():
+            with response_lock:
+                stopped.set()
+                for resp in response:
+                    close_response(resp)
+
+        def put(item: Any):
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    queue.put(item), loop
+                )
+            except RuntimeError:  # loop closed
+                stopped.set()
+                return
+            while not stopped.is_set():
+                try:
+                    future.result(timeout=1)
+                    return
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+
+        def produce():
+            try:
+                resp = self.k8s.core.read_namespaced_pod_log(
+                    name=pod_name,
+                    namespace=self.namespace,
+                    container=self.container,
+                    timestamps=True,
+                    follow=True,
+                    _preload_content=False,
+                    _request_timeout=(
+                        self.k8s.timeout,
+                        self.read_timeout,
+                    ),
+                    **kwargs,
+                )
+                with response_lock:
+                    response.append(resp)
+                    if stopped.is_set():  # stopped while connecting
+                        close_response(resp)
+                        return
+                for line in iter_resp_lines(resp):
+                    if stopped.is_set():
+                        break
+                    put(line)
+                put(_END)
+            except Exception as err:
+                if not stopped.is_set():
+                    put(err)
+
+        threading.Thread(
+            target=produce, name=f"logs-{pod_name}", daemon=True
+        ).start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            close()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """Follow the container's logs until cancelled.
+
+        Yields:
+            str: Log lines, without timestamps
+        """
+        last_timestamp: Optional[str] = None
+        while True:
+            pod_name = "service"
+            try:
+                pod = await self._select_pod()
+                if pod is None:
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+                pod_name = pod.metadata.name
+                if last_timestamp is None:
+                    kwargs = {"tail_lines": self.tail_lines}
+                else:
+                    kwargs = {
+                        "since_seconds": int(seconds_since(last_timestamp)) + 1
+                    }
+                # Skip lines already sent when resuming
+                resume_after = last_timestamp and timestamp_key(last_timestamp)
+                async for line in self._stream(pod_name, **kwargs):
+                    timestamp, message = split_timestamp(line)
+                    if timestamp is not None:
+                        if resume_after:
+                            if timestamp_key(timestamp) <= resume_after:
+                                continue
+                            resume_after = None
+                        last_timestamp = timestamp
+                    yield message
+            except ApiException as err:
+                # e.g. the container is still being created, the pod was
+                # deleted or listing the pods timed out, try again
+                if err.status not in (400, 404):
+                    print(
+                        f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Log stream of {pod_name} failed: {err}"
+                    )
+            except Exception as err:
+                # Read timeout or dropped connection
+                print(
+                    f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Log stream of {pod_name} interrupted: {err}"
+                )
+            self.reconnects += 1
+            await asyncio.sleep(self.reconnect_delay)
+
+
+async def follow_service_logs(
+    k8s: AsyncK8sClient,
+    namespace: str,
+    get_pods: Callable[[], Awaitable[List[Any]]],
+    containers: List[str],
+    tail_lines: int = 100,
+    queue_size: int = 1024,
+) -> AsyncIterator[List[str]]:
+    """Follow the logs of one or more containers of a service.
+
+    When following more than one container, lines are prefixed with the
+    name of the container they come from.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+        namespace (str): Namespace of the pods
+        get_pods (Callable[[], Awaitable[List[Any]]]): Function returning the current pods of the service
+        containers (List[str]): Names of the containers to follow
+        tail_lines (int, optional): Number of existing lines per container to start with. Defaults to 100.
+        queue_size (int, optional): Max lines buffered before the upstream reads slow down. Defaults to 1024.
+
+    Yields:
+        List[str]: Batches of new log lines
+
+    Raises:
+        Exception: Error of a container's stream, if one stopped
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def pump(container: str):
+        follower = ContainerLogFollower(
+            k8s,
+            namespace,
+            get_pods,
+            container=container,
+            tail_lines=tail_lines,
+        )
+        prefix = f"[{container}] " if len(containers) > 1 else ""
+        async for line in follower.follow():
+            await queue.put(prefix + line)
+
+    tasks = [asyncio.create_task(pump(container)) for container in containers]
+    getter: Optional[asyncio.Task] = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.create_task(queue.get())
+            # Also wait on the pumps, which only stop on unexpected errors
+            done, _ = await asyncio.wait(
+                [getter, *tasks], return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                lines = [getter.result()]
+                getter = None
+                while not queue.empty():
+                    lines.append(queue.get_nowait())
+                yield lines
+                continue
+            for task in tasks:
+                if task.done():
+                    raise task.exception() or RuntimeError("Log stream ended")
+    finally:
+        for task in [*tasks, getter]:
+            if task is not None:
+                task.cancel()
+
+
+class LogStreamEnded(Exception):
+    """Raised to a viewer after the upstream log stream stopped."""
+
+
+class LogSubscription:
+    """A viewer of a LogBroadcaster.
+
+    Lines are buffered per viewer up to `max_lines`. If the viewer falls
+    behind, the oldest buffered lines are dropped so that one slow viewer
+    never holds up the others.
+    """
+
+    def __init__(self, broadcaster: "LogBroadcaster", max_lines: int):
+        """Initialize a LogSubscription.
+
+        Args:
+            broadcaster (LogBroadcaster): Broadcaster subscribed to
+            max_lines (int): Max lines buffered for this viewer
+        """
+        self.broadcaster = broadcaster
+        self.dropped = 0
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._ended: Optional[str] = None
+
+    def push(self, lines: List[str]):
+        """Add lines, dropping the oldest buffered lines if full.
+
+        Args:
+            lines (List[str]): New log lines
+        """
+        overflow = len(self._lines) + len(lines) - self._lines.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+        self._lines.extend(lines)
+        self._ready.set()
+
+    def end(self, reason: str):
+        """Mark the stream as ended, after the buffered lines.
+
+        Args:
+            reason (str): Why the stream ended
+        """
+        self._ended = reason
+        self._ready.set()
+
+    async def get(self) -> List[str]:
+        """Wait for and return all buffered lines.
+
+        Raises:
+            LogStreamEnded: If the stream ended and all lines were returned
+
+        Returns:
+            List[str]: New log lines, preceded by a notice if lines were dropped
+        """
+        await self._ready.wait()
+        if self._ended is not None and not self._lines:
+            raise LogStreamEnded(self._ended)
+        if self._ended is None:
+            self._ready.clear()
+        lines = list(self._lines)
+        self._lines.clear()
+        if self.dropped:
+            lines.insert(0, f"[... {self.dropped} lines skipped ...]")
+            self.broadcaster.dropped += self.dropped
+            self.dropped = 0
+        return lines
+
+    def close(self):
+        """Stop receiving lines."""
+        if not self._closed:
+            self._closed = True
+            self.broadcaster.unsubscribe(self)
+
+
+class LogBroadcaster:
+    """Shares one upstream log stream between all viewers of a service.
+
+    The most recent lines are kept in a ring buffer so that new viewers
+    start with recent history. The upstream stream is started by the
+    first viewer and stopped when the last viewer leaves.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        source: Callable[[int], AsyncIterator[List[str]]],
+        buffer_lines: int = 1000,
+        on_idle: Optional[Callable[["LogBroadcaster"], None]] = None,
+    ):
+        """Initialize a LogBroadcaster.
+
+        Args:
+            key (Hashable): Key of the broadcaster in its registry
+            source (Callable[[int], AsyncIterator[List[str]]]): Function starting the upstream
+                stream, given the number of existing lines to start with
+            buffer_lines (int, optional): Number of recent lines kept. Defaults to 1000.
+            on_idle (Optional[Callable[[LogBroadcaster], None]], optional): Called after the
+                last viewer leaves. Defaults to None.
+        """
+        self.key = key
+        self.source = source
+        self.buffer: Deque[str] = deque(maxlen=buffer_lines)
+        self.subscribers: Set[LogSubscription] = set()
+        self.dropped = 0
+        self.on_idle = on_idle
+        self._task: Optional[asyncio.Task] = None
+
+    async def _pump(self, tail_lines: int):
+        reason = "Log stream ended"
+        try:
+            async for lines in self.source(tail_lines):
+                self.buffer.extend(lines)
+                for subscriber in self.subscribers:
+                    subscriber.push(lines)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Log stream {self.key} stopped: {err}"
+            )
+            reason = f"Log stream stopped: {err}"
+        # Tell the viewers, which would otherwise wait forever. Viewers
+        # subscribing later start a new stream.
+        ended, self.subscribers = self.subscribers, set()
+        for subscriber in ended:
+            subscriber.end(reason)
+
+    def subscribe(self, tail_lines: int, max_lines: int) -> LogSubscription:
+        """Add a viewer, starting the upstream stream if needed.
+
+        Args:
+            tail_lines (int): Number of recent lines to start with
+            max_lines (int): Max lines buffered for the viewer
+
+        Returns:
+            LogSubscription: New viewer
+        """
+        subscription = LogSubscription(self, max_lines)
+        self.subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            # The first viewer decides how much history is fetched. The
+            # buffer may be left by a stopped stream, and would repeat it.
+            self.buffer.clear()
+            self._task = asyncio.create_task(
+                self._pump(min(tail_lines, self.buffer.maxlen))
+            )
+        elif tail_lines > 0 and self.buffer:
+            subscription.push(list(self.buffer)[-tail_lines:])
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        """Remove a viewer, stopping the upstream stream if it was the last.
+
+        Args:
+            subscription (LogSubscription): Viewer to remove
+        """
+        self.subscribers.discard(subscription)
+        if not self.subscribers:
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+            if self.on_idle is not None:
+                self.on_idle(self)
+
+
+class LogBroadcasterRegistry:
+    """Keeps one LogBroadcaster per service while it has viewers."""
+
+    def __init__(self):
+        """Initialize a LogBroadcasterRegistry."""
+        self._broadcasters: Dict[Hashable, LogBroadcaster] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        source: Callable[[int], AsyncIterator[List[str]]],
+        buffer_lines: int = 1000,
+    ) -> LogBroadcaster:
+        """Get the broadcaster for a key, creating it if needed.
+
+        Args:
+            key (Hashable): e.g. service name and containers
+            source (Callable[[int], AsyncIterator[List[str]]]): Function starting the upstream
+                stream, given the number of existing lines to start with
+            buffer_lines (int, optional): Number of recent lines kept. Defaults to 1000.
+
+        Returns:
+            LogBroadcaster: Broadcaster for the key
+        """
+        broadcaster = self._broadcasters.get(key)
+        if broadcaster is None:
+            broadcaster = LogBroadcaster(
+                key, source, buffer_lines, on_idle=self._remove
+            )
+            self._broadcasters[key] = broadcaster
+        return broadcaster
+
+    def _remove(self, broadcaster: LogBroadcaster):
+        if self._broadcasters.get(broadcaster.key) is broadcaster:
+            del self._broadcasters[broadcaster.key]
+
+    def info(self) -> Dict:
+        """Get the number of active streams and viewers.
+
+        Returns:
+            Dict: Active upstream streams, viewers and dropped lines
+        """
+        return {
+            "streams": len(self._broadcasters),
+            "viewers": sum(
+                len(b.subscribers) for b in self._broadcasters.values()
+            ),
+            "droppedLines": sum(
+                b.dropped for b in self._broadcasters.values()
+            ),
+        }
+
+
+log_broadcasters = LogBroadcasterRegistry()
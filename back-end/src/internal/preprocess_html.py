@@ -1,9 +1,15 @@
 """This module contains functions for preprocessing HTML before it is saved to the database."""
+import asyncio
+import re
 from base64 import b64decode, b64encode
+from html import escape, unescape
 from mimetypes import guess_extension, guess_type
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+import miniopy_async
 from bs4 import BeautifulSoup
+from colorama import Fore
 from lxml.etree import ParserError
 from lxml.html.clean import Cleaner
 
@@ -15,6 +21,15 @@ from .dependencies.minio_client import (
     upload_data,
 )
 
+# HTML larger than this (in characters) is parsed in a worker thread
+OFF_LOOP_HTML_SIZE = 64 * 1024
+# S3 URL in the src attribute of an img tag, as serialized by the
+# sanitizer. Quoted values are skipped whole, so that text such as
+# alt="src='s3://...'" or attributes such as data-src are not matched.
+S3_SRC_PATTERN = re.compile(
+    r"""(<img\b(?:[^>"']|"[^"]*"|'[^']*')*?\ssrc=)(["'])(s3://[^"']+)\2"""
+)
+
 
 async def preprocess_html_post(html: str) -> str:
     """Preprocessing pipeline for HTML.
@@ -39,11 +54,129 @@ async def preprocess_html_post(html: str) -> str:
     return html
 
 
-async def preprocess_html_get(html: str) -> str:
+def _parse_all(htmls: Iterable[Optional[str]]) -> List[Optional[BeautifulSoup]]:
+    return [BeautifulSoup(html, "lxml") if html else None for html in htmls]
+
+
+def _serialize_all(soups: Iterable[Optional[BeautifulSoup]]) -> List[str]:
+    return [str(soup) for soup in soups if soup is not None]
+
+
+def extract_media_refs(*htmls: Optional[str]) -> List[str]:
+    """Get the S3 URLs of the images in HTML documents, to be stored with
+    the documents so that they do not need to be parsed again.
+
+    Args:
+        *htmls (Optional[str]): HTML documents
+
+    Returns:
+        List[str]: Distinct S3 URLs, in order of appearance
+    """
+    refs: Dict[str, None] = {}
+    for html in htmls:
+        if not html or "s3://" not in html:
+            continue
+        for image in BeautifulSoup(html, "lxml").find_all("img"):
+            source = image.get("src", "")
+            if source.startswith("s3://"):
+                refs[source] = None
+    return list(refs)
+
+
+def substitute_media_urls(html: str, urls: Dict[str, str]) -> str:
+    """Replace S3 URLs in the src attributes of images, in a single pass
+    over the text.
+
+    Args:
+        html (str): HTML document
+        urls (Dict[str, str]): New URL of each S3 URL. Others are left as is.
+
+    Returns:
+        str: HTML document
+    """
+
+    def replace(match: re.Match) -> str:
+        url = urls.get(unescape(match.group(3)))
+        if url is None:
+            return match.group(0)
+        return f"{match.group(1)}{match.group(2)}{escape(url)}{match.group(2)}"
+
+    return S3_SRC_PATTERN.sub(replace, html)
+
+
+async def preprocess_html_get(
+    *htmls: Optional[str],
+    s3_client: Optional[miniopy_async.Minio] = None,
+    media_refs: Optional[List[str]] = None,
+) -> List[Optional[str]]:
+    """Replace S3 URLs of images with presigned URLs, so that they can be
+    viewed from a private bucket.
+
+    All documents are handled in one pass: the images of every document
+    are collected and presigned concurrently. Documents without S3 URLs
+    are returned unchanged.
+
+    If the S3 URLs of the documents are known (see `extract_media_refs`),
+    they are substituted into the text without parsing it. Otherwise the
+    documents are parsed, large ones in a worker thread so that the event
+    loop is not blocked.
+
+    Args:
+        *htmls (Optional[str]): HTML documents, e.g. markdown and performance
+        s3_client (Optional[miniopy_async.Minio], optional): S3 client.
+            Defaults to None (the shared client).
+        media_refs (Optional[List[str]], optional): S3 URLs referenced by the
+            documents. Defaults to None (unknown).
+
+    Returns:
+        List[Optional[str]]: HTML documents, in the same order
+    """
+    if media_refs is not None:
+        if not media_refs:
+            return list(htmls)
+        if s3_client is None:
+            s3_client = await minio_api_client()
+        if not s3_client:
+            return list(htmls)
+        urls = await presign_s3_urls(s3_client, media_refs)
+        return [
+            substitute_media_urls(html, urls) if html else html
+            for html in htmls
+        ]
+    # Only parse documents that reference S3
+    indexes = [i for i, html in enumerate(htmls) if html and "s3://" in html]
+    if not indexes:
+        return list(htmls)
+    to_parse = [htmls[i] for i in indexes]
+    off_loop = sum(len(html) for html in to_parse) > OFF_LOOP_HTML_SIZE
+    if off_loop:
+        soups = await asyncio.to_thread(_parse_all, to_parse)
+    else:
+        soups = _parse_all(to_parse)
+    await s3_url_to_presigned_url(*soups, s3_client=s3_client)
+    if off_loop:
+        processed = await asyncio.to_thread(_serialize_all, soups)
+    else:
+        processed = _serialize_all(soups)
+    results = list(htmls)
+    for i, html in zip(indexes, processed):
+        results[i] = html
+    return results
+
+
+def html_to_text(html: str) -> str:
+    """Extract the plain text of HTML, e.g. for indexing.
+
+    Args:
+        html (str): HTML
+
+    Returns:
+        str: Text content, with whitespace collapsed
+    """
+    if not html:
+        return ""
     soup = BeautifulSoup(html, "lxml")
-    soup = await s3_url_to_presigned_url(soup)
-    html = str(soup)
-    return html
+    return " ".join(soup.get_text(separator=" ").split())
 
 
 async def upload_b64_media(parser: BeautifulSoup) -> BeautifulSoup:
@@ -132,25 +265,90 @@ async def sanitize_html(html: str) -> str:
         return "<p>Error parsing HTML</p>"
 
 
+def parse_s3_url(url: str) -> Tuple[str, str]:
+    """Split an S3 URL into its bucket and object names.
+
+    Args:
+        url (str): URL of the form s3://<bucket>/<object>
+
+    Returns:
+        Tuple[str, str]: Bucket name and object name
+    """
+    bucket_name, object_name = url.removeprefix("s3://").split("/", 1)
+    return bucket_name, object_name
+
+
+async def presign_s3_urls(
+    s3_client: miniopy_async.Minio,
+    urls: Iterable[str],
+    concurrency: Optional[int] = None,
+) -> Dict[str, str]:
+    """Presign S3 URLs concurrently.
+
+    Args:
+        s3_client (miniopy_async.Minio): S3 client
+        urls (Iterable[str]): URLs of the form s3://<bucket>/<object>
+        concurrency (Optional[int], optional): Max number of URLs signed at once.
+            Defaults to None (PRESIGNED_URL_CONCURRENCY).
+
+    Returns:
+        Dict[str, str]: Presigned URL of each S3 URL. URLs that could not
+            be signed are left out.
+    """
+    semaphore = asyncio.Semaphore(
+        concurrency or config.PRESIGNED_URL_CONCURRENCY
+    )
+
+    async def presign(url: str) -> str:
+        bucket_name, object_name = parse_s3_url(url)
+        async with semaphore:
+            return await get_presigned_url(s3_client, object_name, bucket_name)
+
+    urls = list(dict.fromkeys(urls))  # deduplicate, keeping order
+    results = await asyncio.gather(
+        *(presign(url) for url in urls), return_exceptions=True
+    )
+    presigned = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to presign {url}: {result}"
+            )
+        else:
+            presigned[url] = result
+    return presigned
+
+
 async def s3_url_to_presigned_url(
-    parser: BeautifulSoup,
-):
-    s3_client = await minio_api_client()
+    *parsers: BeautifulSoup, s3_client: Optional[miniopy_async.Minio] = None
+) -> List[BeautifulSoup]:
+    """Replace the S3 URLs of images with presigned URLs, signing each
+    distinct URL once across all documents.
+
+    Args:
+        *parsers (BeautifulSoup): HTML parsers
+        s3_client (Optional[miniopy_async.Minio], optional): S3 client.
+            Defaults to None (the shared client).
+
+    Returns:
+        List[BeautifulSoup]: Parsers with S3 URLs replaced
+    """
+    if s3_client is None:
+        s3_client = await minio_api_client()
     if not s3_client:
-        return parser
-    # Get all images
-    images = parser.find_all("img")
+        return list(parsers)
+    # s3://<bucket>/<object>
+    images = [
+        image
+        for parser in parsers
+        for image in parser.find_all("img")
+        if image.get("src", "").startswith("s3://")
+    ]
+    urls = await presign_s3_urls(s3_client, (image["src"] for image in images))
     for image in images:
-        # Filter out images that are not base64 encoded
-        if not image["src"].startswith("s3://"):
-            continue
-        # Extract bucket name and object name
-        # s3://<bucket>/<object>
-        bucket_name, object_name = image["src"].split("s3://")[1].split("/", 1)
-
-        # Replace the base64 encoded image with the URL of the uploaded image
-        image["src"] = await get_presigned_url(s3_client, object_name, bucket_name)
-    return parser
+        if image["src"] in urls:
+            image["src"] = urls[image["src"]]
+    return list(parsers)
 
 
 async def process_html_to_base64(html: str) -> str:
@@ -0,0 +1,193 @@
+"""Cache of search responses, invalidated by a write generation counter."""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from ..config.config import config
+from .cache import LRUCache
+from .card_events import add_card_listener
+from .counts import normalize_query
+from .dependencies.mongo_client import get_db
+from .etag import make_etag
+
+# Counters shared by all processes, one document per cached collection
+GENERATIONS_COLLECTION = "cacheGenerations"
+MODELS_GENERATION_ID = "models"
+
+
+async def read_generation(db: AsyncIOMotorDatabase) -> int:
+    """Get the number of model card writes made by all processes.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+
+    Returns:
+        int: Generation, 0 before the first write
+    """
+    counter = await db[GENERATIONS_COLLECTION].find_one(
+        {"_id": MODELS_GENERATION_ID}
+    )
+    return counter["generation"] if counter is not None else 0
+
+
+async def bump_generation(db: AsyncIOMotorDatabase) -> int:
+    """Count a model card write.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+
+    Returns:
+        int: New generation
+    """
+    counter = await db[GENERATIONS_COLLECTION].find_one_and_update(
+        {"_id": MODELS_GENERATION_ID},
+        {"$inc": {"generation": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return counter["generation"]
+
+
+class SearchResultCache:
+    """Caches the responses of model card searches.
+
+    Entries are keyed by the normalized search parameters and a
+    generation counter, which is incremented by every model card write.
+    The counter is kept in MongoDB so that all workers see every write,
+    at the cost of one lookup by `_id` per search. A response computed
+    while a card was being written is stored under the old generation,
+    and so is never served. The cache is bounded by the size of the
+    serialized responses, evicting the least recently used first.
+
+    The counter is incremented before the transaction writing the card
+    commits, so a search racing the commit may cache the old results
+    under the new generation. The max age bounds how long they are
+    served.
+    """
+
+    def __init__(
+        self,
+        maxbytes: int = 32 * 1024 * 1024,
+        maxsize: int = 4096,
+        max_age: Optional[float] = None,
+    ):
+        """Initialize a SearchResultCache.
+
+        Args:
+            maxbytes (int, optional): Max total size of the cached responses,
+                0 to disable the cache. Defaults to 32 MiB.
+            maxsize (int, optional): Max number of cached responses. Defaults to 4096.
+            max_age (Optional[float], optional): Seconds to cache a response.
+                Defaults to None (until the next write).
+        """
+        self.enabled = maxbytes > 0
+        # Last generation seen, the cached responses are all from it
+        self.generation = 0
+        self.max_age = max_age
+        self._cache = LRUCache(
+            maxsize=maxsize, ttl=max_age, maxbytes=max(maxbytes, 0)
+        )
+
+    def _observe(self, generation: int):
+        # Responses of other generations are never served again. The
+        # counter may also go back, if its collection was dropped.
+        if generation != self.generation:
+            self.generation = generation
+            self._cache.clear()
+
+    async def key(
+        self, db: AsyncIOMotorDatabase, params: Dict[str, Any]
+    ) -> Tuple[int, str]:
+        """Get the cache key of a search at the current generation.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database holding the generation
+            params (Dict[str, Any]): Search parameters
+
+        Returns:
+            Tuple[int, str]: Generation and normalized parameters
+        """
+        generation = await read_generation(db)
+        self._observe(generation)
+        return generation, normalize_query(params)
+
+    def etag(self, key: Tuple[int, str]) -> str:
+        """Get the entity tag of a search response.
+
+        The tag changes whenever the cached response would be dropped: on
+        writes and after the max age. It only depends on the shared
+        generation, so all workers agree on it.
+
+        Args:
+            key (Tuple[int, str]): Key from `key`
+
+        Returns:
+            str: Entity tag
+        """
+        parts = list(key)
+        if self.max_age:
+            parts.append(int(time.time() // self.max_age))
+        return make_etag(*parts)
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Get a cached response.
+
+        Args:
+            key (Hashable): Key from `key`
+
+        Returns:
+            Optional[Dict]: Response, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        return self._cache.get(key)
+
+    def set(self, key: Tuple[int, str], response: Dict, size: int):
+        """Cache a response, unless a card was written since the key was made.
+
+        Args:
+            key (Tuple[int, str]): Key from `key`, taken before searching
+            response (Dict): Response
+            size (int): Size of the serialized response in bytes
+        """
+        if self.enabled and key[0] == self.generation:
+            self._cache.set(key, response, size=size)
+
+    def clear(self):
+        """Drop all cached responses of this process."""
+        self._cache.clear()
+
+    async def on_card_event(
+        self, event: str, card: Dict, previous: Optional[Dict]
+    ):
+        """Move all processes to the next generation after a model card is
+        written.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+        db, _ = get_db()
+        self._observe(await bump_generation(db))
+
+    def info(self) -> Dict:
+        """Get usage counters of the cache.
+
+        Returns:
+            Dict: Generation, cache size in entries and bytes, and hit ratio
+        """
+        return {
+            "enabled": self.enabled,
+            "generation": self.generation,
+            **self._cache.info(),
+        }
+
+
+search_result_cache = SearchResultCache(
+    maxbytes=config.SEARCH_CACHE_MAX_BYTES,
+    max_age=config.SEARCH_CACHE_MAX_AGE,
+)
+add_card_listener(search_result_cache.on_card_event)
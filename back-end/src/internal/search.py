@@ -0,0 +1,195 @@
+"""Full text search over model cards using a MongoDB text index."""
+import re
+from typing import Dict, List, Tuple
+
+from colorama import Fore
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from ..config.config import config
+from .preprocess_html import extract_media_refs, html_to_text
+
+# Relative importance of a match in each field
+TEXT_INDEX_WEIGHTS = {
+    "title": 10,
+    "task": 5,
+    "tags": 5,
+    "frameworks": 5,
+    "description": 3,
+    "usage": 2,
+    "searchText": 1,  # plain text of markdown and performance HTML
+    "explanation": 1,
+    "limitations": 1,
+    "owner": 1,
+    "pointOfContact": 1,
+    "creatorUserId": 1,
+}
+
+# Fields matched by the regex fallback for short fragments
+REGEX_SEARCH_FIELDS = list(TEXT_INDEX_WEIGHTS)
+
+# Sort by relevance when searching
+TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+
+# Entry of `visibleTo` for model cards anyone can see
+PUBLIC_VISIBILITY = "*"
+# Fields derived from the model card on write, not returned to clients
+EXCLUDE_DERIVED_FIELDS = {"searchText": 0, "visibleTo": 0, "mediaRefs": 0}
+# Rich text fields, which can be large, only returned for a single card
+CONTENT_FIELDS = ("markdown", "performance")
+# Default projection of listings
+SUMMARY_PROJECTION = {
+    **EXCLUDE_DERIVED_FIELDS,
+    **{field: 0 for field in CONTENT_FIELDS},
+}
+
+# Whether all model cards have `visibleTo`, set once backfilled
+_visibility_ready = False
+
+
+def build_search_text(card: Dict) -> str:
+    """Get the plain text of a model card's HTML fields, to be stored in
+    the `searchText` field so that HTML is never searched directly.
+
+    Args:
+        card (Dict): Model card with camelCase keys
+
+    Returns:
+        str: Text of the markdown and performance sections
+    """
+    return " ".join(
+        html_to_text(card.get(field) or "") for field in CONTENT_FIELDS
+    ).strip()
+
+
+def build_visible_to(card: Dict) -> List[str]:
+    """Get the users that can see a model card, to be stored in the
+    `visibleTo` field so that access can be checked with one indexed
+    equality.
+
+    Args:
+        card (Dict): Model card with camelCase keys
+
+    Returns:
+        List[str]: PUBLIC_VISIBILITY if anyone can see the card, otherwise
+            the creator and authorized users
+    """
+    access_control = card.get("accessControl") or {}
+    if not access_control.get("enabled"):
+        return [PUBLIC_VISIBILITY]
+    users = {
+        card.get("creatorUserId"),
+        *(access_control.get("authorized") or []),
+    }
+    return sorted(user for user in users if user)
+
+
+def visibility_filter(user: str) -> Dict:
+    """Build the query matching the model cards a user can see.
+
+    Args:
+        user (str): User ID
+
+    Returns:
+        Dict: Query
+    """
+    if _visibility_ready:
+        return {"visibleTo": {"$in": [PUBLIC_VISIBILITY, user]}}
+    # Some cards may not have `visibleTo` yet
+    return {
+        "$or": [
+            {"accessControl.enabled": False},
+            {
+                "$and": [
+                    {"accessControl.enabled": True},
+                    {"accessControl.authorized": user},
+                ]
+            },
+            {"creatorUserId": user},
+        ]
+    }
+
+
+def search_filter(text: str) -> Tuple[Dict, bool]:
+    """Build the query matching model cards against free text.
+
+    Short fragments (e.g. the first letters of a word) would not match
+    whole words in the text index, so they are matched with a regex.
+
+    Args:
+        text (str): Search text
+
+    Returns:
+        Tuple[Dict, bool]: Query, and whether it uses the text index
+            (and so can be sorted by relevance)
+    """
+    text = text.strip()
+    if len(text) < config.SEARCH_TEXT_MIN_LENGTH:
+        pattern = {"$regex": re.escape(text), "$options": "i"}
+        return {
+            "$or": [{field: pattern} for field in REGEX_SEARCH_FIELDS]
+        }, False
+    return {"$text": {"$search": text}}, True
+
+
+async def backfill_derived_fields(
+    db: AsyncIOMotorDatabase, batch_size: int = 100
+):
+    """Add the `searchText`, `visibleTo` and `mediaRefs` fields to model
+    cards created before they existed.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+        batch_size (int, optional): Number of updates per write. Defaults to 100.
+    """
+    updates: List[UpdateOne] = []
+    async for card in db["models"].find(
+        {
+            "$or": [
+                {field: {"$exists": False}} for field in EXCLUDE_DERIVED_FIELDS
+            ]
+        },
+        {
+            "markdown": 1,
+            "performance": 1,
+            "accessControl": 1,
+            "creatorUserId": 1,
+            "lastModified": 1,
+        },
+    ):
+        updates.append(
+            UpdateOne(
+                # Skip cards updated in the meantime
+                {"_id": card["_id"], "lastModified": card.get("lastModified")},
+                {
+                    "$set": {
+                        "searchText": build_search_text(card),
+                        "visibleTo": build_visible_to(card),
+                        "mediaRefs": extract_media_refs(
+                            *(card.get(field) for field in CONTENT_FIELDS)
+                        ),
+                    }
+                },
+            )
+        )
+        if len(updates) >= batch_size:
+            await db["models"].bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        await db["models"].bulk_write(updates, ordered=False)
+
+
+async def prepare_search(db: AsyncIOMotorDatabase):
+    """Backfill the derived search fields of existing model cards.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+    """
+    global _visibility_ready
+    try:
+        await backfill_derived_fields(db)
+        _visibility_ready = True
+    except Exception as err:
+        print(
+            f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to backfill model card search fields: {err}"
+        )
@@ -0,0 +1,580 @@
+"""In-process BM25 index over model cards.
+
+Ranks free text search results by relevance and matches partial words
+without an external search engine. The index is built from the `models`
+collection on startup, kept up to date by model card writes in this
+process, and periodically synced with MongoDB to pick up writes made by
+other processes. It can be saved to a snapshot file so that a restart
+only has to reindex cards that changed since the snapshot was taken.
+"""
+import asyncio
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+import tempfile
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from colorama import Fore
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from ..config.config import config
+from .card_events import (
+    DELETED,
+    UPSERTED,
+    add_card_listener,
+    remove_card_listener,
+)
+from .search import TEXT_INDEX_WEIGHTS, build_search_text
+
+SNAPSHOT_VERSION = 1
+TOKEN_PATTERN = re.compile(r"\w+")
+# Score multiplier for terms that only match a query word as a prefix
+PREFIX_MATCH_WEIGHT = 0.5
+# Fields needed to index a model card
+INDEXED_PROJECTION = [
+    *TEXT_INDEX_WEIGHTS,
+    "markdown",
+    "performance",
+    "lastModified",
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words.
+
+    Args:
+        text (str): Text
+
+    Returns:
+        List[str]: Words, in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _card_fields(card: Dict) -> Iterable[Tuple[str, str]]:
+    for field in TEXT_INDEX_WEIGHTS:
+        if field == "searchText" and "searchText" not in card:
+            # Not backfilled yet
+            value = build_search_text(card)
+        else:
+            value = card.get(field)
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        if value:
+            yield field, str(value)
+
+
+def card_term_frequencies(card: Dict) -> Tuple[Dict[str, float], float]:
+    """Count the words of a model card, weighted by field.
+
+    Args:
+        card (Dict): Model card with camelCase keys
+
+    Returns:
+        Tuple[Dict[str, float], float]: Weighted frequency of each word,
+            and weighted length of the card
+    """
+    frequencies: Dict[str, float] = defaultdict(float)
+    length = 0.0
+    for field, text in _card_fields(card):
+        weight = TEXT_INDEX_WEIGHTS[field]
+        for token in tokenize(text):
+            frequencies[token] += weight
+            length += weight
+    return dict(frequencies), length
+
+
+class BM25Index:
+    """Inverted index ranking documents with Okapi BM25.
+
+    Field weights are applied to term frequencies and document lengths
+    (a simplified BM25F), so a word in the title counts as much as the
+    same word repeated in the body text several times.
+
+    Every query word must match a document, either exactly or as the
+    prefix of one of its words. All methods must be called from the
+    event loop thread.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_prefix_expansions: int = 50,
+    ):
+        """Initialize a BM25Index.
+
+        Args:
+            k1 (float, optional): Term frequency saturation. Defaults to 1.2.
+            b (float, optional): Document length normalization. Defaults to 0.75.
+            max_prefix_expansions (int, optional): Max number of indexed words
+                a query word is expanded to by prefix. Defaults to 50.
+        """
+        self.k1 = k1
+        self.b = b
+        self.max_prefix_expansions = max_prefix_expansions
+        self.ready = False  # whether the index reflects the database
+        self.dirty = False  # whether the index changed since the last snapshot
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._doc_versions: Dict[str, Optional[str]] = {}
+        self._terms: List[str] = []  # sorted, for prefix lookups
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def add(
+        self,
+        doc_id: str,
+        frequencies: Dict[str, float],
+        length: float,
+        version: Optional[str] = None,
+    ):
+        """Add a document, replacing any previous version of it.
+
+        Args:
+            doc_id (str): Document ID
+            frequencies (Dict[str, float]): Weighted frequency of each word
+            length (float): Weighted length of the document
+            version (Optional[str], optional): Used to detect stale documents
+                when syncing. Defaults to None.
+        """
+        self.remove(doc_id)
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._terms, term)
+            postings[doc_id] = frequency
+        self._doc_terms[doc_id] = frequencies
+        self._doc_lengths[doc_id] = length
+        self._doc_versions[doc_id] = version
+        self._total_length += length
+        self.dirty = True
+
+    def add_card(self, card: Dict):
+        """Add or replace a model card.
+
+        Args:
+            card (Dict): Model card document, including `_id`
+        """
+        frequencies, length = card_term_frequencies(card)
+        self.add(
+            str(card["_id"]), frequencies, length, card.get("lastModified")
+        )
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document.
+
+        Args:
+            doc_id (str): Document ID
+
+        Returns:
+            bool: Whether the document was indexed
+        """
+        frequencies = self._doc_terms.pop(doc_id, None)
+        if frequencies is None:
+            return False
+        for term in frequencies:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        self._doc_versions.pop(doc_id, None)
+        self.dirty = True
+        return True
+
+    def clear(self):
+        """Remove all documents."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._doc_versions.clear()
+        self._terms.clear()
+        self._total_length = 0.0
+        self.dirty = True
+
+    def versions(self) -> Dict[str, Optional[str]]:
+        """Get the version of every indexed document.
+
+        Returns:
+            Dict[str, Optional[str]]: Version by document ID
+        """
+        return dict(self._doc_versions)
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """Get the indexed words matching a query word, with their weight."""
+        matches = []
+        if token in self._postings:
+            matches.append((token, 1.0))
+        i = bisect_left(self._terms, token)
+        while (
+            i < len(self._terms)
+            and len(matches) < self.max_prefix_expansions
+            and self._terms[i].startswith(token)
+        ):
+            if self._terms[i] != token:
+                matches.append((self._terms[i], PREFIX_MATCH_WEIGHT))
+            i += 1
+        return matches
+
+    def search(
+        self, text: str, limit: Optional[int] = None
+    ) -> Optional[List[Tuple[str, float]]]:
+        """Find the documents matching every word of a query.
+
+        Args:
+            text (str): Query
+            limit (Optional[int], optional): Max number of results. Defaults to None.
+
+        Returns:
+            Optional[List[Tuple[str, float]]]: Document IDs and scores, best
+                match first. None if the index cannot answer the query
+                (not built yet, or the query has no words).
+        """
+        tokens = list(dict.fromkeys(tokenize(text)))
+        if not self.ready or not tokens:
+            return None
+        if not self._doc_terms:
+            return []
+        num_docs = len(self._doc_terms)
+        avg_length = self._total_length / num_docs or 1.0
+        expansions = [self._expand(token) for token in tokens]
+        # Start with the rarest word so later words only score survivors
+        expansions.sort(
+            key=lambda terms: sum(
+                len(self._postings[term]) for term, _ in terms
+            )
+        )
+        scores: Optional[Dict[str, float]] = None
+        for terms in expansions:
+            token_scores: Dict[str, float] = defaultdict(float)
+            for term, weight in terms:
+                postings = self._postings[term]
+                idf = math.log(
+                    1
+                    + (num_docs - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for doc_id, frequency in postings.items():
+                    if scores is not None and doc_id not in scores:
+                        continue
+                    norm = (
+                        1
+                        - self.b
+                        + self.b * self._doc_lengths[doc_id] / avg_length
+                    )
+                    score = (
+                        weight
+                        * idf
+                        * frequency
+                        * (self.k1 + 1)
+                        / (frequency + self.k1 * norm)
+                    )
+                    # Several prefix matches of one word count once
+                    if score > token_scores[doc_id]:
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = dict(token_scores)
+            else:
+                scores = {
+                    doc_id: scores[doc_id] + score
+                    for doc_id, score in token_scores.items()
+                }
+            if not scores:
+                return []
+
+        # Ties are broken by ID, i.e. newer model cards first
+        def rank(item: Tuple[str, float]):
+            return item[1], item[0]
+
+        if limit:
+            return heapq.nlargest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank, reverse=True)
+
+    def on_card_event(self, event: str, card: Dict, previous: Optional[Dict]):
+        """Keep the index up to date with model card writes.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+        if event == UPSERTED:
+            self.add_card(card)
+        elif event == DELETED:
+            self.remove(str(card["_id"]))
+
+    def to_snapshot(self) -> Dict:
+        """Get the contents of the index as a JSON serializable dictionary.
+
+        Returns:
+            Dict: Snapshot
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "documents": {
+                doc_id: {
+                    "terms": terms,
+                    "length": self._doc_lengths[doc_id],
+                    "version": self._doc_versions.get(doc_id),
+                }
+                for doc_id, terms in self._doc_terms.items()
+            },
+        }
+
+    def load_snapshot(self, snapshot: Dict):
+        """Replace the contents of the index with a snapshot.
+
+        Args:
+            snapshot (Dict): Snapshot created by `to_snapshot`
+
+        Raises:
+            ValueError: If the snapshot was created by an incompatible version
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported search index snapshot version: {snapshot.get('version')}"
+            )
+        self.clear()
+        for doc_id, doc in snapshot["documents"].items():
+            self.add(doc_id, doc["terms"], doc["length"], doc.get("version"))
+        self.dirty = False
+
+    def info(self) -> Dict:
+        """Get the size of the index.
+
+        Returns:
+            Dict: Readiness, number of documents and number of distinct words
+        """
+        return {
+            "ready": self.ready,
+            "documents": len(self._doc_terms),
+            "terms": len(self._postings),
+        }
+
+
+async def sync_search_index(
+    db: AsyncIOMotorDatabase, index: BM25Index, batch_size: int = 100
+) -> Tuple[int, int]:
+    """Bring the index up to date with the models collection.
+
+    Only the `lastModified` field of every card is read, and only new or
+    modified cards are fetched and reindexed.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+        index (BM25Index): Index to update
+        batch_size (int, optional): Number of cards fetched at a time. Defaults to 100.
+
+    Returns:
+        Tuple[int, int]: Number of cards reindexed and removed
+    """
+    known = index.versions()
+    seen = set()
+    stale: List[ObjectId] = []
+    async for card in db["models"].find({}, {"lastModified": 1}):
+        doc_id = str(card["_id"])
+        seen.add(doc_id)
+        if doc_id not in known or known[doc_id] != card.get("lastModified"):
+            stale.append(card["_id"])
+    removed = 0
+    for doc_id in set(known) - seen:
+        removed += index.remove(doc_id)
+    for start in range(0, len(stale), batch_size):
+        async for card in db["models"].find(
+            {"_id": {"$in": stale[start : start + batch_size]}},
+            INDEXED_PROJECTION,
+        ):
+            index.add_card(card)
+    index.ready = True
+    return len(stale), removed
+
+
+def _read_snapshot(path: str) -> Dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_snapshot(path: str, data: str):
+    # Write to a temporary file first so a crash never leaves half a
+    # snapshot. Each process gets its own, as workers may share the path.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".snapshot-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(
+            raw, "wt", encoding="utf-8"
+        ) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+async def load_search_index_snapshot(index: BM25Index, path: str) -> bool:
+    """Load the index from a snapshot file, if there is one.
+
+    Args:
+        index (BM25Index): Index to load into
+        path (str): Snapshot file
+
+    Returns:
+        bool: Whether the snapshot was loaded
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        snapshot = await asyncio.to_thread(_read_snapshot, path)
+        index.load_snapshot(snapshot)
+    except Exception as err:
+        print(
+            f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Ignoring search index snapshot {path}: {err}"
+        )
+        index.clear()
+        return False
+    return True
+
+
+async def save_search_index_snapshot(index: BM25Index, path: str):
+    """Save the index to a snapshot file.
+
+    Args:
+        index (BM25Index): Index to save
+        path (str): Snapshot file
+    """
+    # Serialize on the event loop so the index cannot change underneath
+    data = json.dumps(index.to_snapshot(), separators=(",", ":"))
+    index.dirty = False
+    await asyncio.to_thread(_write_snapshot, path, data)
+
+
+def ranked_filter(ranked_ids: List[str]) -> Dict:
+    """Get the filter matching the candidates found by the index.
+
+    Args:
+        ranked_ids (List[str]): Candidate IDs
+
+    Returns:
+        Dict: Query filter
+    """
+    return {"_id": {"$in": [ObjectId(doc_id) for doc_id in ranked_ids]}}
+
+
+async def fetch_ranked_page(
+    collection: AsyncIOMotorCollection,
+    query: Dict,
+    ranked_ids: List[str],
+    projection: Optional[object],
+    skip: int,
+    limit: int,
+) -> Tuple[List[Dict], int]:
+    """Get one page of documents in the order given by the index.
+
+    Only the IDs of candidates matching the other filters of the query
+    are read, and then only the documents on the requested page.
+
+    Args:
+        collection (AsyncIOMotorCollection): Collection to read from
+        query (Dict): Other filters the documents must match
+        ranked_ids (List[str]): Candidate IDs, best match first
+        projection (Optional[object]): Fields to return
+        skip (int): Number of documents to skip
+        limit (int): Page size, 0 for all documents
+
+    Returns:
+        Tuple[List[Dict], int]: Documents on the page, and total number of matches
+    """
+    id_filter = ranked_filter(ranked_ids)
+    ids = id_filter["_id"]["$in"]
+    matching = {
+        doc["_id"]
+        async for doc in collection.find(
+            {"$and": [query, id_filter]} if query else id_filter, {"_id": 1}
+        )
+    }
+    ordered = [oid for oid in ids if oid in matching]
+    page = ordered[skip : skip + limit] if limit else ordered[skip:]
+    if not page:
+        return [], len(ordered)
+    docs = await collection.find({"_id": {"$in": page}}, projection).to_list(
+        length=len(page)
+    )
+    by_id = {doc["_id"]: doc for doc in docs}
+    return [by_id[oid] for oid in page if oid in by_id], len(ordered)
+
+
+search_index = BM25Index()
+_sync_task: Optional[asyncio.Task] = None
+
+
+async def _maintain_search_index(db: AsyncIOMotorDatabase, interval: float):
+    """Build the index, then keep syncing it with the database.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+        interval (float): Seconds between syncs, 0 to only sync once
+    """
+    path = config.SEARCH_INDEX_SNAPSHOT_PATH
+    if path and await load_search_index_snapshot(search_index, path):
+        # Serve queries from the snapshot while catching up
+        search_index.ready = True
+    while True:
+        try:
+            await sync_search_index(db, search_index)
+            if path and search_index.dirty:
+                await save_search_index_snapshot(search_index, path)
+        except Exception as err:
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to sync search index: {err}"
+            )
+        if interval <= 0:
+            return
+        await asyncio.sleep(interval)
+
+
+def start_search_index(db: AsyncIOMotorDatabase):
+    """Build the search index in the background and keep it up to date.
+    Called on app startup.
+
+    Args:
+        db (AsyncIOMotorDatabase): Database
+    """
+    global _sync_task
+    if not config.SEARCH_INDEX_ENABLED:
+        return
+    add_card_listener(search_index.on_card_event)
+    if _sync_task is None or _sync_task.done():
+        _sync_task = asyncio.get_running_loop().create_task(
+            _maintain_search_index(db, config.SEARCH_INDEX_SYNC_INTERVAL)
+        )
+
+
+async def stop_search_index():
+    """Stop syncing the search index and save a snapshot. Called on app shutdown."""
+    global _sync_task
+    remove_card_listener(search_index.on_card_event)
+    if _sync_task is not None:
+        _sync_task.cancel()
+        _sync_task = None
+    path = config.SEARCH_INDEX_SNAPSHOT_PATH
+    if path and search_index.ready and search_index.dirty:
+        try:
+            await save_search_index_snapshot(search_index, path)
+        except Exception as err:
+            print(
+                f"{Fore.YELLOW}WARNING{Fore.WHITE}:  Failed to save search index snapshot: {err}"
+            )
@@ -0,0 +1,208 @@
+"""In-memory prefix index for typeahead suggestions on the model zoo."""
+import asyncio
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..config.config import config
+from .card_cache import CardCache
+from .card_events import DELETED
+from .search import PUBLIC_VISIBILITY, build_visible_to
+
+# Suggestion kind -> model card field
+SUGGEST_FIELDS = {
+    "title": "title",
+    "tag": "tags",
+    "framework": "frameworks",
+    "task": "task",
+    "creator": "creatorUserId",
+}
+
+# (kind, value)
+SuggestKey = Tuple[str, str]
+
+
+def card_suggest_values(card: Optional[Dict]) -> List[SuggestKey]:
+    """Get the values of a model card that can be suggested.
+
+    Only cards anyone can see are suggested, so that the titles of
+    restricted cards are not revealed while typing.
+
+    Args:
+        card (Optional[Dict]): Model card, or None
+
+    Returns:
+        List[SuggestKey]: Kind and value of each suggestion
+    """
+    if card is None or build_visible_to(card) != [PUBLIC_VISIBILITY]:
+        return []
+    values = set()
+    for kind, field in SUGGEST_FIELDS.items():
+        value = card.get(field)
+        items = value if isinstance(value, list) else [value]
+        values.update(
+            (kind, item) for item in items if isinstance(item, str) and item
+        )
+    return sorted(values)
+
+
+class SuggestIndex(CardCache):
+    """Sorted array of the suggestable values of all model cards, with
+    the number of cards having each value.
+
+    Completions of a prefix are found by binary search, so suggestions
+    never hit MongoDB. The index is rebuilt on startup and every
+    `refresh_interval` seconds, and adjusted in between as cards are
+    written.
+    """
+
+    description = "model card suggestions"
+
+    def __init__(self, refresh_interval: float = 300):
+        """Initialize a SuggestIndex.
+
+        Args:
+            refresh_interval (float, optional): Seconds between full rebuilds,
+                0 to only rebuild on startup. Defaults to 300.
+        """
+        super().__init__(refresh_interval)
+        self.ready = False
+        self._counts: Dict[SuggestKey, int] = {}
+        # (casefolded value, kind, value), sorted
+        self._keys: List[Tuple[str, str, str]] = []
+        self._build_lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _add(self, key: SuggestKey):
+        count = self._counts.get(key, 0)
+        if count == 0:
+            kind, value = key
+            insort(self._keys, (value.casefold(), kind, value))
+        self._counts[key] = count + 1
+
+    def _remove(self, key: SuggestKey):
+        count = self._counts.get(key, 0)
+        if count > 1:
+            self._counts[key] = count - 1
+        elif count == 1:
+            del self._counts[key]
+            kind, value = key
+            entry = (value.casefold(), kind, value)
+            i = bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                del self._keys[i]
+
+    def load(self, cards: Iterable[Dict]):
+        """Replace the index with the values of the given cards.
+
+        Args:
+            cards (Iterable[Dict]): Model cards
+        """
+        counts: Dict[SuggestKey, int] = {}
+        for card in cards:
+            for key in card_suggest_values(card):
+                counts[key] = counts.get(key, 0) + 1
+        self._counts = counts
+        self._keys = sorted(
+            (value.casefold(), kind, value) for kind, value in counts
+        )
+        self.ready = True
+
+    def suggest(
+        self,
+        prefix: str,
+        limit: int = 10,
+        kinds: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """Get the most common values starting with a prefix.
+
+        Args:
+            prefix (str): Start of the value, case insensitive
+            limit (int, optional): Max number of suggestions. Defaults to 10.
+            kinds (Optional[List[str]], optional): Only suggest these kinds.
+                Defaults to None (all kinds).
+
+        Returns:
+            List[Dict]: Value, kind and number of cards of each suggestion,
+                most common first
+        """
+        prefix = prefix.strip().casefold()
+        if not prefix:
+            return []
+        start = bisect_left(self._keys, (prefix,))
+        matches = []
+        for i in range(start, len(self._keys)):
+            folded, kind, value = self._keys[i]
+            if not folded.startswith(prefix):
+                break
+            if kinds is None or kind in kinds:
+                matches.append((self._counts[(kind, value)], kind, value))
+        # Most common first, then shortest and alphabetical
+        top = heapq.nsmallest(
+            limit, matches, key=lambda m: (-m[0], len(m[2]), m[2], m[1])
+        )
+        return [
+            {"value": value, "kind": kind, "count": count}
+            for count, kind, value in top
+        ]
+
+    def on_card_event(self, event: str, card: Dict, previous: Optional[Dict]):
+        """Update the index after a model card is written.
+
+        Args:
+            event (str): Event type
+            card (Dict): Model card document
+            previous (Optional[Dict]): Previous version of the card
+        """
+        old = card_suggest_values(previous)
+        new = card_suggest_values(None if event == DELETED else card)
+        for key in set(old) - set(new):
+            self._remove(key)
+        for key in set(new) - set(old):
+            self._add(key)
+
+    async def rebuild(self, db: AsyncIOMotorDatabase):
+        """Rebuild the index from all model cards.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+        """
+        projection = {field: 1 for field in SUGGEST_FIELDS.values()}
+        projection["accessControl"] = 1
+        cards = await db["models"].find({}, projection).to_list(length=None)
+        self.load(cards)
+
+    async def ensure_ready(self, db: AsyncIOMotorDatabase):
+        """Build the index if it was not built yet.
+
+        Concurrent callers wait for the same build, so a burst of requests
+        before the first build scans the collection only once.
+
+        Args:
+            db (AsyncIOMotorDatabase): Database
+        """
+        if self.ready:
+            return
+        # Created lazily so that it belongs to the running event loop
+        if self._build_lock is None:
+            self._build_lock = asyncio.Lock()
+        async with self._build_lock:
+            if not self.ready:
+                await self.rebuild(db)
+
+    def info(self) -> Dict:
+        """Get information about the index.
+
+        Returns:
+            Dict: Whether the index is built, and its number of values
+        """
+        return {"ready": self.ready, "values": len(self._keys)}
+
+
+suggest_index = SuggestIndex(
+    refresh_interval=config.SUGGEST_INDEX_REFRESH_INTERVAL
+)
@@ -1,12 +1,12 @@
 """Tasks to clean up app of any unused media resources (e.g. images)."""
 from typing import List, Set
 
-from bs4 import BeautifulSoup
 from minio.deleteobjects import DeleteObject
 
 from ...config.config import config
 from ..dependencies.minio_client import minio_api_client
 from ..dependencies.mongo_client import get_db
+from ..preprocess_html import extract_media_refs
 
 
 async def delete_orphan_images():
@@ -25,23 +25,38 @@ async def delete_orphan_images():
     object_names: Set[str] = set([obj.object_name for obj in objects])
     print(f"INFO: There are {len(object_names)} objects currently stored.")
 
-    # Get all markup
-    model_cards: List[dict] = await (
-        db["models"].find({}, {"markdown": 1, "performance": 1})
+    # Get the media referenced by each card, and the markup of cards
+    # saved before references were recorded
+    model_cards: List[dict] = await db["models"].aggregate(
+        [
+            {
+                "$project": {
+                    "mediaRefs": 1,
+                    **{
+                        field: {
+                            "$cond": [
+                                {"$isArray": "$mediaRefs"},
+                                "$$REMOVE",
+                                f"${field}",
+                            ]
+                        }
+                        for field in ("markdown", "performance")
+                    },
+                }
+            }
+        ]
     ).to_list(length=None)
 
-    # From markdown and performance, extract all image tags
     image_sources: Set[str] = set()
     prefix = f"s3://{bucket_name}/"
 
     for card in model_cards:
-        for field in ("markdown", "performance"):
-            parser = BeautifulSoup(card[field], "lxml")
-            images = parser.find_all("img")
-            for image in images:
-                source: str = image["src"]
-                if not source.startswith(prefix):
-                    continue
+        refs = card.get("mediaRefs")
+        if refs is None:
+            # From markdown and performance, extract all image tags
+            refs = extract_media_refs(card.get("markdown"), card.get("performance"))
+        for source in refs:
+            if source.startswith(prefix):
                 image_sources.add(source.removeprefix(prefix))
 
     # Do a set difference to get orphaned objects
@@ -3,6 +3,7 @@ import json
 from colorama import Fore
 from fastapi import Depends
 
+from ..counts import count_cache
 from ..dependencies.mongo_client import get_db
 from ..dependencies.minio_client import (
     minio_api_client,
@@ -13,6 +14,7 @@ from ..dependencies.minio_client import (
 
 from ...config.config import config
 from ...internal.preprocess_html import process_html_to_base64
+from ...internal.search import EXCLUDE_DERIVED_FIELDS
 from ...models.common import S3Storage
 from ...models.iam import TokenData
 from ...models.model import ModelCardPackage
@@ -48,13 +50,15 @@ async def export_selected_models(
                             "models": pkg,
                         }
                     )
+                    count_cache.invalidate("exports")
                     for x in pkg:
                         try:
                             existing_card = await db["models"].find_one(
                                 {
                                     "modelId": x["model_id"],
                                     "creatorUserId": x["creator_user_id"],
-                                }
+                                },
+                                EXCLUDE_DERIVED_FIELDS,
                             )
 
                             existing_card["markdown"] = await process_html_to_base64(
@@ -1,6 +1,8 @@
 """AI Appstore Main Module"""
 from pathlib import Path
+import asyncio
 import logging
+from typing import List
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,8 +14,27 @@ from fastapi.openapi.docs import (
 from fastapi.staticfiles import StaticFiles
 
 from .config.config import config
-from .internal.keycloak_auth import get_current_user, check_is_admin
-from .routers import buckets, datasets, engines, experiments, models, exports, accesscontrol
+from .internal.cluster_state import cluster_state, start_cluster_state
+from .internal.dependencies.k8s_client import (
+    close_k8s_client,
+    get_async_k8s_client,
+)
+from .internal.dependencies.minio_client import (
+    close_minio_connection,
+    start_minio_health_check,
+)
+from .internal.dependencies.mongo_client import (
+    close_mongo_connection,
+    connect_to_mongo,
+    get_db,
+)
+from .internal.facets import facet_cache
+from .internal.indexes import ensure_indexes
+from .internal.search import prepare_search
+from .internal.search_index import start_search_index, stop_search_index
+from .internal.suggest import suggest_index
+from .internal.keycloak_auth import get_current_user, check_is_admin, jwks_cache
+from .routers import buckets, datasets, engines, experiments, models, exports, accesscontrol, metrics
 
 with open(
     Path(__file__).parent.parent.joinpath("README.md"), "r", encoding="utf-8"
@@ -53,6 +74,10 @@ tags_metadata = [
         "name": "Buckets",
         "description": "APIs to allow for upload and retrieval of media from S3 Storage (MinIO)",
     },
+    {
+        "name": "Metrics",
+        "description": "APIs for system admins to inspect runtime metrics of the back-end",
+    },
 ]
 fastapi_app = FastAPI(
     title="Model Zoo",
@@ -65,6 +90,41 @@ fastapi_app.mount("/static", StaticFiles(directory="static"), name="static")
 
 logging.getLogger('asyncio').setLevel(logging.CRITICAL)
 
+# One off startup work, kept referenced so it is not garbage collected
+_startup_tasks: List[asyncio.Task] = []
+
+
+@fastapi_app.on_event("startup")
+async def startup():
+    """Create shared connections used by the routers and background tasks."""
+    connect_to_mongo()
+    # Index and backfill in the background so startup is not held up
+    loop = asyncio.get_running_loop()
+    _startup_tasks.append(loop.create_task(ensure_indexes(get_db()[0])))
+    _startup_tasks.append(loop.create_task(prepare_search(get_db()[0])))
+    start_search_index(get_db()[0])
+    facet_cache.start(get_db()[0])
+    suggest_index.start(get_db()[0])
+    await start_minio_health_check()
+    jwks_cache.start_background_refresh()
+    start_cluster_state(get_async_k8s_client())
+
+
+@fastapi_app.on_event("shutdown")
+async def shutdown():
+    """Release shared connections."""
+    while _startup_tasks:
+        _startup_tasks.pop().cancel()
+    await stop_search_index()
+    facet_cache.stop()
+    suggest_index.stop()
+    close_mongo_connection()
+    await close_minio_connection()
+    cluster_state.stop()
+    close_k8s_client()
+    jwks_cache.stop_background_refresh()
+
+
 app = CORSMiddleware(
     fastapi_app,
     allow_origins=[str(origin) for origin in config.FRONTEND_HOST],
@@ -106,6 +166,7 @@ app.app.include_router(exports.router, dependencies=[Depends(check_is_admin)])
 app.app.include_router(datasets.router, dependencies=[Depends(get_current_user)])
 app.app.include_router(engines.router, dependencies=[Depends(get_current_user)])
 app.app.include_router(accesscontrol.router, dependencies=[Depends(get_current_user)])
+app.app.include_router(metrics.router, dependencies=[Depends(check_is_admin)])
 
 @app.app.get("/")
 def root():
@@ -15,6 +15,7 @@ class ExportsPage(BaseModel):
     userId: str = ""
     time_initiated_range: Union[str, dict, None] = {"from": "", "to": ""}
     time_completed_range: Union[str, dict, None] = {"from": "", "to": ""}
+    cursor: Optional[str] = None  # nextCursor of the previous page
 
     @validator("userId")
     def id_is_empty(cls, v: str) -> Optional[str]:
@@ -1,5 +1,5 @@
 """Data models for model cards."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from bson import ObjectId
 from pydantic import BaseModel, Field, validator
@@ -123,13 +123,45 @@ class GetFilterResponseModel(BaseModel):
     tags: List[str]
     frameworks: List[str]
     tasks: List[str]
+    counts: Optional[Dict[str, Dict[str, int]]] = None  # cards per value
 
 
 class SearchModelResponse(BaseModel):
     """Response model for searching model cards."""
 
+    results: List
+    total: Optional[int] = Field(default=None, ge=0)
+    has_more: Optional[bool] = Field(default=None, alias="hasMore")
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
+
+
+class SearchCountResponse(BaseModel):
+    """Response model for counting the results of a model card search."""
+
+    total: int = Field(..., ge=0)
+
+
+class FacetedSearchResponse(BaseModel):
+    """Response model for searching model cards with filter counts."""
+
     results: List
     total: int = Field(..., ge=0)
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
+    facets: Dict[str, Dict[str, int]]  # cards per tag, framework and task
+
+
+class Suggestion(BaseModel):
+    """A completion of the text typed in the search box."""
+
+    value: str
+    kind: str  # title, tag, framework, task or creator
+    count: int = Field(..., ge=0)  # cards with this value
+
+
+class SuggestResponse(BaseModel):
+    """Response model for typeahead suggestions."""
+
+    suggestions: List[Suggestion]
 
 
 class ModelCardCompositeKey(BaseModel):
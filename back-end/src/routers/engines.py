@@ -1,7 +1,7 @@
 """Endpoints for Inference Engine Services"""
 import asyncio
 import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.error import HTTPError
 from uuid import uuid4
 
@@ -11,11 +11,12 @@ from fastapi import (
     Depends,
     HTTPException,
     Path,
+    Query,
     Request,
     status,
 )
 from fastapi.encoders import jsonable_encoder
-from kubernetes.client import ApiClient, AppsV1Api, CoreV1Api, CustomObjectsApi
+from kubernetes.client import V1Deployment, V1Pod
 from kubernetes.client.rest import ApiException as K8sAPIException
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import DuplicateKeyError
@@ -23,9 +24,27 @@ from sse_starlette.sse import EventSourceResponse
 from yaml import safe_load
 
 from ..config.config import config
-from ..internal.keycloak_auth import get_current_user 
-from ..internal.dependencies.k8s_client import get_k8s_client
+from ..internal.cluster_state import (
+    DEPLOYMENTS,
+    IE_LABEL_SELECTOR,
+    KNATIVE_SERVICES,
+    PODS,
+    SERVICES,
+    cluster_state,
+)
+from ..internal.keycloak_auth import get_current_user
+from ..internal.dependencies.k8s_client import (
+    AsyncK8sClient,
+    get_async_k8s_client,
+)
 from ..internal.dependencies.mongo_client import get_db
+from ..internal.ingress import build_inference_url, ingress_resolver
+from ..internal.pod_logs import (
+    ByteRateLimiter,
+    LogStreamEnded,
+    follow_service_logs,
+    log_broadcasters,
+)
 from ..internal.tasks import delete_orphan_services
 from ..internal.templates import template_env
 from ..internal.utils import k8s_safe_name, uncased_to_snake_case
@@ -41,27 +60,281 @@ from ..models.iam import TokenData, UserRoles
 router = APIRouter(prefix="/engines", tags=["Inference Engines"])
 
 
+def _not_found(kind: str, name: str) -> K8sAPIException:
+    """Create the error the K8S API would raise for a missing object.
+
+    Args:
+        kind (str): Resource kind
+        name (str): Name of the object
+
+    Returns:
+        K8sAPIException: 404 Not Found error
+    """
+    return K8sAPIException(status=404, reason=f"{kind} {name} not found")
+
+
+async def _get_service_pods(k8s: AsyncK8sClient, service_name: str) -> List:
+    """Get the pods of an inference service, from the cluster state cache
+    if it is synced.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+        service_name (str): Name of the service
+
+    Returns:
+        List: Pods of the service
+    """
+    if cluster_state.is_synced(PODS):
+        return cluster_state.get_pods(service_name)
+    pods = await k8s.call(
+        k8s.core.list_namespaced_pod,
+        namespace=config.IE_NAMESPACE,
+        label_selector=f"app={service_name}",
+    )
+    return pods.items
+
+
+async def _get_knative_service(k8s: AsyncK8sClient, service_name: str) -> Dict:
+    """Get a KNative service, from the cluster state cache if it is synced.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+        service_name (str): Name of the service
+
+    Raises:
+        K8sAPIException: 404 Not Found if the service does not exist
+
+    Returns:
+        Dict: KNative service
+    """
+    if cluster_state.is_synced(KNATIVE_SERVICES):
+        kservice = cluster_state.get(KNATIVE_SERVICES, service_name)
+        if kservice is None:
+            raise _not_found("KService", service_name)
+        return kservice
+    return await k8s.call(
+        k8s.custom.get_namespaced_custom_object,
+        group="serving.knative.dev",
+        version="v1",
+        namespace=config.IE_NAMESPACE,
+        plural="services",
+        name=service_name,
+    )
+
+
+async def _get_emissary_resources(
+    k8s: AsyncK8sClient, service_name: str
+) -> Tuple[V1Deployment, List[V1Pod]]:
+    """Get the deployment and pods of an Emissary service, checking that
+    the K8S service exists. Uses the cluster state cache if it is synced.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+        service_name (str): Name of the service
+
+    Raises:
+        K8sAPIException: 404 Not Found if the service or deployment does not exist
+
+    Returns:
+        Tuple[V1Deployment, List[V1Pod]]: Deployment and its pods
+    """
+    deployment_name = service_name + "-deployment"
+    if cluster_state.is_synced(SERVICES, DEPLOYMENTS, PODS):
+        if cluster_state.get(SERVICES, service_name) is None:
+            raise _not_found("Service", service_name)
+        deployment = cluster_state.get(DEPLOYMENTS, deployment_name)
+        if deployment is None:
+            raise _not_found("Deployment", deployment_name)
+        return deployment, cluster_state.get_pods(service_name)
+    # Check that service exists, get deployment status
+    # and pods in deployment concurrently
+    _, deployment, pods = await asyncio.gather(
+        k8s.call(
+            k8s.core.read_namespaced_service,
+            name=service_name,
+            namespace=config.IE_NAMESPACE,
+        ),
+        k8s.call(
+            k8s.apps.read_namespaced_deployment_status,
+            name=deployment_name,
+            namespace=config.IE_NAMESPACE,
+        ),
+        k8s.call(
+            k8s.core.list_namespaced_pod,
+            namespace=config.IE_NAMESPACE,
+            label_selector=f"app={service_name}",
+        ),
+    )
+    return deployment, pods.items
+
+
+def _set_knative_service_status(
+    return_status: InferenceServiceStatus, kservice: Dict
+):
+    """Fill in the status of a KNative service.
+
+    Args:
+        return_status (InferenceServiceStatus): Status to update
+        kservice (Dict): KNative service
+    """
+    status_conditions = kservice.get("status", {}).get("conditions")
+    if not status_conditions:
+        # Not reconciled yet
+        return_status.ready = False
+        return_status.message += "Message: Service has no status yet"
+        return
+
+    # Check if service is ready
+    for condition in status_conditions:
+        # if not ready return response
+        if condition["status"] != "True":
+            return_status.ready = False
+            return_status.message += f"Message: {condition}"
+            break
+    # TODO: Check if pod can even be scheduled
+
+
+async def _list_knative_services(k8s: AsyncK8sClient) -> Dict[str, Dict]:
+    """Get all KNative inference services in one call, from the cluster
+    state cache if it is synced.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+
+    Returns:
+        Dict[str, Dict]: KNative services by name
+    """
+    if cluster_state.is_synced(KNATIVE_SERVICES):
+        return {
+            name: cluster_state.get(KNATIVE_SERVICES, name)
+            for name in cluster_state.names(KNATIVE_SERVICES)
+        }
+    results = await k8s.call(
+        k8s.custom.list_namespaced_custom_object,
+        group="serving.knative.dev",
+        version="v1",
+        namespace=config.IE_NAMESPACE,
+        plural="services",
+        label_selector=IE_LABEL_SELECTOR,
+    )
+    return {item["metadata"]["name"]: item for item in results["items"]}
+
+
+async def _list_emissary_resources(
+    k8s: AsyncK8sClient,
+) -> Tuple[Set[str], Dict[str, V1Deployment], Dict[str, List[V1Pod]]]:
+    """Get all Emissary inference services, deployments and pods with one
+    list call per resource type, or from the cluster state cache if it is
+    synced.
+
+    Args:
+        k8s (AsyncK8sClient): K8S client
+
+    Returns:
+        Tuple[Set[str], Dict[str, V1Deployment], Dict[str, List[V1Pod]]]: Service
+            names, deployments by name and pods by service name
+    """
+    if cluster_state.is_synced(SERVICES, DEPLOYMENTS, PODS):
+        service_names = set(cluster_state.names(SERVICES))
+        deployments = {
+            name: cluster_state.get(DEPLOYMENTS, name)
+            for name in cluster_state.names(DEPLOYMENTS)
+        }
+        pods = {name: cluster_state.get_pods(name) for name in service_names}
+        return service_names, deployments, pods
+    services, deployment_list, pod_list = await asyncio.gather(
+        k8s.call(
+            k8s.core.list_namespaced_service,
+            namespace=config.IE_NAMESPACE,
+            label_selector=IE_LABEL_SELECTOR,
+        ),
+        k8s.call(
+            k8s.apps.list_namespaced_deployment,
+            namespace=config.IE_NAMESPACE,
+            label_selector=IE_LABEL_SELECTOR,
+        ),
+        k8s.call(
+            k8s.core.list_namespaced_pod,
+            namespace=config.IE_NAMESPACE,
+            label_selector=IE_LABEL_SELECTOR,
+        ),
+    )
+    service_names = {service.metadata.name for service in services.items}
+    deployments = {
+        deployment.metadata.name: deployment
+        for deployment in deployment_list.items
+    }
+    pods: Dict[str, List[V1Pod]] = {}
+    for pod in pod_list.items:
+        app = (pod.metadata.labels or {}).get("app")
+        if app is not None:
+            pods.setdefault(app, []).append(pod)
+    return service_names, deployments, pods
+
+
+def _set_emissary_service_status(
+    return_status: InferenceServiceStatus,
+    deployment: V1Deployment,
+    pods: List[V1Pod],
+):
+    """Fill in the status of an Emissary service.
+
+    Args:
+        return_status (InferenceServiceStatus): Status to update
+        deployment (V1Deployment): Deployment of the service
+        pods (List[V1Pod]): Pods in the deployment
+    """
+    # Get replicas (expected)
+    return_status.expected_replicas = int(
+        deployment.status.replicas if deployment.status.replicas else 0
+    )
+    for condition in deployment.status.conditions or []:
+        if condition.status != "True":
+            return_status.ready = False
+            return_status.message += (
+                f"Message: {condition.message}\nReason: {condition.reason}"
+            )
+    # Find out if pods in deployment are schedulable
+    for pod in pods:
+        pod_status = pod.status
+        return_status.status = pod_status.phase
+        for condition in pod_status.conditions or []:
+            if condition.type == "PodScheduled" and condition.status != "True":
+                return_status.schedulable = False
+                return_status.message += (
+                    f"Message: {condition.message}\nReason: {condition.reason}"
+                )
+
+
 @router.get("/{service_name}/logs")
 async def get_inference_engine_service_logs(
     service_name: str,
     request: Request,
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    tail_lines: int = Query(default=100, alias="tailLines", ge=0),
+    container: Optional[str] = Query(default=None),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db=Depends(get_db),
     user: TokenData = Depends(get_current_user),
 ) -> EventSourceResponse:
-    """Get logs for an inference service
+    """Stream logs of an inference service. The last `tailLines` lines
+    are sent first, followed by new lines as they are written. The stream
+    follows the service across pod restarts.
 
     Args:
         service_name (str): Name of the service
         request (Request): FastAPI Request object
-        k8s_client (ApiClient, optional): K8S Client. Defaults to Depends(get_k8s_client).
+        tail_lines (int, optional): Number of existing lines to send first, up to
+            LOG_STREAM_BUFFER_LINES. Defaults to Query(default=100, alias="tailLines", ge=0).
+        container (Optional[str], optional): Container to stream logs of.
+            Defaults to all containers of the pod.
+        k8s (AsyncK8sClient, optional): K8S Client. Defaults to Depends(get_async_k8s_client).
 
     Raises:
-        HTTPException: 404 Not Found if service does not exist
+        HTTPException: 404 Not Found if service or container does not exist
         HTTPException: 500 Internal Server Error if there is an error getting the service logs
 
     Returns:
-        EventSourceResponse: SSE response with logs
+        EventSourceResponse: SSE response with batches of new log lines
     """
     db, _ = db
     existing_service = await db["services"].find_one(
@@ -76,45 +349,71 @@ async def get_inference_engine_service_logs(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User does not have owner access to KService",
         )
-    with k8s_client:
-        core_v1 = CoreV1Api(k8s_client)
-        # Get pod name
-        try:
-            pod = core_v1.list_namespaced_pod(
-                namespace=config.IE_NAMESPACE,
-                label_selector=f"app={service_name}",
+    # Get containers of the pod
+    try:
+        pods = await _get_service_pods(k8s, service_name)
+        if len(pods) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Service not found",
             )
-            if len(pod.items) == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Service not found",
-                )
-            pod_name = pod.items[0].metadata.name
-        except K8sAPIException as err:
+        containers = [c.name for c in pods[0].spec.containers]
+    except K8sAPIException as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting service logs: {err}",
+        ) from err
+    if container is not None:
+        if container not in containers:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error getting service logs: {err}",
-            ) from err
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Container {container} not found",
+            )
+        containers = [container]
+
+    # All viewers of the same logs share one upstream stream
+    broadcaster = log_broadcasters.get(
+        (service_name, tuple(containers)),
+        lambda tail: follow_service_logs(
+            k8s,
+            config.IE_NAMESPACE,
+            lambda: _get_service_pods(k8s, service_name),
+            containers,
+            tail_lines=tail,
+        ),
+        buffer_lines=config.LOG_STREAM_BUFFER_LINES,
+    )
 
-        async def event_streamer():
+    async def event_streamer():
+        limiter = ByteRateLimiter(config.LOG_STREAM_MAX_BYTES_PER_SECOND)
+        subscription = broadcaster.subscribe(
+            tail_lines, max_lines=config.LOG_STREAM_BUFFER_LINES
+        )
+        try:
             while True:
+                try:
+                    lines = await subscription.get()
+                except LogStreamEnded as err:
+                    # Close the stream, the client reconnects to retry
+                    yield {"event": "end", "data": str(err)}
+                    break
                 # If the client disconnects, stop the stream
                 if await request.is_disconnected():
                     break
-                logs = core_v1.read_namespaced_pod_log(
-                    name=pod_name, namespace=config.IE_NAMESPACE, pretty=True
-                )
+                logs = "\n".join(lines)
+                await limiter.wait(len(logs.encode()))
                 yield logs
-                await asyncio.sleep(5)
+        finally:
+            subscription.close()
 
-        return EventSourceResponse(event_streamer())
+    return EventSourceResponse(event_streamer())
 
 
 @router.patch("/{service_name}/scale/{replicas}")
 async def scale_inference_engine_deployments(
     service_name: str,
     replicas: int = Path(ge=0, le=3),
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
 ) -> Dict:
     """Scale the number of replicas of the deployment
@@ -122,45 +421,113 @@ async def scale_inference_engine_deployments(
     Args:
         service_name (str): Name of the service
         replicas (int, optional): Number of replicas. Defaults to Path(ge=0, le=3).
-        k8s_client (ApiClient, optional): K8S Client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S Client. Defaults to Depends(get_async_k8s_client).
 
     Raises:
         HTTPException: 404 Not Found if service does not exist
         HTTPException: 500 Internal Server Error if there is an error scaling the service
     """
-    with k8s_client:
-        apps_v1 = AppsV1Api(k8s_client)
-        db, _ = db
-        service = await db["services"].find_one({"serviceName": service_name})
-        if service is None:
+    db, _ = db
+    service = await db["services"].find_one({"serviceName": service_name})
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found",
+        )
+    # Scale deployment
+    # Check type of service
+    if service["backend"] == ServiceBackend.EMISSARY:
+        try:
+            await k8s.call(
+                k8s.apps.patch_namespaced_deployment_scale,
+                name=service_name + "-deployment",
+                namespace=config.IE_NAMESPACE,
+                body={"spec": {"replicas": replicas}},
+            )
+            return {
+                "message": "Deployment scaled successfully",
+                "replicas": replicas,
+            }
+        except K8sAPIException as err:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Service not found",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error scaling deployment: {err}",
+            ) from err
+
+
+@router.get("/status", response_model=Dict[str, InferenceServiceStatus])
+async def get_inference_engine_service_statuses(
+    service_names: List[str] = Query(alias="names[]"),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
+    db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
+) -> Dict:
+    """Get status of many inference services at once. Uses a constant number
+    of database and K8S calls regardless of the number of services.
+
+    Args:
+        service_names (List[str]): Names of the services
+        k8s (AsyncK8sClient, optional): K8S Client. Defaults to Depends(get_async_k8s_client).
+        db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
+            Defaults to Depends(get_db).
+
+    Raises:
+        HTTPException: 500 Internal Server Error if there is an error getting the service status
+
+    Returns:
+        Dict: Status of each service by service name. Services that do not
+            exist in the database or the cluster are left out.
+    """
+    db, _ = db
+    services = (
+        await db["services"]
+        .find(
+            {"serviceName": {"$in": service_names}},
+            {"serviceName": 1, "backend": 1},
+        )
+        .to_list(length=None)
+    )
+    backends = {
+        service["serviceName"]: service.get("backend", config.IE_SERVICE_TYPE)
+        for service in services
+    }
+    statuses = {}
+    try:
+        if ServiceBackend.KNATIVE in backends.values():
+            kservices = await _list_knative_services(k8s)
+        if ServiceBackend.EMISSARY in backends.values():
+            (
+                k8s_services,
+                deployments,
+                pods,
+            ) = await _list_emissary_resources(k8s)
+    except K8sAPIException as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting service status. {err}",
+        ) from err
+    for service_name, service_backend in backends.items():
+        return_status = InferenceServiceStatus(service_name=service_name)
+        if service_backend == ServiceBackend.KNATIVE:
+            if service_name not in kservices:
+                continue
+            _set_knative_service_status(return_status, kservices[service_name])
+        elif service_backend == ServiceBackend.EMISSARY:
+            deployment = deployments.get(service_name + "-deployment")
+            if service_name not in k8s_services or deployment is None:
+                continue
+            _set_emissary_service_status(
+                return_status, deployment, pods.get(service_name, [])
             )
-        # Scale deployment
-        # Check type of service
-        if service["backend"] == ServiceBackend.EMISSARY:
-            try:
-                apps_v1.patch_namespaced_deployment_scale(
-                    name=service_name + "-deployment",
-                    namespace=config.IE_NAMESPACE,
-                    body={"spec": {"replicas": replicas}},
-                )
-                return {
-                    "message": "Deployment scaled successfully",
-                    "replicas": replicas,
-                }
-            except K8sAPIException as err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Error scaling deployment: {err}",
-                ) from err
+        else:
+            continue
+        statuses[service_name] = return_status.dict(by_alias=True)
+    return statuses
 
 
 @router.get("/{service_name}", response_model=InferenceEngineService)
 async def get_inference_engine_service(
     service_name: str,
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
 ) -> Dict:
     """Get Inference Engine Service
@@ -172,6 +539,7 @@ async def get_inference_engine_service(
 
     Raises:
         HTTPException: 404 Not Found if service does not exist
+        HTTPException: 422 Unprocessable Entity if the ingress is not configured
 
     Returns:
         Dict: Service details
@@ -188,50 +556,18 @@ async def get_inference_engine_service(
         else:
             protocol = service["protocol"]
         path = service["path"]
-        # Deploy Service on K8S
-        with k8s_client as client:
-            # Get KNative Serving Ext Ip
-            core_api = CoreV1Api(client)
-            service_backend = config.IE_SERVICE_TYPE or ServiceBackend.EMISSARY
-            if config.IE_DOMAIN:
-                host = config.IE_DOMAIN
-            else:
-                if service_backend == ServiceBackend.KNATIVE:
-                    ingress_name = "kourier"
-                    ingress_namespace = "kourier-system"
-                elif service_backend == ServiceBackend.EMISSARY:
-                    ingress_name = "emissary-ingress"
-                    ingress_namespace = "emissary"
-                else:
-                    if config.IE_INGRESS_NAME and config.IE_INGRESS_NAMESPACE:
-                        ingress_name = config.IE_INGRESS_NAME
-                        ingress_namespace = config.IE_INGRESS_NAMESPACE
-                    else:
-                        raise HTTPException(
-                            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                            detail="No Ingress specified",
-                        )
-                ingress = core_api.read_namespaced_service(
-                    name=ingress_name, namespace=ingress_namespace
-                )
-                
-                if ingress.spec.load_balancer_ip:
-                    host = ingress.spec.load_balancer_ip
-                else:
-                    host = ingress.status.load_balancer.ingress[0].ip
+        service_backend = config.IE_SERVICE_TYPE or ServiceBackend.EMISSARY
         # Generate service url
-        if service_backend == ServiceBackend.EMISSARY:
-            url = f"{protocol}://{host}/{path}/"  # need to add trailing slash for ambassador
-        elif service_backend == ServiceBackend.KNATIVE:
-            url = f"{protocol}://{service_name}.{config.IE_NAMESPACE}.{host}"
-            if not config.IE_DOMAIN:
-                # use sslip dns service to get a hostname for the service
-                url += ".sslip.io"
-        else:
+        try:
+            host = await ingress_resolver.get_host(k8s, service_backend)
+            url = build_inference_url(
+                protocol, host, service_backend, service_name, path
+            )
+        except ValueError as err:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid Service Backend",
-            )
+                detail=str(err),
+            ) from err
         service["inferenceUrl"] = url
     except K8sAPIException as err:
         print(f"Error getting service url: {err}")
@@ -242,7 +578,7 @@ async def get_inference_engine_service(
 @router.get("/{service_name}/status", response_model=InferenceServiceStatus)
 async def get_inference_engine_service_status(
     service_name: str,
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
 ) -> Dict:
     """Get status of an inference service. This is typically
@@ -250,7 +586,7 @@ async def get_inference_engine_service_status(
 
     Args:
         service_name (str): Name of the service
-        k8s_client (ApiClient, optional): K8S Client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S Client. Defaults to Depends(get_async_k8s_client).
 
     Raises:
         HTTPException: 404 Not Found if service does not exist
@@ -259,7 +595,6 @@ async def get_inference_engine_service_status(
     Returns:
         Dict: Service status
     """
-    # Sync endpoint to allow for concurrent request
     db, _ = db
     try:
         return_status = InferenceServiceStatus(
@@ -272,66 +607,15 @@ async def get_inference_engine_service_status(
             service_backend = service["backend"]
         else:
             service_backend = config.IE_SERVICE_TYPE
-        with k8s_client as client:
-            if service_backend == ServiceBackend.KNATIVE:
-                api = CustomObjectsApi(client)
-                result = api.get_namespaced_custom_object(
-                    group="serving.knative.dev",
-                    version="v1",
-                    namespace=config.IE_NAMESPACE,
-                    plural="services",
-                    name=service_name,
-                )
-                status_conditions = result["status"]["conditions"]
-
-                # Check if service is ready
-                for condition in status_conditions:
-                    # if not ready return response
-                    if condition["status"] != "True":
-                        return_status.ready = False
-                        return_status.message += f"Message: {condition}"
-                        break
-                # TODO: Check if pod can even be scheduled
-            elif service_backend == ServiceBackend.EMISSARY:
-                api = AppsV1Api(client)
-                # Check that service exists
-                service_api = CoreV1Api(client)
-                service_api.read_namespaced_service(
-                    name=service_name, namespace=config.IE_NAMESPACE
-                )
-                # Get status
-                result = api.read_namespaced_deployment_status(
-                    name=service_name + "-deployment",
-                    namespace=config.IE_NAMESPACE,
-                )
-                # Get replicas (expected)
-                return_status.expected_replicas = int(
-                    result.status.replicas if result.status.replicas else 0
-                )
-                for condition in result.status.conditions:
-                    if condition.status != "True":
-                        return_status.ready = False
-                        return_status.message += f"Message: {condition.message}\nReason: {condition.reason}"
-                # Find out if pods in deployment are schedulable
-                # Get pods in deployment
-                core_api = CoreV1Api(client)
-                pods = core_api.list_namespaced_pod(
-                    namespace=config.IE_NAMESPACE,
-                    label_selector=f"app={service_name}",
-                )
-                for pod in pods.items:
-                    pod_status = pod.status
-                    return_status.status = pod_status.phase
-                    for condition in pod_status.conditions:
-                        if (
-                            condition.type == "PodScheduled"
-                            and condition.status != "True"
-                        ):
-                            return_status.schedulable = False
-                            return_status.message += f"Message: {condition.message}\nReason: {condition.reason}"
-            else:
-                raise NotImplementedError
-            return return_status.dict(by_alias=True)
+        if service_backend == ServiceBackend.KNATIVE:
+            kservice = await _get_knative_service(k8s, service_name)
+            _set_knative_service_status(return_status, kservice)
+        elif service_backend == ServiceBackend.EMISSARY:
+            deployment, pods = await _get_emissary_resources(k8s, service_name)
+            _set_emissary_service_status(return_status, deployment, pods)
+        else:
+            raise NotImplementedError
+        return return_status.dict(by_alias=True)
     except K8sAPIException as err:
         if err.status == 404:
             raise HTTPException(
@@ -394,7 +678,7 @@ async def get_available_inference_engine_services(
 @router.post("/", response_model=InferenceEngineService)
 async def create_inference_engine_service(
     service: CreateInferenceEngineService,
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
     user: TokenData = Depends(get_current_user),
 ) -> Dict:
@@ -402,7 +686,7 @@ async def create_inference_engine_service(
 
     Args:
         service (CreateInferenceEngineService): Service details
-        k8s_client (ApiClient, optional): K8S client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S client. Defaults to Depends(get_async_k8s_client).
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
         user (TokenData, optional): User details. Defaults to Depends(get_current_user).
@@ -432,178 +716,159 @@ async def create_inference_engine_service(
     protocol = config.IE_DEFAULT_PROTOCOL
     path = service_name
     # Deploy Service on K8S
-    with k8s_client as client:
-        # Get KNative Serving Ext Ip
+    # Get KNative Serving Ext Ip
+    try:
+        service_backend = config.IE_SERVICE_TYPE or ServiceBackend.EMISSARY
         try:
-            core_api = CoreV1Api(client)
-            custom_api = CustomObjectsApi(client)
-            service_backend = config.IE_SERVICE_TYPE or ServiceBackend.EMISSARY
-            if config.IE_DOMAIN:
-                host = config.IE_DOMAIN
-            else:
-                if service_backend == ServiceBackend.KNATIVE:
-                    ingress_name = "kourier"
-                    ingress_namespace = "kourier-system"
-                elif service_backend == ServiceBackend.EMISSARY:
-                    ingress_name = "emissary-ingress"
-                    ingress_namespace = "emissary"
-                else:
-                    if config.IE_INGRESS_NAME and config.IE_INGRESS_NAMESPACE:
-                        ingress_name = config.IE_INGRESS_NAME
-                        ingress_namespace = config.IE_INGRESS_NAMESPACE
-                    else:
-                        raise HTTPException(
-                            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                            detail="No Ingress specified",
-                        )
-                ingress = core_api.read_namespaced_service(
-                    name=ingress_name, namespace=ingress_namespace
-                )
-                if ingress.spec.load_balancer_ip:
-                    host = ingress.spec.load_balancer_ip
-                else:
-                    host = ingress.status.load_balancer.ingress[0].ip
-            if service_backend == ServiceBackend.KNATIVE:
-                service_template = template_env.get_template(
-                    "knative/inference-engine-knative-service.yaml.j2"
-                )
-                service_render = safe_load(
-                    service_template.render(
-                        {
-                            "engine_name": service_name,
-                            "image_name": service.image_uri,
-                            "port": service.container_port,
-                            "env": service.env,
-                            "num_gpus": service.num_gpus,
-                        }
-                    )
-                )
-                url = (
-                    f"{protocol}://{service_name}.{config.IE_NAMESPACE}.{host}"
-                )
-                if not config.IE_DOMAIN:
-                    # use sslip dns service to get a hostname for the service
-                    url += ".sslip.io"
-                custom_api.create_namespaced_custom_object(
-                    group="serving.knative.dev",
-                    version="v1",
-                    namespace=config.IE_NAMESPACE,
-                    plural="services",
-                    body=service_render,
-                )
-            elif service_backend == ServiceBackend.EMISSARY:
-                url = f"{protocol}://{host}/{path}/"  # need to add trailing slash for ambassador
-                # else css and js files are not loaded properly
-                service_template = template_env.get_template(
-                    "ambassador/inference-engine-service.yaml.j2"
-                )
-                deployment_template = template_env.get_template(
-                    "ambassador/inference-engine-deployment.yaml.j2"
-                )
-                mapping_template = template_env.get_template(
-                    "ambassador/ambassador-mapping.yaml.j2"
-                )
-                service_render = safe_load(
-                    service_template.render(
-                        {
-                            "engine_name": service_name,
-                            "port": service.container_port,
-                        }
-                    )
-                )
-                deployment_render = safe_load(
-                    deployment_template.render(
-                        {
-                            "engine_name": service_name,
-                            "image_name": service.image_uri,
-                            "port": service.container_port,
-                            "env": service.env,
-                            "num_gpus": service.num_gpus,
-                        }
-                    )
-                )
-                mapping_render = safe_load(
-                    mapping_template.render(
-                        {
-                            "engine_name": service_name,
-                        }
-                    )
-                )
-                app_api = AppsV1Api(client)
-                core_api = CoreV1Api(client)
-                app_api.create_namespaced_deployment(
-                    namespace=config.IE_NAMESPACE, body=deployment_render
+            host = await ingress_resolver.get_host(k8s, service_backend)
+        except ValueError as err:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(err),
+            ) from err
+        if service_backend == ServiceBackend.KNATIVE:
+            service_template = template_env.get_template(
+                "knative/inference-engine-knative-service.yaml.j2"
+            )
+            service_render = safe_load(
+                service_template.render(
+                    {
+                        "engine_name": service_name,
+                        "image_name": service.image_uri,
+                        "port": service.container_port,
+                        "env": service.env,
+                        "num_gpus": service.num_gpus,
+                    }
                 )
-                core_api.create_namespaced_service(
-                    namespace=config.IE_NAMESPACE, body=service_render
+            )
+            url = build_inference_url(
+                protocol, host, service_backend, service_name
+            )
+            await k8s.call(
+                k8s.custom.create_namespaced_custom_object,
+                group="serving.knative.dev",
+                version="v1",
+                namespace=config.IE_NAMESPACE,
+                plural="services",
+                body=service_render,
+            )
+        elif service_backend == ServiceBackend.EMISSARY:
+            url = build_inference_url(
+                protocol, host, service_backend, service_name, path
+            )
+            service_template = template_env.get_template(
+                "ambassador/inference-engine-service.yaml.j2"
+            )
+            deployment_template = template_env.get_template(
+                "ambassador/inference-engine-deployment.yaml.j2"
+            )
+            mapping_template = template_env.get_template(
+                "ambassador/ambassador-mapping.yaml.j2"
+            )
+            service_render = safe_load(
+                service_template.render(
+                    {
+                        "engine_name": service_name,
+                        "port": service.container_port,
+                    }
                 )
-                custom_api.create_namespaced_custom_object(
-                    group="getambassador.io",
-                    version="v2",
-                    namespace=config.IE_NAMESPACE,
-                    plural="mappings",
-                    body=mapping_render,
+            )
+            deployment_render = safe_load(
+                deployment_template.render(
+                    {
+                        "engine_name": service_name,
+                        "image_name": service.image_uri,
+                        "port": service.container_port,
+                        "env": service.env,
+                        "num_gpus": service.num_gpus,
+                    }
                 )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Invalid service type",
+            )
+            mapping_render = safe_load(
+                mapping_template.render(
+                    {
+                        "engine_name": service_name,
+                    }
                 )
-            # Save info into DB
-            db, mongo_client = db
-            service_metadata = jsonable_encoder(
-                InferenceEngineService(
-                    image_uri=service.image_uri,
-                    container_port=service.container_port,
-                    env=service.env,
-                    num_gpus=service.num_gpus,
-                    owner_id=user.user_id,
-                    protocol=protocol,
-                    host=host,
-                    path=path,
-                    model_id=uncased_to_snake_case(
-                        service.model_id
-                    ),  # convert title to ID
-                    created=datetime.datetime.now(),
-                    last_modified=datetime.datetime.now(),
-                    inference_url=url,
-                    service_name=service_name,
-                    backend=service_backend
-                    # resource_limits=service.resource_limits,
-                ),
-                by_alias=True,  # convert snake_case to camelCase
             )
-
-            async with await mongo_client.start_session() as session:
-                async with session.start_transaction():
-                    await db["services"].insert_one(service_metadata)
-            return service_metadata
-        except (K8sAPIException, HTTPError) as err:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error when creating inference engine: {err}",
-            ) from err
-        except TypeError as err:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"API has no access to the K8S cluster: {err}",
-            ) from err
-        except DuplicateKeyError as err:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Duplicate service name",
-            ) from err
-        except Exception as err:
+            await k8s.call(
+                k8s.apps.create_namespaced_deployment,
+                namespace=config.IE_NAMESPACE,
+                body=deployment_render,
+            )
+            await k8s.call(
+                k8s.core.create_namespaced_service,
+                namespace=config.IE_NAMESPACE,
+                body=service_render,
+            )
+            await k8s.call(
+                k8s.custom.create_namespaced_custom_object,
+                group="getambassador.io",
+                version="v2",
+                namespace=config.IE_NAMESPACE,
+                plural="mappings",
+                body=mapping_render,
+            )
+        else:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error when creating inference engine: {err}",
-            ) from err
+                detail="Invalid service type",
+            )
+        # Save info into DB
+        db, mongo_client = db
+        service_metadata = jsonable_encoder(
+            InferenceEngineService(
+                image_uri=service.image_uri,
+                container_port=service.container_port,
+                env=service.env,
+                num_gpus=service.num_gpus,
+                owner_id=user.user_id,
+                protocol=protocol,
+                host=host,
+                path=path,
+                model_id=uncased_to_snake_case(
+                    service.model_id
+                ),  # convert title to ID
+                created=datetime.datetime.now(),
+                last_modified=datetime.datetime.now(),
+                inference_url=url,
+                service_name=service_name,
+                backend=service_backend
+                # resource_limits=service.resource_limits,
+            ),
+            by_alias=True,  # convert snake_case to camelCase
+        )
+
+        async with await mongo_client.start_session() as session:
+            async with session.start_transaction():
+                await db["services"].insert_one(service_metadata)
+        return service_metadata
+    except (K8sAPIException, HTTPError) as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error when creating inference engine: {err}",
+        ) from err
+    except TypeError as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"API has no access to the K8S cluster: {err}",
+        ) from err
+    except DuplicateKeyError as err:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Duplicate service name",
+        ) from err
+    except Exception as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error when creating inference engine: {err}",
+        ) from err
 
 
 @router.delete("/{service_name}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_inference_engine_service(
     service_name: str = Path(description="Name of KService to Delete"),
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db=Depends(get_db),
     user: TokenData = Depends(get_current_user),
 ):
@@ -612,7 +877,7 @@ async def delete_inference_engine_service(
 
     Args:
         service_name (str, optional): Name of KNative service, defaults to Path(description="Name of KService to Delete")
-        k8s_client (ApiClient, optional): K8S client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S client. Defaults to Depends(get_async_k8s_client).
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
         user (TokenData, optional): User details. Defaults to Depends(get_current_user).
@@ -647,78 +912,77 @@ async def delete_inference_engine_service(
                 print("Existing service not found")
                 service_type = config.IE_SERVICE_TYPE
             await db["services"].delete_one({"serviceName": service_name})
-            with k8s_client as client:
-                # Create instance of API class
-                try:
-                    if service_type == ServiceBackend.KNATIVE:
-                        api = CustomObjectsApi(client)
-                        try:
-                            api.delete_namespaced_custom_object(
-                                group="serving.knative.dev",
-                                version="v1",
-                                plural="services",
-                                namespace=config.IE_NAMESPACE,
-                                name=service_name,
-                            )
-                        except K8sAPIException as err:
-                            if err.status == 404:
-                                pass
-                            else:
-                                raise err
-                    elif service_type == ServiceBackend.EMISSARY:
-                        # Delete service, mapping, and deployment
-                        app_api = AppsV1Api(client)
-                        core_api = CoreV1Api(client)
-                        custom_api = CustomObjectsApi(client)
+            # Create instance of API class
+            try:
+                if service_type == ServiceBackend.KNATIVE:
+                    try:
+                        await k8s.call(
+                            k8s.custom.delete_namespaced_custom_object,
+                            group="serving.knative.dev",
+                            version="v1",
+                            plural="services",
+                            namespace=config.IE_NAMESPACE,
+                            name=service_name,
+                        )
+                    except K8sAPIException as err:
+                        if err.status == 404:
+                            pass
+                        else:
+                            raise err
+                elif service_type == ServiceBackend.EMISSARY:
+                    # Delete service, mapping, and deployment
 
-                        try:
-                            core_api.delete_namespaced_service(
-                                namespace=config.IE_NAMESPACE,
-                                name=service_name,
-                            )
-                        except K8sAPIException as err:
-                            if err.status == 404:
-                                pass
-                            else:
-                                raise err
-                        try:
-                            custom_api.delete_namespaced_custom_object(
-                                group="getambassador.io",
-                                version="v2",
-                                plural="mappings",
-                                namespace=config.IE_NAMESPACE,
-                                name=service_name + "-ingress",
-                            )
-                        except K8sAPIException as err:
-                            if err.status == 404:
-                                pass
-                            else:
-                                raise err
-                        try:
-                            app_api.delete_namespaced_deployment(
-                                namespace=config.IE_NAMESPACE,
-                                name=service_name + "-deployment",
-                            )
-                        except K8sAPIException as err:
-                            if err.status == 404:
-                                pass
-                            else:
-                                raise err
-                except (K8sAPIException, HTTPError) as err:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Error when deleting inference engine: {err}",
-                    ) from err
-                except TypeError as err:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="API has no access to the K8S cluster",
-                    ) from err
-                except Exception as err:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Error when deleting inference engine: {err}",
-                    ) from err
+                    try:
+                        await k8s.call(
+                            k8s.core.delete_namespaced_service,
+                            namespace=config.IE_NAMESPACE,
+                            name=service_name,
+                        )
+                    except K8sAPIException as err:
+                        if err.status == 404:
+                            pass
+                        else:
+                            raise err
+                    try:
+                        await k8s.call(
+                            k8s.custom.delete_namespaced_custom_object,
+                            group="getambassador.io",
+                            version="v2",
+                            plural="mappings",
+                            namespace=config.IE_NAMESPACE,
+                            name=service_name + "-ingress",
+                        )
+                    except K8sAPIException as err:
+                        if err.status == 404:
+                            pass
+                        else:
+                            raise err
+                    try:
+                        await k8s.call(
+                            k8s.apps.delete_namespaced_deployment,
+                            namespace=config.IE_NAMESPACE,
+                            name=service_name + "-deployment",
+                        )
+                    except K8sAPIException as err:
+                        if err.status == 404:
+                            pass
+                        else:
+                            raise err
+            except (K8sAPIException, HTTPError) as err:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error when deleting inference engine: {err}",
+                ) from err
+            except TypeError as err:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="API has no access to the K8S cluster",
+                ) from err
+            except Exception as err:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error when deleting inference engine: {err}",
+                ) from err
 
 
 @router.patch("/{service_name}")
@@ -726,7 +990,7 @@ async def update_inference_engine_service(
     service_name: str,
     service: UpdateInferenceEngineService,
     tasks: BackgroundTasks,
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
     db=Depends(get_db),
     user: TokenData = Depends(get_current_user),
 ):
@@ -735,7 +999,7 @@ async def update_inference_engine_service(
     Args:
         service_name (str, optional): Name of KNative service, defaults to Path(description="Name of KService to Delete")
         service (UpdateInferenceEngineService) : Configuration (service name and Image URI) of updated Inference Engine
-        k8s_client (ApiClient, optional): K8S client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S client. Defaults to Depends(get_async_k8s_client).
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
         user (TokenData, optional): User details. Defaults to Depends(get_current_user).
@@ -766,45 +1030,18 @@ async def update_inference_engine_service(
         # TODO: Find a better way to do this
         updated_metadata["backend"] = service_type
         protocol = config.IE_DEFAULT_PROTOCOL
-        if config.IE_DOMAIN:
-            host = config.IE_DOMAIN
-        else:
-            with k8s_client as client:
-                core_api = CoreV1Api(client)
-                if service_type == ServiceBackend.KNATIVE:
-                    ingress_name = "kourier"
-                    ingress_namespace = "kourier-system"
-                elif service_type == ServiceBackend.EMISSARY:
-                    ingress_name = "emissary-ingress"
-                    ingress_namespace = "emissary"
-                else:
-                    if config.IE_INGRESS_NAME and config.IE_INGRESS_NAMESPACE:
-                        ingress_name = config.IE_INGRESS_NAME
-                        ingress_namespace = config.IE_INGRESS_NAMESPACE
-                    else:
-                        raise HTTPException(
-                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail="Error when trying to determine hostname of Ingress. Unsupported service type",
-                        )
-                ingress = core_api.read_namespaced_service(
-                    name=ingress_name, namespace=ingress_namespace
-                )
-                if ingress.spec.load_balancer_ip:
-                    host = ingress.spec.load_balancer_ip
-                else:
-                    host = ingress.status.load_balancer.ingress[0].ip
+        try:
+            host = await ingress_resolver.get_host(k8s, service_type)
+            updated_metadata["inferenceUrl"] = build_inference_url(
+                protocol, host, service_type, service_name
+            )
+        except ValueError as err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error when trying to determine hostname of Ingress. {err}",
+            ) from err
         updated_metadata["protocol"] = protocol
         updated_metadata["host"] = host
-        if service_type == ServiceBackend.KNATIVE:
-            updated_metadata[
-                "inferenceUrl"
-            ] = f"{protocol}://{service_name}.{config.IE_NAMESPACE}.{host}"
-            if not config.IE_DOMAIN:
-                updated_metadata["inferenceUrl"] += ".sslip.io"
-        elif service_type == ServiceBackend.EMISSARY:
-            updated_metadata[
-                "inferenceUrl"
-            ] = f"{protocol}://{host}/{service_name}/"
         async with await mongo_client.start_session() as session:
             async with session.start_transaction():
                 # Check if user has editor access
@@ -840,157 +1077,151 @@ async def update_inference_engine_service(
                     return updated_service
                 # Get the backend
                 # Deploy Service on K8S
-                with k8s_client as client:
-                    # Create instance of API class
-                    try:
-                        core_api = CoreV1Api(client)
-                        custom_api = CustomObjectsApi(client)
-                        if service_type == ServiceBackend.KNATIVE:
-                            template = template_env.get_template(
-                                "knative/inference-engine-service.yaml.j2"
+                # Create instance of API class
+                try:
+                    if service_type == ServiceBackend.KNATIVE:
+                        template = template_env.get_template(
+                            "knative/inference-engine-service.yaml.j2"
+                        )
+                        service_template = safe_load(
+                            template.render(
+                                {
+                                    "engine_name": service_name,
+                                    "image_name": updated_service["imageUri"],
+                                    "port": updated_service["containerPort"],
+                                    "env": updated_service["env"],
+                                    "num_gpus": updated_service["numGpus"],
+                                }
+                            )
+                        )
+                        if recreate_service:
+                            # Use replacement strategy to update service
+                            await k8s.call(
+                                k8s.custom.replace_namespaced_custom_object,
+                                group="serving.knative.dev",
+                                version="v1",
+                                plural="services",
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name,
+                                body=service_template,
+                            )
+                        else:
+                            await k8s.call(
+                                k8s.custom.patch_namespaced_custom_object,
+                                group="serving.knative.dev",
+                                version="v1",
+                                plural="services",
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name,
+                                body=service_template,
+                            )
+                    elif service_type == ServiceBackend.EMISSARY:
+                        service_template = template_env.get_template(
+                            "ambassador/inference-engine-service.yaml.j2"
+                        )
+                        deployment_template = template_env.get_template(
+                            "ambassador/inference-engine-deployment.yaml.j2"
+                        )
+                        mapping_template = template_env.get_template(
+                            "ambassador/ambassador-mapping.yaml.j2"
+                        )
+                        service_render = safe_load(
+                            service_template.render(
+                                {
+                                    "engine_name": service_name,
+                                    "port": updated_service["containerPort"],
+                                }
                             )
-                            service_template = safe_load(
-                                template.render(
-                                    {
-                                        "engine_name": service_name,
-                                        "image_name": updated_service[
-                                            "imageUri"
-                                        ],
-                                        "port": updated_service[
-                                            "containerPort"
-                                        ],
-                                        "env": updated_service["env"],
-                                        "num_gpus": updated_service["numGpus"],
-                                    }
-                                )
+                        )
+                        deployment_render = safe_load(
+                            deployment_template.render(
+                                {
+                                    "engine_name": service_name,
+                                    "image_name": updated_service["imageUri"],
+                                    "port": updated_service["containerPort"],
+                                    "env": updated_service["env"],
+                                    "num_gpus": updated_service["numGpus"],
+                                }
                             )
-                            if recreate_service:
-                                # Use replacement strategy to update service
-                                custom_api.replace_namespaced_custom_object(
-                                    group="serving.knative.dev",
-                                    version="v1",
-                                    plural="services",
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name,
-                                    body=service_template,
-                                )
-                            else:
-                                custom_api.patch_namespaced_custom_object(
-                                    group="serving.knative.dev",
-                                    version="v1",
-                                    plural="services",
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name,
-                                    body=service_template,
-                                )
-                        elif service_type == ServiceBackend.EMISSARY:
-                            service_template = template_env.get_template(
-                                "ambassador/inference-engine-service.yaml.j2"
+                        )
+                        mapping_render = safe_load(
+                            mapping_template.render(
+                                {
+                                    "engine_name": service_name,
+                                }
                             )
-                            deployment_template = template_env.get_template(
-                                "ambassador/inference-engine-deployment.yaml.j2"
+                        )
+                        if recreate_service:
+                            # Use replacement strategy to update service
+                            await k8s.call(
+                                k8s.apps.replace_namespaced_deployment,
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name + "-deployment",
+                                body=deployment_render,
                             )
-                            mapping_template = template_env.get_template(
-                                "ambassador/ambassador-mapping.yaml.j2"
+                            await k8s.call(
+                                k8s.core.replace_namespaced_service,
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name,
+                                body=service_render,
+                            )
+                            await k8s.call(
+                                k8s.custom.replace_namespaced_custom_object,
+                                group="getambassador.io",
+                                version="v2",
+                                plural="mappings",
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name + "-ingress",
+                                body=mapping_render,
                             )
-                            service_render = safe_load(
-                                service_template.render(
-                                    {
-                                        "engine_name": service_name,
-                                        "port": updated_service[
-                                            "containerPort"
-                                        ],
-                                    }
-                                )
+                        else:
+                            await k8s.call(
+                                k8s.apps.patch_namespaced_deployment,
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name + "-deployment",
+                                body=deployment_render,
                             )
-                            deployment_render = safe_load(
-                                deployment_template.render(
-                                    {
-                                        "engine_name": service_name,
-                                        "image_name": updated_service[
-                                            "imageUri"
-                                        ],
-                                        "port": updated_service[
-                                            "containerPort"
-                                        ],
-                                        "env": updated_service["env"],
-                                        "num_gpus": updated_service["numGpus"],
-                                    }
-                                )
+                            await k8s.call(
+                                k8s.core.patch_namespaced_service,
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name,
+                                body=service_render,
                             )
-                            mapping_render = safe_load(
-                                mapping_template.render(
-                                    {
-                                        "engine_name": service_name,
-                                    }
-                                )
+                            await k8s.call(
+                                k8s.custom.patch_namespaced_custom_object,
+                                group="getambassador.io",
+                                version="v2",
+                                plural="mappings",
+                                namespace=config.IE_NAMESPACE,
+                                name=service_name + "-ingress",
+                                body=mapping_render,
                             )
-                            app_api = AppsV1Api(client)
-                            if recreate_service:
-                                # Use replacement strategy to update service
-                                app_api.replace_namespaced_deployment(
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name + "-deployment",
-                                    body=deployment_render,
-                                )
-                                core_api.replace_namespaced_service(
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name,
-                                    body=service_render,
-                                )
-                                custom_api.replace_namespaced_custom_object(
-                                    group="getambassador.io",
-                                    version="v2",
-                                    plural="mappings",
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name + "-ingress",
-                                    body=mapping_render,
-                                )
-                            else:
-                                app_api.patch_namespaced_deployment(
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name + "-deployment",
-                                    body=deployment_render,
-                                )
-                                core_api.patch_namespaced_service(
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name,
-                                    body=service_render,
-                                )
-                                custom_api.patch_namespaced_custom_object(
-                                    group="getambassador.io",
-                                    version="v2",
-                                    plural="mappings",
-                                    namespace=config.IE_NAMESPACE,
-                                    name=service_name + "-ingress",
-                                    body=mapping_render,
-                                )
-                        return updated_service
-                    except (K8sAPIException, HTTPError) as err:
-                        session.abort_transaction()
-                        raise HTTPException(
-                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail=f"Error when updating inference engine: {err}",
-                        ) from err
-                    except TypeError as err:
-                        session.abort_transaction()
-                        raise HTTPException(
-                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail="API has no access to the K8S cluster",
-                        ) from err
-                    except Exception as err:
-                        session.abort_transaction()
-                        raise HTTPException(
-                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail=f"Error when updating inference engine: {err}",
-                        ) from err
+                    return updated_service
+                except (K8sAPIException, HTTPError) as err:
+                    session.abort_transaction()
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Error when updating inference engine: {err}",
+                    ) from err
+                except TypeError as err:
+                    session.abort_transaction()
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail="API has no access to the K8S cluster",
+                    ) from err
+                except Exception as err:
+                    session.abort_transaction()
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Error when updating inference engine: {err}",
+                    ) from err
 
 
 @router.post("/{service_name}/restore")
 async def restore_inference_engine_service(
     service_name: str,
     mongodb: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
-    k8s_client: ApiClient = Depends(get_k8s_client),
+    k8s: AsyncK8sClient = Depends(get_async_k8s_client),
 ) -> Dict:
     """Restore a deleted service (i.e someone accidently removed the deployment).
     This will do the following:
@@ -1002,7 +1233,7 @@ async def restore_inference_engine_service(
         service_name (str, optional): Name of KNative service, defaults to Path(description="Name of KService to Delete")
         mongodb (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
-        k8s_client (ApiClient, optional): K8S client. Defaults to Depends(get_k8s_client).
+        k8s (AsyncK8sClient, optional): K8S client. Defaults to Depends(get_async_k8s_client).
 
     Raises:
         HTTPException: 500 Internal Server Error if there is an error restoring service
@@ -1022,103 +1253,103 @@ async def restore_inference_engine_service(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Service not found"
         )
-    with k8s_client as client:
-        custom_api = CustomObjectsApi(client)
-        core_api = CoreV1Api(client)
-        app_api = AppsV1Api(client)
-        service_backend = service["backend"]
-        if service_backend == ServiceBackend.KNATIVE:
-            service_template = template_env.get_template(
-                "knative/inference-engine-knative-service.yaml.j2"
-            )
-            service = safe_load(
-                service_template.render(
-                    {
-                        "engine_name": service_name,
-                        "image_name": service["imageUri"],
-                        "port": service["containerPort"],
-                        "env": service["env"],
-                        "num_gpus": service["numGpus"],
-                    }
-                )
-            )
-            custom_api.create_namespaced_custom_object(
-                group="serving.knative.dev",
-                version="v1",
-                namespace=config.IE_NAMESPACE,
-                plural="services",
-                body=service,
-            )
-        elif service_backend == ServiceBackend.EMISSARY:
-            service_template = template_env.get_template(
-                "ambassador/inference-engine-service.yaml.j2"
-            )
-            deployment_template = template_env.get_template(
-                "ambassador/inference-engine-deployment.yaml.j2"
+    service_backend = service["backend"]
+    if service_backend == ServiceBackend.KNATIVE:
+        service_template = template_env.get_template(
+            "knative/inference-engine-knative-service.yaml.j2"
+        )
+        service = safe_load(
+            service_template.render(
+                {
+                    "engine_name": service_name,
+                    "image_name": service["imageUri"],
+                    "port": service["containerPort"],
+                    "env": service["env"],
+                    "num_gpus": service["numGpus"],
+                }
             )
-            mapping_template = template_env.get_template(
-                "ambassador/ambassador-mapping.yaml.j2"
+        )
+        await k8s.call(
+            k8s.custom.create_namespaced_custom_object,
+            group="serving.knative.dev",
+            version="v1",
+            namespace=config.IE_NAMESPACE,
+            plural="services",
+            body=service,
+        )
+    elif service_backend == ServiceBackend.EMISSARY:
+        service_template = template_env.get_template(
+            "ambassador/inference-engine-service.yaml.j2"
+        )
+        deployment_template = template_env.get_template(
+            "ambassador/inference-engine-deployment.yaml.j2"
+        )
+        mapping_template = template_env.get_template(
+            "ambassador/ambassador-mapping.yaml.j2"
+        )
+        service_render = safe_load(
+            service_template.render(
+                {
+                    "engine_name": service_name,
+                    "port": service["containerPort"],
+                }
             )
-            service_render = safe_load(
-                service_template.render(
-                    {
-                        "engine_name": service_name,
-                        "port": service["containerPort"],
-                    }
-                )
+        )
+        deployment_render = safe_load(
+            deployment_template.render(
+                {
+                    "engine_name": service_name,
+                    "image_name": service["imageUri"],
+                    "port": service["containerPort"],
+                    "env": service["env"],
+                    "num_gpus": service["numGpus"],
+                }
             )
-            deployment_render = safe_load(
-                deployment_template.render(
-                    {
-                        "engine_name": service_name,
-                        "image_name": service["imageUri"],
-                        "port": service["containerPort"],
-                        "env": service["env"],
-                        "num_gpus": service["numGpus"],
-                    }
-                )
+        )
+        mapping_render = safe_load(
+            mapping_template.render(
+                {
+                    "engine_name": service_name,
+                }
             )
-            mapping_render = safe_load(
-                mapping_template.render(
-                    {
-                        "engine_name": service_name,
-                    }
-                )
+        )
+        try:
+            await k8s.call(
+                k8s.apps.create_namespaced_deployment,
+                namespace=config.IE_NAMESPACE,
+                body=deployment_render,
             )
-            app_api = AppsV1Api(client)
-            core_api = CoreV1Api(client)
-            try:
-                app_api.create_namespaced_deployment(
-                    namespace=config.IE_NAMESPACE, body=deployment_render
-                )
-            except K8sAPIException as err:
-                print("Deployment probably already exists")
-                print(f"Error: {err}")
+        except K8sAPIException as err:
+            print("Deployment probably already exists")
+            print(f"Error: {err}")
 
-            try:
-                core_api.create_namespaced_service(
-                    namespace=config.IE_NAMESPACE, body=service_render
-                )
-            except K8sAPIException as err:
-                print("Service probably already exists")
-                print(f"Error: {err}")
+        try:
+            await k8s.call(
+                k8s.core.create_namespaced_service,
+                namespace=config.IE_NAMESPACE,
+                body=service_render,
+            )
+        except K8sAPIException as err:
+            print("Service probably already exists")
+            print(f"Error: {err}")
 
-            try:
-                custom_api.create_namespaced_custom_object(
-                    group="getambassador.io",
-                    version="v2",
-                    namespace=config.IE_NAMESPACE,
-                    plural="mappings",
-                    body=mapping_render,
-                )
-            except K8sAPIException as err:
-                print("Mapping probably already exists")
-                print(f"Error: {err}")
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Invalid service type",
+        try:
+            await k8s.call(
+                k8s.custom.create_namespaced_custom_object,
+                group="getambassador.io",
+                version="v2",
+                namespace=config.IE_NAMESPACE,
+                plural="mappings",
+                body=mapping_render,
             )
+        except K8sAPIException as err:
+            print("Mapping probably already exists")
+            print(f"Error: {err}")
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Invalid service type",
+        )
     return {"message": "Service restored", "service": service}
 
 
@@ -1147,4 +1378,3 @@ async def wipe_orphaned_services(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error when trying to wipe orphaned services: {err}",
         )
-
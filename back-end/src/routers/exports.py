@@ -1,7 +1,6 @@
 from typing import Dict, List, Optional, Tuple
 from colorama import Fore
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
 from miniopy_async import Minio
 
 from fastapi import (
@@ -15,7 +14,14 @@ from fastapi.responses import JSONResponse
 
 from ..models.exports import ExportsPage, ExportLogPackage
 
+from ..internal.counts import count_cache
 from ..internal.keycloak_auth import check_is_admin
+from ..internal.pagination import (
+    decode_cursor,
+    keyset_cursor,
+    keyset_filter,
+    keyset_sort,
+)
 from ..internal.dependencies.mongo_client import get_db
 from ..internal.dependencies.minio_client import (
     minio_api_client,
@@ -34,7 +40,7 @@ async def get_exported(
     sort_by: str = Query(default="timeInitiated", alias="sort"),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
 ):
-    db, mongo_client = db
+    db, _ = db
     try:
         # check number of documents to skip past
         skips = pages_export.exports_num * (pages_export.page_num - 1)
@@ -57,29 +63,34 @@ async def get_exported(
                     "$gte": pages_export.time_completed_range["from"],
                     "$lte": pages_export.time_completed_range["to"],
                 }
-        async with await mongo_client.start_session() as session:
-            async with session.start_transaction():
-                total_rows = await (db["exports"].count_documents(lookup))
-                if skips <= 0:
-                    # find from users in MongodDB exclude ObjectID and convert to list
-                    cursor = await (
-                        db["exports"]
-                        .find(lookup, {"_id": False})
-                        .sort(sort_by, DESCENDING if descending else ASCENDING)
-                        .limit(pages_export.exports_num)
-                    ).to_list(length=pages_export.exports_num)
-                # else call cursor with skips
-                else:
-                    # find from users in MongodDB exclude ObjectID and convert to list
-                    cursor = await (
-                        db["exports"]
-                        .find(lookup, {"_id": False})
-                        .sort(sort_by, DESCENDING if descending else ASCENDING)
-                        .skip(skips)
-                        .limit(pages_export.exports_num)
-                    ).to_list(length=pages_export.exports_num)
+        page_lookup = lookup
+        if pages_export.cursor is not None:
+            # continue right after the last export of the previous page
+            position = decode_cursor(pages_export.cursor, sort_by, descending)
+            page_lookup = {
+                "$and": [lookup, keyset_filter(position, sort_by, descending)]
+            }
+            skips = 0
+        total_rows = await count_cache.count(db["exports"], lookup)
+        # find from users in MongodDB and convert to list
+        cursor = await (
+            db["exports"]
+            .find(page_lookup)
+            .sort(keyset_sort(sort_by, descending))
+            .skip(max(skips, 0))
+            .limit(pages_export.exports_num)
+        ).to_list(length=pages_export.exports_num)
+        response = {"total_rows": total_rows}
+        if cursor and len(cursor) == pages_export.exports_num:
+            response["nextCursor"] = keyset_cursor(
+                cursor[-1], sort_by, descending
+            )
+        # exclude ObjectID
+        for export in cursor:
+            export.pop("_id", None)
+        response["results"] = cursor
         # return documents if all ok
-        return {"results": cursor, "total_rows": total_rows}
+        return response
     except ValueError as err:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -131,6 +142,7 @@ async def remove_exports(
                         "timeCompleted": x["timeCompleted"],
                     }
                 )
+                count_cache.invalidate("exports")
             if len(failed_exports_removals) > 0:
                 return JSONResponse(
                     status_code=status.HTTP_206_PARTIAL_CONTENT,
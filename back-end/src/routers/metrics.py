@@ -0,0 +1,106 @@
+"""Endpoints for inspecting runtime metrics of the back-end."""
+from typing import Dict, Tuple
+
+from fastapi import APIRouter, Depends
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from ..internal.cluster_state import cluster_state
+from ..internal.counts import count_cache
+from ..internal.dependencies.minio_client import get_minio_status
+from ..internal.dependencies.mongo_client import get_db, get_pool_stats
+from ..internal.facets import facet_cache
+from ..internal.indexes import explain_queries
+from ..internal.ingress import ingress_resolver
+from ..internal.keycloak_auth import token_cache
+from ..internal.pod_logs import log_broadcasters
+from ..internal.result_cache import search_result_cache
+from ..internal.search_index import search_index
+from ..internal.suggest import suggest_index
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/db")
+async def get_db_pool_metrics() -> Dict:
+    """Get usage metrics of the shared MongoDB connection pool
+
+    Returns:
+        Dict: Pool configuration and usage counters
+    """
+    return get_pool_stats()
+
+
+@router.get("/db/indexes")
+async def get_index_advice(
+    db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
+) -> Dict:
+    """Explain the canonical queries of the app and report those that
+    scan a whole collection instead of using an index
+
+    Args:
+        db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
+            Defaults to Depends(get_db).
+
+    Returns:
+        Dict: Plan summary per query, queries doing collection scans,
+            and existing indexes per collection
+    """
+    db, _ = db
+    return await explain_queries(db)
+
+
+@router.get("/s3")
+async def get_s3_metrics() -> Dict:
+    """Get health information about the shared MinIO client and usage of
+    the presigned URL cache
+
+    Returns:
+        Dict: Connection and bucket status, and presigned URL cache counters
+    """
+    return get_minio_status()
+
+
+@router.get("/auth")
+async def get_auth_metrics() -> Dict:
+    """Get usage metrics of the verified token cache
+
+    Returns:
+        Dict: Cache size, capacity, and hit/miss counters
+    """
+    return {"tokenCache": token_cache.info()}
+
+
+@router.get("/k8s")
+async def get_k8s_metrics() -> Dict:
+    """Get the sync status of the cached inference engine cluster state,
+    usage of the ingress host cache and active log streams
+
+    Returns:
+        Dict: Size, sync status and watch event counts per resource kind,
+            ingress host cache counters, and log stream viewers
+    """
+    return {
+        "clusterState": cluster_state.info(),
+        "ingressHosts": ingress_resolver.info(),
+        "logStreams": log_broadcasters.info(),
+    }
+
+
+@router.get("/search")
+async def get_search_metrics() -> Dict:
+    """Get the size of the in-process model card search index and
+    usage of the cached result counts, filter options, suggestions and
+    search responses
+
+    Returns:
+        Dict: Readiness, number of indexed cards and distinct words,
+            count cache counters per collection, filter options cache backend,
+            number of suggestable values and search response cache hit ratio
+    """
+    return {
+        "index": search_index.info(),
+        "counts": count_cache.info(),
+        "facets": facet_cache.info(),
+        "suggest": suggest_index.info(),
+        "results": search_result_cache.info(),
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 import re
@@ -9,28 +10,64 @@ from fastapi import (
     APIRouter,
     BackgroundTasks,
     Depends,
+    Header,
     HTTPException,
     Query,
+    Response,
     status,
 )
 from fastapi.encoders import jsonable_encoder
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING
 from pymongo.errors import DuplicateKeyError
 
 from ..config.config import config
+from ..internal.card_events import card_deleted, card_upserted
+from ..internal.counts import count_cache
+from ..internal.etag import etag_matches, make_etag, not_modified, set_etag
 from ..internal.keycloak_auth import get_current_user, check_is_admin
 from ..internal.dependencies.file_validator import ValidateFileUpload
 from ..internal.dependencies.minio_client import (
     get_presigned_url,
     minio_api_client,
+    presign_epoch,
 )
 from ..internal.dependencies.mongo_client import get_db
 from ..internal.experiment_connector import Experiment
+from ..internal.facets import (
+    FACET_FIELDS,
+    bucket_counts,
+    facet_cache,
+    facet_options,
+    facet_pipeline,
+)
+from ..internal.pagination import (
+    cursor_offset,
+    decode_cursor,
+    keyset_cursor,
+    keyset_filter,
+    keyset_sort,
+    offset_cursor,
+    with_sort_field,
+)
 from ..internal.preprocess_html import (
+    extract_media_refs,
+    parse_s3_url,
     preprocess_html_get,
     preprocess_html_post,
 )
+from ..internal.result_cache import search_result_cache
+from ..internal.search import (
+    EXCLUDE_DERIVED_FIELDS,
+    SUMMARY_PROJECTION,
+    TEXT_SCORE_SORT,
+    build_search_text,
+    build_visible_to,
+    search_filter,
+    visibility_filter,
+)
+from ..internal.search_index import fetch_ranked_page, ranked_filter, search_index
+from ..internal.suggest import SUGGEST_FIELDS, suggest_index
 from ..internal.tasks import (
     delete_orphan_images,
     delete_orphan_services,
@@ -39,10 +76,13 @@ from ..internal.tasks import (
 from ..internal.utils import uncased_to_snake_case
 from ..models.iam import TokenData
 from ..models.model import (
+    FacetedSearchResponse,
     GetFilterResponseModel,
+    SearchCountResponse,
     ModelCardModelDB,
     ModelCardModelIn,
     SearchModelResponse,
+    SuggestResponse,
     UpdateModelCardModel,
     ModelCardPackage,
 )
@@ -71,12 +111,105 @@ file_validator = ValidateFileUpload(
 router = APIRouter(prefix="/models", tags=["Models"])
 
 
+def _build_search_query(
+    generic_search_text: Optional[str],
+    title: Optional[str],
+    tasks: Optional[List[str]],
+    tags: Optional[List[str]],
+    frameworks: Optional[List[str]],
+    creator_user_id: Optional[str],
+    creator_user_id_partial: Optional[str],
+    user: Optional[str],
+    sort_by: str,
+) -> Tuple[Dict, Optional[List[str]], bool]:
+    """Build the query of a model card search
+
+    Args:
+        generic_search_text (Optional[str]): Search through any relevant text fields
+        title (Optional[str]): Search by title
+        tasks (Optional[List[str]]): Search by task
+        tags (Optional[List[str]]): Search by tag
+        frameworks (Optional[List[str]]): Search by framework
+        creator_user_id (Optional[str]): Search by creator
+        creator_user_id_partial (Optional[str]): Search by part of the creator
+        user (Optional[str]): Only return cards this user can access
+        sort_by (str): Sort by field
+
+    Returns:
+        Tuple[Dict, Optional[List[str]], bool]: Query, IDs ranked by the search index
+            if it was used (when sorting by relevance, the query does not filter
+            on them), and whether to sort by text score
+    """
+    query = {}
+    conditions = []
+    if user:
+        conditions.append(visibility_filter(user))
+    sort_by_score = False
+    ranked_ids = None
+    if generic_search_text:
+        ranked = search_index.search(
+            generic_search_text, limit=config.SEARCH_INDEX_MAX_CANDIDATES
+        )
+        if ranked is not None:
+            # In-process BM25 index picks the candidates
+            ranked_ids = [doc_id for doc_id, _ in ranked]
+            if sort_by != "_id":
+                conditions.append(ranked_filter(ranked_ids))
+        else:
+            # Weighted text index, with a regex fallback for short fragments
+            text_query, uses_text_index = search_filter(generic_search_text)
+            conditions.append(text_query)
+            # Sort by relevance unless another sort order was requested
+            sort_by_score = uses_text_index and sort_by == "_id"
+    if len(conditions) == 1:
+        query.update(conditions[0])
+    elif conditions:
+        query["$and"] = conditions
+
+    if title:
+        query["title"] = {"$regex": re.escape(title), "$options": "i"}
+    if tasks:
+        query["task"] = {"$in": [re.compile(task, re.IGNORECASE) for task in tasks]}
+    if tags:
+        query["tags"] = {"$all": [re.compile(tag, re.IGNORECASE) for tag in tags]}
+    if frameworks:
+        query["frameworks"] = {
+            "$in": [re.compile(framework, re.IGNORECASE) for framework in frameworks]
+        }
+    if creator_user_id:
+        query["creatorUserId"] = creator_user_id
+    if creator_user_id_partial:
+        query["creatorUserId"] = {
+            "$regex": re.escape(creator_user_id_partial),
+            "$options": "i",
+        }
+    return query, ranked_ids, sort_by_score
+
+
+def _card_etag(card: Dict, convert_s3: bool) -> str:
+    """Entity tag of a model card response. It changes when the card is
+    updated, and every presign epoch if the response has presigned URLs."""
+    return make_etag(
+        card["_id"], card.get("lastModified"), presign_epoch() if convert_s3 else ""
+    )
+
+
+async def _presign_video_location(s3_client, url: str) -> Optional[str]:
+    """Presign the S3 URL of a model card video, or None if that fails."""
+    try:
+        bucket, object_name = parse_s3_url(url)
+        return await get_presigned_url(s3_client, object_name, bucket)
+    except Exception as err:
+        print(f"Error: {err}")
+        return None
+
+
 @router.get(
     "/_db/options/filters", response_model=GetFilterResponseModel # Removed backslash (/) after 'filters' as it triggers error, preventing access to the API endpoint.
 )  # prevent accidently matching with user/model id
 async def get_available_filters(
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db)
-) -> Dict[str, List[str]]:
+) -> Dict:
     """Get available filters for model zoo search page
 
     Args:
@@ -84,78 +217,322 @@ async def get_available_filters(
             Defaults to Depends(get_db).
 
     Returns:
-        Dict[str, List[str]]: All available tags, frameworks, and tasks
+        Dict: All available tags, frameworks, and tasks, and how many
+            model cards have each of them
+    """
+    db, _ = db
+    facets = await facet_cache.get(db)
+    return {**facet_options(facets), "counts": facets}
+
+
+@router.get("/_db/suggest", response_model=SuggestResponse)
+async def suggest(
+    db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
+    q: str = Query(..., max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    kinds: Optional[List[str]] = Query(default=None, alias="kinds[]"),
+) -> Dict:
+    """Suggest completions of the text typed in the search box, from the
+    titles, tags, frameworks, tasks and creators of public model cards
+
+    Args:
+        db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
+            Defaults to Depends(get_db).
+        q (str): Text typed so far, matched case insensitively as a prefix. Defaults to Query(..., max_length=100).
+        limit (int, optional): Max number of suggestions. Defaults to Query(default=10, ge=1, le=50).
+        kinds (Optional[List[str]], optional): Only suggest these kinds of values. Defaults to Query(default=None, alias="kinds[]").
+
+    Raises:
+        HTTPException: 422 if a kind is not known
+
+    Returns:
+        Dict: Suggestions, most common first
+    """
+    if kinds is not None and any(kind not in SUGGEST_FIELDS for kind in kinds):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Kinds must be among {list(SUGGEST_FIELDS)}",
+        )
+    db, _ = db
+    await suggest_index.ensure_ready(db)
+    return {"suggestions": suggest_index.suggest(q, limit=limit, kinds=kinds)}
+
+
+@router.get("/_db/count", response_model=SearchCountResponse)
+async def count_cards(
+    db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
+    sort_by: str = Query(default="_id", alias="sort"),
+    generic_search_text: Optional[str] = Query(default=None, alias="genericSearchText"),
+    title: Optional[str] = Query(default=None),
+    tasks: Optional[List[str]] = Query(default=None, alias="tasks[]"),
+    tags: Optional[List[str]] = Query(default=None, alias="tags[]"),
+    frameworks: Optional[List[str]] = Query(default=None, alias="frameworks[]"),
+    creator_user_id: Optional[str] = Query(default=None, alias="creator"),
+    creator_user_id_partial: Optional[str] = Query(
+        default=None, alias="creatorUserIdPartial"
+    ),
+    user: Optional[str] = Query(default=None),
+) -> Dict:
+    """Count the results of a model card search, for searches made with `total=false`
+
+    Args:
+        db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection. Defaults to Depends(get_db).
+        sort_by (str, optional): Sort by field, as in the search. Defaults to Query(default="_id", alias="sort").
+        generic_search_text (Optional[str], optional): Search through any relevant text fields. Defaults to Query(default=None, alias="genericSearchText").
+        title (Optional[str], optional): Search by title. Defaults to Query(default=None).
+        tasks (Optional[List[str]], optional): Search by task. Defaults to Query(default=None, alias="tasks[]").
+        tags (Optional[List[str]], optional): Search by task. Defaults to Query(default=None, alias="tags[]").
+        frameworks (Optional[List[str]], optional): Search by framework. Defaults to Query( default=None, alias="frameworks[]" ).
+        creator_user_id (Optional[str], optional): Search by creator. Defaults to Query(default=None, alias="creator").
+        user (Optional[str], optional): Only count cards this user can access. Defaults to Query(default=None).
+
+    Returns:
+        Dict: Total number of results
+    """
+    db, _ = db
+    query, ranked_ids, _ = _build_search_query(
+        generic_search_text=generic_search_text,
+        title=title,
+        tasks=tasks,
+        tags=tags,
+        frameworks=frameworks,
+        creator_user_id=creator_user_id,
+        creator_user_id_partial=creator_user_id_partial,
+        user=user,
+        sort_by=sort_by,
+    )
+    if ranked_ids is not None and sort_by == "_id":
+        # Relevance sorted searches do not filter on the candidates
+        query = {"$and": [query, ranked_filter(ranked_ids)]}
+    return {"total": await count_cache.count(db["models"], query)}
+
+
+@router.get(
+    "/_db/search",
+    response_model=FacetedSearchResponse,
+    response_model_exclude_unset=True,
+)
+async def faceted_search_cards(
+    db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
+    page: int = Query(default=1, alias="p", gt=0),
+    rows_per_page: int = Query(default=10, alias="n", ge=0),
+    descending: bool = Query(default=False, alias="desc"),
+    sort_by: str = Query(default="_id", alias="sort"),
+    generic_search_text: Optional[str] = Query(default=None, alias="genericSearchText"),
+    title: Optional[str] = Query(default=None),
+    tasks: Optional[List[str]] = Query(default=None, alias="tasks[]"),
+    tags: Optional[List[str]] = Query(default=None, alias="tags[]"),
+    frameworks: Optional[List[str]] = Query(default=None, alias="frameworks[]"),
+    creator_user_id: Optional[str] = Query(default=None, alias="creator"),
+    creator_user_id_partial: Optional[str] = Query(
+        default=None, alias="creatorUserIdPartial"
+    ),
+    user: Optional[str] = Query(default=None),
+    return_attr: Optional[List[str]] = Query(default=None, alias="return[]"),
+    cursor: Optional[str] = Query(default=None),
+) -> Dict:
+    """Search model cards, also counting the cards matching the search per
+    tag, framework and task, in a single aggregation
+
+    Args:
+        db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection. Defaults to Depends(get_db).
+        page (int, optional): Page number. Defaults to Query(default=1, alias="p", gt=0).
+        rows_per_page (int, optional): Rows per page, 0 for all. Defaults to Query(default=10, alias="n", ge=0).
+        descending (bool, optional): Order to return results in. Defaults to Query(default=False, alias="desc").
+        sort_by (str, optional): Sort by field. Defaults to Query(default="_id", alias="sort").
+        generic_search_text (Optional[str], optional): Search through any relevant text fields. Defaults to Query(default=None, alias="genericSearchText").
+        title (Optional[str], optional): Search by title. Defaults to Query(default=None).
+        tasks (Optional[List[str]], optional): Search by task. Defaults to Query(default=None, alias="tasks[]").
+        tags (Optional[List[str]], optional): Search by task. Defaults to Query(default=None, alias="tags[]").
+        frameworks (Optional[List[str]], optional): Search by framework. Defaults to Query( default=None, alias="frameworks[]" ).
+        creator_user_id (Optional[str], optional): Search by creator. Defaults to Query(default=None, alias="creator").
+        user (Optional[str], optional): Only return cards this user can access. Defaults to Query(default=None).
+        return_attr (Optional[List[str]], optional): Which fields to return, all but the markdown and performance HTML
+            if not given. Defaults to Query(default=None, alias="return[]").
+        cursor (Optional[str], optional): `nextCursor` of the previous page. Takes precedence over the page number.
+            Defaults to Query(default=None).
+
+    Raises:
+        HTTPException: 422 if the cursor is invalid
+
+    Returns:
+        Dict: Results page, total number of results, and number of results per filter value
     """
-    # TODO: Optimize retrieval through Redis cache
     db, _ = db
-    models = db["models"]
-    tags = await models.distinct("tags")
-    frameworks = await models.distinct("frameworks")
-    tasks = await models.distinct("task")
-    return {"tags": tags, "frameworks": frameworks, "tasks": tasks}
+    query, ranked_ids, sort_by_score = _build_search_query(
+        generic_search_text=generic_search_text,
+        title=title,
+        tasks=tasks,
+        tags=tags,
+        frameworks=frameworks,
+        creator_user_id=creator_user_id,
+        creator_user_id_partial=creator_user_id_partial,
+        user=user,
+        sort_by=sort_by,
+    )
+    ranked_by_index = ranked_ids is not None and sort_by == "_id"
+    by_relevance = ranked_by_index or sort_by_score
+    if ranked_by_index:
+        # Relevance sorted searches do not filter on the candidates
+        query = {"$and": [query, ranked_filter(ranked_ids)]}
+
+    pagination_ptr = (page - 1) * rows_per_page
+    results_pipeline = []
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort_by, descending)
+            if by_relevance:
+                pagination_ptr = cursor_offset(position)
+            else:
+                # Continue right after the last card of the previous page
+                results_pipeline.append(
+                    {"$match": keyset_filter(position, sort_by, descending)}
+                )
+                pagination_ptr = 0
+        except ValueError as err:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid cursor: {err}",
+            ) from err
+
+    if ranked_by_index:
+        # Keep the relevance order of the index
+        ids = ranked_filter(ranked_ids)["_id"]["$in"]
+        results_pipeline += [
+            {"$addFields": {"_rank": {"$indexOfArray": [ids, "$_id"]}}},
+            {"$sort": {"_rank": ASCENDING}},
+            {"$unset": "_rank"},
+        ]
+    elif sort_by_score:
+        results_pipeline += [
+            {"$sort": {"_score": -1, "_id": ASCENDING}},
+            {"$unset": "_score"},
+        ]
+    else:
+        results_pipeline.append({"$sort": dict(keyset_sort(sort_by, descending))})
+    if pagination_ptr:
+        results_pipeline.append({"$skip": pagination_ptr})
+    if rows_per_page:
+        # One extra card to know whether there is a next page
+        results_pipeline.append({"$limit": rows_per_page + 1})
+    projection = with_sort_field(return_attr, sort_by)
+    results_pipeline.append(
+        {"$project": {field: 1 for field in projection}}
+        if projection
+        else {"$project": SUMMARY_PROJECTION}
+    )
+
+    pipeline = [{"$match": query}]
+    if sort_by_score:
+        # Text score is only available right after the $text match
+        pipeline.append({"$addFields": {"_score": {"$meta": "textScore"}}})
+    pipeline += [
+        {
+            "$facet": {
+                "results": results_pipeline,
+                "total": [{"$count": "count"}],
+                **{
+                    facet: facet_pipeline(field)
+                    for facet, field in FACET_FIELDS.items()
+                },
+            }
+        },
+    ]
+    (output,) = await db["models"].aggregate(pipeline).to_list(length=1)
+    results = output["results"]
+    response = {
+        "total": output["total"][0]["count"] if output["total"] else 0,
+        "facets": {facet: bucket_counts(output[facet]) for facet in FACET_FIELDS},
+    }
+    if rows_per_page and len(results) > rows_per_page:
+        results = results[:rows_per_page]
+        response["nextCursor"] = (
+            offset_cursor(pagination_ptr + len(results), sort_by, descending)
+            if by_relevance
+            else keyset_cursor(results[-1], sort_by, descending)
+        )
+    response["results"] = json.loads(json_util.dumps(results))
+    return response
 
 
 @router.get("/{creator_user_id}/{model_id}")
 async def get_model_card_by_id(
     model_id: str,
     creator_user_id: str,
+    response: Response,
     convert_s3: bool = Query(default=True),
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
     s3_client=Depends(minio_api_client),
+    if_none_match: Optional[str] = Header(default=None),
 ) -> Dict:
     """Get model card by composite ID: creator_user_id/model_id
 
     Args:
         model_id (str): Model ID to search for
         creator_user_id (str): Creator user ID to search for
+        response (Response): Response, to add the ETag header to
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
+        if_none_match (Optional[str], optional): ETag of the client's copy of the card.
+            Defaults to Header(default=None).
 
     Raises:
         HTTPException: 404 if model card not found
 
     Returns:
-        Dict: Model card
+        Dict: Model card, or an empty 304 response if the client's copy is current
     """
     db, _ = db
+    card_filter = {"modelId": model_id, "creatorUserId": creator_user_id}
+    if if_none_match:
+        # Check the client's copy before loading and processing the card
+        stamp = await db["models"].find_one(card_filter, {"lastModified": 1})
+        if stamp is not None:
+            etag = _card_etag(stamp, convert_s3)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
     # Get model card by database id (NOT clearml id)
-    model = await db["models"].find_one(
-        {"modelId": model_id, "creatorUserId": creator_user_id}
-    )
+    projection = {**EXCLUDE_DERIVED_FIELDS}
+    del projection["mediaRefs"]  # to sign the images without parsing the HTML
+    model = await db["models"].find_one(card_filter, projection)
     if model is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Unable to find: {creator_user_id}/{model_id}",
         )
+    set_etag(response, _card_etag(model, convert_s3))
 
+    media_refs: Optional[List[str]] = model.pop("mediaRefs", None)
     model = json.loads(json_util.dumps(model))
     # Get HTML and Video Sources, replace URLs with signed URLs
     # this is done if S3 bucket is private (e.g secure deployment)
     # and thus we need user credentials to view images and videos
     # stored on s3
     if convert_s3:
-        # Get HTML
-        try:
-            model["markdown"] = await preprocess_html_get(model["markdown"])
-            model["performance"] = await preprocess_html_get(model["performance"])
-        except Exception as err:
-            print(f"Error: {err}")
+        # Sign the images in the HTML and the video concurrently
+        jobs = [
+            preprocess_html_get(
+                model.get("markdown"),
+                model.get("performance"),
+                s3_client=s3_client,
+                media_refs=media_refs,
+            )
+        ]
         if "videoLocation" in model and model["videoLocation"] is not None:
-            try:
-                url: str = model["videoLocation"]
-                url = url.removeprefix("s3://")
-                bucket, object_name = url.split("/", 1)
-                model["videoLocation"] = await get_presigned_url(
-                    s3_client, object_name, bucket
-                )
-            except Exception as err:
-                print(f"Error: {err}")
-                model["videoLocation"] = None
+            jobs.append(_presign_video_location(s3_client, model["videoLocation"]))
+        html, *video = await asyncio.gather(*jobs, return_exceptions=True)
+        if isinstance(html, BaseException):
+            print(f"Error: {html}")
+        else:
+            model["markdown"], model["performance"] = html
+        if video:
+            model["videoLocation"] = video[0]
     return model
 
 
 @router.get("/", response_model=SearchModelResponse, response_model_exclude_unset=True)
 async def search_cards(
+    response: Response,
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
     page: int = Query(default=1, alias="p", gt=0),
     rows_per_page: int = Query(default=10, alias="n", ge=0),
@@ -173,10 +550,14 @@ async def search_cards(
     user: Optional[str] = Query(default=None),
     return_attr: Optional[List[str]] = Query(default=None, alias="return[]"),
     all: Optional[bool] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    include_total: bool = Query(default=True, alias="total"),
+    if_none_match: Optional[str] = Header(default=None),
 ) -> Dict:
     """Search model cards
 
     Args:
+        response (Response): Response, to add the ETag header to
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection. Defaults to Depends(get_db).
         page (int, optional): Page number. Defaults to Query(default=1, alias="p", gt=0).
         rows_per_page (int, optional): Rows per page. Defaults to Query(default=10, alias="n", ge=0).
@@ -187,227 +568,65 @@ async def search_cards(
         tags (Optional[List[str]], optional): Search by task. Defaults to Query(default=None, alias="tags[]").
         frameworks (Optional[List[str]], optional): Search by framework. Defaults to Query( default=None, alias="frameworks[]" ).
         creator_user_id (Optional[str], optional): Search by creator. Defaults to Query(default=None, alias="creator").
-        return_attr (Optional[List[str]], optional): Which fields to return. Defaults to Query(default=None, alias="return[]").
+        return_attr (Optional[List[str]], optional): Which fields to return, all but the markdown and performance HTML
+            if not given. Defaults to Query(default=None, alias="return[]").
         all (Optional[bool], optional): Whether to return all results. Defaults to Query(default=None).
+        cursor (Optional[str], optional): `nextCursor` of the previous page. Takes precedence over the page number.
+            Defaults to Query(default=None).
+        include_total (bool, optional): Whether to count all results. If false, only whether there
+            are more results is returned, and the total can be fetched from /models/_db/count.
+            Defaults to Query(default=True, alias="total").
+        if_none_match (Optional[str], optional): ETag of the client's copy of the page.
+            Defaults to Header(default=None).
+
+    Raises:
+        HTTPException: 422 if the cursor is invalid
 
     Returns:
-        Dict: A dictionary containing the results and pagination information
+        Dict: A dictionary containing the results and pagination information, or an
+            empty 304 response if the client's copy is current
     """
-    db, client = db
-    query = {}
-    # TODO: This is a really stupid way to do search
-    # so should prob rely on elasticsearch or something
-    # So set up ES, sync with Mongo with Logstash, then
-    # use ES BM25 search
-    if user and generic_search_text:
-        query["$and"] = [
-            {
-                "$or": [
-                { "accessControl.enabled": False },
-                { 
-                    "$and": [
-                        {"accessControl.enabled": True},
-                        {"accessControl.authorized": user}
-                    ]
-                },
-                { "creatorUserId": user }
-                ]
-            },
-            {
-               "$or": [
-                   {
-                    "title": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "task": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "tags": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "frameworks": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "creatorUserId": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "owner": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "pointOfContact": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "markdown": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "performance": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "description": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "explanation": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "usage": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-                {
-                    "limitations": {
-                        "$regex": re.escape(generic_search_text),
-                        "$options": "i",
-                    }
-                },
-               ] 
-            }
-        ]
-    
-    elif user:
-        query["$or"] = [
-            { "accessControl.enabled": False },
-            { 
-                "$and": [
-                    {"accessControl.enabled": True},
-                    {"accessControl.authorized": user}
-                ]
-            },
-            { "creatorUserId": user }
-        ]
-
-    elif generic_search_text:
-        query["$or"] = [
-            {
-                "title": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "task": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "tags": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "frameworks": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "creatorUserId": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "owner": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "pointOfContact": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "markdown": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "performance": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "description": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "explanation": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "usage": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-            {
-                "limitations": {
-                    "$regex": re.escape(generic_search_text),
-                    "$options": "i",
-                }
-            },
-        ]
-
-    if title:
-        query["title"] = {"$regex": re.escape(title), "$options": "i"}
-    if tasks:
-        query["task"] = {"$in": [re.compile(task, re.IGNORECASE) for task in tasks]}
-    if tags:
-        query["tags"] = {"$all": [re.compile(tag, re.IGNORECASE) for tag in tags]}
-    if frameworks:
-        query["frameworks"] = {
-            "$in": [re.compile(framework, re.IGNORECASE) for framework in frameworks]
-        }
-    if creator_user_id:
-        query["creatorUserId"] = creator_user_id
-    if creator_user_id_partial:
-        query["creatorUserId"] = {
-            "$regex": re.escape(creator_user_id_partial),
-            "$options": "i",
-        }
+    db, _ = db
+    # Taken before searching, so that results racing a write are not cached
+    cache_key = await search_result_cache.key(
+        db,
+        {
+            "page": page,
+            "rowsPerPage": rows_per_page,
+            "descending": descending,
+            "sortBy": sort_by,
+            "genericSearchText": generic_search_text,
+            "title": title,
+            "tasks": tasks,
+            "tags": tags,
+            "frameworks": frameworks,
+            "creatorUserId": creator_user_id,
+            "creatorUserIdPartial": creator_user_id_partial,
+            "user": user,
+            "return": return_attr,
+            "all": all,
+            "cursor": cursor,
+            "total": include_total,
+        },
+    )
+    etag = search_result_cache.etag(cache_key)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = search_result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    query, ranked_ids, sort_by_score = _build_search_query(
+        generic_search_text=generic_search_text,
+        title=title,
+        tasks=tasks,
+        tags=tags,
+        frameworks=frameworks,
+        creator_user_id=creator_user_id,
+        creator_user_id_partial=creator_user_id_partial,
+        user=user,
+        sort_by=sort_by,
+    )
     # How many documents to skip
     if not all or rows_per_page == 0:
         pagination_ptr = (page - 1) * rows_per_page
@@ -415,19 +634,74 @@ async def search_cards(
         pagination_ptr = 0
         rows_per_page = 0
 
-    # TODO: Refactor pagination method to be more efficient
-    async with await client.start_session() as session:
-        async with session.start_transaction():
-            total_rows = await (db["models"].count_documents(query))
-            results = await (
-                db["models"]
-                .find(query, projection=return_attr)
-                .sort(sort_by, DESCENDING if descending else ASCENDING)
-                .skip(pagination_ptr)
-                .limit(rows_per_page)
-            ).to_list(length=rows_per_page if rows_per_page != 0 else None)
-    results = json.loads(json_util.dumps(results))
-    return {"results": results, "total": total_rows}
+    # Relevance order cannot be expressed as a range of keys,
+    # so those cursors hold an offset instead
+    ranked_by_index = ranked_ids is not None and sort_by == "_id"
+    by_relevance = ranked_by_index or sort_by_score
+    page_query = query
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort_by, descending)
+            if by_relevance:
+                pagination_ptr = cursor_offset(position)
+            else:
+                # Continue right after the last card of the previous page
+                page_query = {
+                    "$and": [query, keyset_filter(position, sort_by, descending)]
+                }
+                pagination_ptr = 0
+        except ValueError as err:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid cursor: {err}",
+            ) from err
+
+    projection = with_sort_field(return_attr, sort_by) or SUMMARY_PROJECTION
+    if ranked_by_index:
+        # Keep the relevance order of the index, fetching only this page
+        results, total_rows = await fetch_ranked_page(
+            db["models"],
+            query,
+            ranked_ids,
+            projection,
+            pagination_ptr,
+            rows_per_page,
+        )
+        has_more = pagination_ptr + len(results) < total_rows
+    else:
+        # Fetch one extra card to know whether there is a next page
+        limit = rows_per_page + 1 if rows_per_page else 0
+        find = (
+            db["models"]
+            .find(page_query, projection=projection)
+            .sort(
+                TEXT_SCORE_SORT
+                if sort_by_score
+                else keyset_sort(sort_by, descending)
+            )
+            .skip(pagination_ptr)
+            .limit(limit)
+        ).to_list(length=limit if limit != 0 else None)
+        if include_total:
+            total_rows, results = await asyncio.gather(
+                count_cache.count(db["models"], query), find
+            )
+        else:
+            results = await find
+        has_more = bool(rows_per_page) and len(results) > rows_per_page
+        if has_more:
+            results = results[:rows_per_page]
+    result = {"total": total_rows} if include_total else {"hasMore": has_more}
+    if rows_per_page and has_more and results:
+        result["nextCursor"] = (
+            offset_cursor(pagination_ptr + len(results), sort_by, descending)
+            if by_relevance
+            else keyset_cursor(results[-1], sort_by, descending)
+        )
+    serialized = json_util.dumps(results)
+    result["results"] = json.loads(serialized)
+    search_result_cache.set(cache_key, result, size=len(serialized))
+    return result
 
 
 @router.get(
@@ -437,31 +711,47 @@ async def search_cards(
 )
 async def get_model_cards_by_user(
     creator_user_id: str,
+    response: Response,
     db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient] = Depends(get_db),
     return_attr: Optional[List[str]] = Query(None, alias="return"),
+    if_none_match: Optional[str] = Header(default=None),
 ) -> Dict:
     """Get all model cards by a user
 
     Args:
         creator_user_id (str): Creator user id
+        response (Response): Response, to add the ETag header to
         db (Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient], optional): MongoDB connection.
             Defaults to Depends(get_db).
-        return_attr (Optional[List[str]], optional): Fields to return.
-            Defaults to Query(None, alias="return").
+        return_attr (Optional[List[str]], optional): Fields to return, all but the markdown
+            and performance HTML if not given. Defaults to Query(None, alias="return").
+        if_none_match (Optional[str], optional): ETag of the client's copy of the results.
+            Defaults to Header(default=None).
 
     Returns:
-        Dict: Results and pagination information
+        Dict: Results and pagination information, or an empty 304 response if the
+            client's copy is current
     """
     results = await search_cards(
+        response=response,
+        if_none_match=if_none_match,
         db=db,
+        page=1,
+        rows_per_page=0,
         all=True,
         return_attr=return_attr,
         creator_user_id=creator_user_id,
+        creator_user_id_partial=None,
+        generic_search_text=None,
         title=None,
+        tasks=None,
         tags=None,
         frameworks=None,
+        user=None,
         sort_by="_id",
         descending=True,
+        cursor=None,
+        include_total=True,
     )
     return results
 
@@ -525,6 +815,11 @@ async def create_model_card_metadata(
         ),
         by_alias=True,  # Convert snake_case to camelCase
     )
+    card_dict["searchText"] = build_search_text(card_dict)
+    card_dict["visibleTo"] = build_visible_to(card_dict)
+    card_dict["mediaRefs"] = extract_media_refs(
+        card_dict.get("markdown"), card_dict.get("performance")
+    )
     async with await mongo_client.start_session() as session:
         try:
             async with session.start_transaction():
@@ -534,6 +829,7 @@ async def create_model_card_metadata(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Unable to add model with user and ID {card_dict['creatorUserId']}/{card_dict['modelId']} as the ID already exists.",
             ) from err
+    await card_upserted(card_dict)
     tasks.add_task(
         delete_orphan_services
     )  # Delete preview services created during model create form
@@ -620,6 +916,16 @@ async def update_model_card_metadata_by_id(
                         detail="User does not have editor access to this model card",
                     )
                 else:
+                    if "markdown" in card_dict or "performance" in card_dict:
+                        new_card = {**existing_card, **card_dict}
+                        card_dict["searchText"] = build_search_text(new_card)
+                        card_dict["mediaRefs"] = extract_media_refs(
+                            new_card.get("markdown"), new_card.get("performance")
+                        )
+                    if "accessControl" in card_dict:
+                        card_dict["visibleTo"] = build_visible_to(
+                            {**existing_card, **card_dict}
+                        )
                     result = await db["models"].update_one(
                         {
                             "modelId": model_id,
@@ -639,6 +945,7 @@ async def update_model_card_metadata_by_id(
                                 }
                             )
                         ) is not None:
+                            await card_upserted(updated_card, existing_card)
                             return updated_card
         # If no changes, try to return existing card
         return existing_card
@@ -686,6 +993,8 @@ async def delete_model_card_by_id(
                 await db["models"].delete_one(
                     {"modelId": model_id, "creatorUserId": creator_user_id}
                 )
+                if existing_card is not None:
+                    await card_deleted(existing_card)
     except HTTPException as err:
         raise err
     except Exception as err:
@@ -744,6 +1053,8 @@ async def delete_multiple_model_cards(
                             "creatorUserId": x["creator_user_id"],
                         }
                     )
+                    if existing_card is not None:
+                        await card_deleted(existing_card)
     except HTTPException as err:
         raise err
     except Exception as err:
@@ -129,6 +129,52 @@ async def test_search_models(
     ), "Wrong card retrieved"
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("flush_db")
+async def test_search_models_omits_content_by_default(
+    client: TestClient,
+    model_metadata: List[Dict],
+    get_fake_db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient],
+):
+    db, _ = get_fake_db
+    for obj in model_metadata:
+        await db["models"].insert_one(obj)
+
+    response = client.get("/models")
+    assert response.status_code == status.HTTP_200_OK
+    result = response.json()["results"][0]
+    assert "title" in result
+    assert "markdown" not in result and "performance" not in result
+
+    response = client.get("/models", params={"return[]": ["markdown"]})
+    assert "markdown" in response.json()["results"][0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("flush_db")
+async def test_faceted_search_models(
+    client: TestClient,
+    model_metadata: List[Dict],
+    get_fake_db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient],
+):
+    db, _ = get_fake_db
+    for obj in model_metadata:
+        await db["models"].insert_one(obj)
+
+    response = client.get(
+        "/models/_db/search", params={"tags[]": "Test Tag", "n": 4}
+    )
+    response_json = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert response_json["total"] == len(model_metadata)
+    assert len(response_json["results"]) == 4
+    assert "nextCursor" in response_json
+    assert response_json["facets"]["tags"]["Test Tag"] == len(model_metadata)
+    assert response_json["facets"]["tasks"] == {
+        "Testing Model Card": len(model_metadata)
+    }
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("flush_db")
 async def test_get_model_card_by_id(
@@ -145,6 +191,36 @@ async def test_get_model_card_by_id(
     response = client.get(f"/models/{creator_user_id}/{model_card_id}")
     assert response.status_code == status.HTTP_200_OK
 
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("flush_db")
+async def test_get_model_card_not_modified(
+    client: TestClient,
+    model_metadata: List[Dict],
+    get_fake_db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient],
+):
+    db, _ = get_fake_db
+    await db["models"].insert_one(model_metadata[0])
+    url = (
+        f"/models/{model_metadata[0]['creatorUserId']}"
+        f"/{model_metadata[0]['modelId']}"
+    )
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    await db["models"].update_one(
+        {"modelId": model_metadata[0]["modelId"]},
+        {"$set": {"lastModified": "later"}},
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+
 # NOTE: Disable this test for now until a solution to simulate or create a K8S cluster specifically for pytests is created
 # @pytest.mark.usefixtures("flush_db")
 # def test_create_model_card_metadata(
@@ -55,9 +55,15 @@ def get_fake_db(client) -> Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]:
 
 @pytest_asyncio.fixture
 async def flush_db(get_fake_db: Tuple[AsyncIOMotorDatabase, AsyncIOMotorClient]):
+    from src.internal.counts import count_cache
+    from src.internal.result_cache import search_result_cache
+
     db, client = get_fake_db
     for collection in await db.list_collection_names():
         await db.drop_collection(collection)
+        count_cache.invalidate(collection)
+    # Documents are inserted directly, without invalidating the caches
+    search_result_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -0,0 +1,56 @@
+import time
+
+from src.internal.cache import LRUCache
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_lru_eviction_by_size():
+    cache = LRUCache(maxsize=10, maxbytes=10)
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    cache.set("a", 1, size=5)  # replacing updates the size
+    assert cache.nbytes == 9
+    cache.set("c", 3, size=3)
+
+    assert "b" not in cache
+    assert cache.nbytes == 8
+    cache.set("huge", 4, size=11)  # never cached
+    assert "huge" not in cache
+    assert cache.get("a") == 1
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_entries_expire():
+    cache = LRUCache(maxsize=10)
+    cache.set("expired", 1, expires_at=time.time() - 1)
+    cache.set("valid", 2, expires_at=time.time() + 60)
+
+    assert cache.get("expired") is None
+    assert cache.get("valid") == 2
+    assert cache.stats.expirations == 1
+
+
+def test_hit_miss_counters():
+    cache = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+
+    info = cache.info()
+    assert info["hits"] == 2
+    assert info["misses"] == 1
+    assert info["hitRatio"] == 2 / 3
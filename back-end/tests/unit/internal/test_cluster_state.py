@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from src.internal.cluster_state import (
+    PODS,
+    ClusterStateCache,
+    ResourceInformer,
+    ResourceStore,
+)
+
+
+def make_pod(name: str, app: Optional[str] = None) -> SimpleNamespace:
+    labels = {"aas-ie-service": "true"}
+    if app is not None:
+        labels["app"] = app
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, labels=labels))
+
+
+def make_mapping(name: str) -> Dict:
+    return {"metadata": {"name": name, "labels": {"aas-ie-service": "true"}}}
+
+
+def test_store_applies_watch_events():
+    store = ResourceStore(index_label="app")
+    store.replace([make_pod("a-1", app="a"), make_pod("b-1", app="b")])
+    assert store.synced
+
+    store.apply("ADDED", make_pod("a-2", app="a"))
+    store.apply("DELETED", make_pod("b-1", app="b"))
+    # Pod relabelled to another app
+    store.apply("MODIFIED", make_pod("a-1", app="c"))
+
+    assert [pod.metadata.name for pod in store.get_by_label("a")] == ["a-2"]
+    assert store.get_by_label("b") == []
+    assert [pod.metadata.name for pod in store.get_by_label("c")] == ["a-1"]
+    assert sorted(store.names()) == ["a-1", "a-2"]
+
+
+def test_informer_list_replaces_store():
+    def list_mappings(**kwargs):
+        assert kwargs["label_selector"] == "aas-ie-service=true"
+        return {
+            "metadata": {"resourceVersion": "42"},
+            "items": [make_mapping("svc-ingress")],
+        }
+
+    store = ResourceStore()
+    store.apply("ADDED", make_mapping("stale-ingress"))
+    informer = ResourceInformer(
+        "mappings",
+        list_mappings,
+        store,
+        label_selector="aas-ie-service=true",
+    )
+
+    assert informer._list() == "42"
+    assert store.names() == ["svc-ingress"]
+
+
+def test_unsynced_kinds_are_reported():
+    cache = ClusterStateCache()
+    assert not cache.is_synced(PODS)
+
+    cache.stores[PODS].replace([make_pod("a-1", app="a")])
+    assert cache.is_synced(PODS)
+    assert [pod.metadata.name for pod in cache.get_pods("a")] == ["a-1"]
+    assert cache.info()[PODS]["size"] == 1
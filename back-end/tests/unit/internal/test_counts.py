@@ -0,0 +1,41 @@
+import asyncio
+
+from src.internal.card_events import UPSERTED
+from src.internal.counts import CountCache
+
+
+class FakeCollection:
+    name = "models"
+
+    def __init__(self):
+        self.counts = 0
+        self.estimates = 0
+
+    async def count_documents(self, query):
+        self.counts += 1
+        return 3
+
+    async def estimated_document_count(self):
+        self.estimates += 1
+        return 10
+
+
+def test_unfiltered_count_uses_estimate():
+    collection = FakeCollection()
+    assert asyncio.run(CountCache().count(collection, {})) == 10
+    assert collection.estimates == 1 and collection.counts == 0
+
+
+def test_filtered_count_is_cached_by_normalized_query():
+    collection = FakeCollection()
+    cache = CountCache()
+
+    async def count_twice():
+        await cache.count(collection, {"title": "a", "task": "b"})
+        return await cache.count(collection, {"task": "b", "title": "a"})
+
+    assert asyncio.run(count_twice()) == 3
+    assert collection.counts == 1
+    cache.on_card_event(UPSERTED, {}, None)
+    asyncio.run(cache.count(collection, {"title": "a", "task": "b"}))
+    assert collection.counts == 2
@@ -0,0 +1,24 @@
+from src.internal.etag import etag_matches, make_etag, not_modified
+
+
+def test_make_etag_is_strong_and_stable():
+    etag = make_etag("id", "2023-01-01", 5)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("id", "2023-01-01", 5)
+    assert etag != make_etag("id", "2023-01-02", 5)
+
+
+def test_etag_matches():
+    etag = make_etag("a")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag("b"), etag)
+
+
+def test_not_modified():
+    response = not_modified('"abc"')
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"abc"'
+    assert response.body == b""
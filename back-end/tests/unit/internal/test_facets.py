@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from src.internal.cache import CacheBackend, MemoryCacheBackend
+from src.internal.card_events import DELETED, UPSERTED
+from src.internal.facets import FACETS_CACHE_KEY, FacetCache, facet_options
+
+
+def test_card_writes_drop_cached_counts():
+    cache = FacetCache(MemoryCacheBackend())
+    card = {"tags": ["a", "b"], "frameworks": ["PyTorch"], "task": "Detection"}
+    counts = {"tags": {"a": 1, "b": 1}, "frameworks": {}, "tasks": {}}
+
+    async def apply_events():
+        await cache.backend.set(FACETS_CACHE_KEY, counts)
+        # Facet values unchanged, the counts are still right
+        await cache.on_card_event(UPSERTED, {**card, "title": "x"}, card)
+        kept = await cache.backend.get(FACETS_CACHE_KEY)
+        await cache.on_card_event(DELETED, card, card)
+        return kept, await cache.backend.get(FACETS_CACHE_KEY)
+
+    kept, dropped = asyncio.run(apply_events())
+    assert facet_options(kept) == {
+        "tags": ["a", "b"],
+        "frameworks": [],
+        "tasks": [],
+    }
+    assert dropped is None  # rebuilt on next read
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
@@ -0,0 +1,145 @@
+import asyncio
+
+from src.internal import preprocess_html
+from src.internal.dependencies.minio_client import presigned_url_cache
+from src.internal.preprocess_html import (
+    extract_media_refs,
+    parse_s3_url,
+    preprocess_html_get,
+    presign_s3_urls,
+    substitute_media_urls,
+)
+
+
+class FakeMinio:
+    def __init__(self, fail=()):
+        self.signed = []
+        self.fail = fail
+        self.running = 0
+        self.max_running = 0
+
+    async def presigned_get_object(self, bucket_name, object_name, expires):
+        if object_name in self.fail:
+            raise ValueError("cannot sign")
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        self.signed.append(object_name)
+        return f"http://minio/{bucket_name}/{object_name}?signed"
+
+
+def test_parse_s3_url():
+    assert parse_s3_url("s3://bucket/images/a.png") == (
+        "bucket",
+        "images/a.png",
+    )
+
+
+def test_presign_all_documents_once():
+    presigned_url_cache.clear()
+    client = FakeMinio()
+    markdown = (
+        '<p><img src="s3://bucket/a.png"/><img src="s3://bucket/b.png"/></p>'
+    )
+    performance = '<img src="s3://bucket/a.png"/>'
+
+    new_markdown, new_performance, untouched = asyncio.run(
+        preprocess_html_get(
+            markdown, performance, "<p>No images</p>", s3_client=client
+        )
+    )
+    assert sorted(client.signed) == ["a.png", "b.png"]
+    assert 'src="minio/bucket/a.png?signed"' in new_markdown
+    assert 'src="minio/bucket/b.png?signed"' in new_markdown
+    assert 'src="minio/bucket/a.png?signed"' in new_performance
+    assert untouched == "<p>No images</p>"
+
+
+def test_presign_is_bounded_and_skips_failures():
+    presigned_url_cache.clear()
+    client = FakeMinio(fail=("bad.png",))
+    urls = [f"s3://bucket/{i}.png" for i in range(10)] + [
+        "s3://bucket/bad.png"
+    ]
+
+    presigned = asyncio.run(presign_s3_urls(client, urls, concurrency=3))
+    assert len(presigned) == 10
+    assert "s3://bucket/bad.png" not in presigned
+    assert client.max_running <= 3
+
+
+def test_large_documents_are_parsed_off_the_event_loop(monkeypatch):
+    presigned_url_cache.clear()
+    monkeypatch.setattr(preprocess_html, "OFF_LOOP_HTML_SIZE", 10)
+    threads = []
+
+    async def to_thread(func, *args):
+        threads.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(preprocess_html.asyncio, "to_thread", to_thread)
+    (html,) = asyncio.run(
+        preprocess_html_get(
+            '<img src="s3://bucket/a.png"/>', s3_client=FakeMinio()
+        )
+    )
+    assert "?signed" in html
+    assert len(threads) == 2  # parse and serialize
+
+
+def test_extract_media_refs():
+    markdown = (
+        '<p><img src="s3://bucket/a.png"><img src="https://x/b.png"></p>'
+    )
+    performance = '<img src="s3://bucket/c.png"><img src="s3://bucket/a.png">'
+    assert extract_media_refs(markdown, None, performance) == [
+        "s3://bucket/a.png",
+        "s3://bucket/c.png",
+    ]
+
+
+def test_substitute_media_urls():
+    html = '<p><img src="s3://bucket/a.png"><img src="s3://bucket/b.png"></p>'
+    urls = {"s3://bucket/a.png": "minio/bucket/a.png?X=1&Y=2"}
+    assert substitute_media_urls(html, urls) == (
+        '<p><img src="minio/bucket/a.png?X=1&amp;Y=2">'
+        '<img src="s3://bucket/b.png"></p>'
+    )
+
+
+def test_substitute_media_urls_only_in_img_src():
+    urls = {"s3://bucket/a.png": "minio/bucket/a.png"}
+    untouched = (
+        '<img data-src="s3://bucket/a.png" alt="src=\'s3://bucket/a.png\'">'
+        '<video src="s3://bucket/a.png"></video>'
+    )
+    assert substitute_media_urls(untouched, urls) == untouched
+    assert (
+        substitute_media_urls(
+            '<img data-src="s3://bucket/a.png" src="s3://bucket/a.png">', urls
+        )
+        == '<img data-src="s3://bucket/a.png" src="minio/bucket/a.png">'
+    )
+
+
+def test_known_media_refs_skip_parsing(monkeypatch):
+    presigned_url_cache.clear()
+    client = FakeMinio()
+
+    def parse(*_):
+        raise AssertionError("HTML should not be parsed")
+
+    monkeypatch.setattr(preprocess_html, "_parse_all", parse)
+    markdown = '<img src="s3://bucket/a.png">'
+    new_markdown, performance = asyncio.run(
+        preprocess_html_get(
+            markdown,
+            "<p>No images</p>",
+            s3_client=client,
+            media_refs=["s3://bucket/a.png"],
+        )
+    )
+    assert new_markdown == '<img src="minio/bucket/a.png?signed">'
+    assert performance == "<p>No images</p>"
+    assert client.signed == ["a.png"]
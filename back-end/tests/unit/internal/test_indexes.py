@@ -0,0 +1,46 @@
+from src.internal.indexes import INDEXES, TEXT_INDEX_NAME, summarize_explain
+
+
+def test_registry_has_unique_model_key_and_text_index():
+    names = {
+        index.document["name"]: index.document for index in INDEXES["models"]
+    }
+    assert names["creatorUserId_1_modelId_1"]["unique"]
+    assert TEXT_INDEX_NAME in names
+    assert names["lastModified_1__id_1"]
+
+
+def test_summarize_collection_scan():
+    explain = {
+        "queryPlanner": {
+            "winningPlan": {
+                "stage": "SORT",
+                "inputStage": {"stage": "COLLSCAN"},
+            }
+        },
+        "executionStats": {"totalKeysExamined": 0, "totalDocsExamined": 42},
+    }
+    summary = summarize_explain(explain)
+    assert summary["collectionScan"]
+    assert summary["stages"] == ["SORT", "COLLSCAN"]
+    assert summary["docsExamined"] == 42
+
+
+def test_summarize_index_scan_in_slot_based_plan():
+    explain = {
+        "queryPlanner": {
+            "winningPlan": {
+                "queryPlan": {
+                    "stage": "FETCH",
+                    "inputStage": {
+                        "stage": "IXSCAN",
+                        "indexName": "serviceName_1",
+                    },
+                },
+                "slotBasedPlan": {"stages": "[1] nlj ..."},
+            }
+        }
+    }
+    summary = summarize_explain(explain)
+    assert not summary["collectionScan"]
+    assert summary["indexes"] == ["serviceName_1"]
@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.internal.ingress import IngressHostResolver, build_inference_url
+from src.models.engine import ServiceBackend
+
+
+class FakeK8s:
+    def __init__(self, ip: str):
+        self.ip = ip
+        self.calls = 0
+        self.core = SimpleNamespace(read_namespaced_service=self.read)
+
+    def read(self, name: str, namespace: str):
+        return SimpleNamespace(
+            metadata=SimpleNamespace(name=name, namespace=namespace),
+            spec=SimpleNamespace(load_balancer_ip=None),
+            status=SimpleNamespace(
+                load_balancer=SimpleNamespace(
+                    ingress=[SimpleNamespace(ip=self.ip, hostname=None)]
+                )
+            ),
+        )
+
+    async def call(self, method, *args, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return method(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_host_is_cached(monkeypatch):
+    monkeypatch.setattr("src.internal.ingress.config.IE_DOMAIN", None)
+    k8s = FakeK8s("10.0.0.1")
+    resolver = IngressHostResolver(ttl=60)
+
+    hosts = await asyncio.gather(
+        *[resolver.get_host(k8s, ServiceBackend.EMISSARY) for _ in range(5)]
+    )
+    assert hosts == ["10.0.0.1"] * 5
+    assert await resolver.get_host(k8s, ServiceBackend.EMISSARY) == "10.0.0.1"
+    assert k8s.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_domain_skips_lookup(monkeypatch):
+    monkeypatch.setattr("src.internal.ingress.config.IE_DOMAIN", "example.com")
+    k8s = FakeK8s("10.0.0.1")
+    resolver = IngressHostResolver()
+
+    assert (
+        await resolver.get_host(k8s, ServiceBackend.KNATIVE) == "example.com"
+    )
+    assert k8s.calls == 0
+
+
+def test_build_inference_url(monkeypatch):
+    monkeypatch.setattr("src.internal.ingress.config.IE_DOMAIN", None)
+    monkeypatch.setattr("src.internal.ingress.config.IE_NAMESPACE", "ie")
+
+    assert (
+        build_inference_url("http", "1.2.3.4", ServiceBackend.EMISSARY, "svc")
+        == "http://1.2.3.4/svc/"
+    )
+    assert (
+        build_inference_url("http", "1.2.3.4", ServiceBackend.KNATIVE, "svc")
+        == "http://svc.ie.1.2.3.4.sslip.io"
+    )
@@ -0,0 +1,89 @@
+from typing import Dict, List
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from src.internal.jwks import JWKSCache
+
+
+def make_jwk(kid: str) -> Dict:
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048
+    )
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_jwk = jwk.construct(
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ),
+        "RS256",
+    ).to_dict()
+    public_jwk.update({"kid": kid, "use": "sig"})
+    return {"pem": pem, "public": public_jwk}
+
+
+class FakeIdP:
+    def __init__(self, keys: List[Dict]):
+        self.keys = keys
+        self.calls = 0
+
+    def certs(self) -> Dict:
+        self.calls += 1
+        return {"keys": [key["public"] for key in self.keys]}
+
+
+@pytest.mark.asyncio
+async def test_keys_are_cached():
+    key = make_jwk("key-1")
+    idp = FakeIdP([key])
+    cache = JWKSCache(idp.certs, ttl=300, min_refresh_interval=0)
+
+    for _ in range(5):
+        assert await cache.get_key("key-1") == key["public"]
+    assert idp.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_forces_refresh():
+    old_key, new_key = make_jwk("key-1"), make_jwk("key-2")
+    idp = FakeIdP([old_key])
+    cache = JWKSCache(idp.certs, ttl=300, min_refresh_interval=0)
+    assert await cache.get_key("key-1") is not None
+
+    # IdP rotates its keys
+    idp.keys = [new_key]
+    assert await cache.get_key("key-2") == new_key["public"]
+    assert idp.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_forced_refresh_is_rate_limited():
+    idp = FakeIdP([make_jwk("key-1")])
+    cache = JWKSCache(idp.certs, ttl=300, min_refresh_interval=60)
+
+    assert await cache.get_key("key-1") is not None
+    for i in range(5):
+        assert await cache.get_key(f"made-up-{i}") is None
+    assert idp.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_key_verifies_token():
+    key = make_jwk("key-1")
+    cache = JWKSCache(FakeIdP([key]).certs)
+    token = jwt.encode(
+        {"sub": "user"},
+        key["pem"].decode(),
+        algorithm="RS256",
+        headers={"kid": "key-1"},
+    )
+
+    kid = jwt.get_unverified_header(token)["kid"]
+    claims = jwt.decode(token, await cache.get_key(kid), algorithms=["RS256"])
+    assert claims["sub"] == "user"
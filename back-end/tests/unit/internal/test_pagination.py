@@ -0,0 +1,53 @@
+import pytest
+from bson import ObjectId
+
+from src.internal.pagination import (
+    cursor_offset,
+    decode_cursor,
+    keyset_cursor,
+    keyset_filter,
+    keyset_sort,
+    offset_cursor,
+    with_sort_field,
+)
+
+
+def test_keyset_cursor_round_trip():
+    doc = {"_id": ObjectId(), "lastModified": "2023-01-01 00:00:00"}
+    token = keyset_cursor(doc, "lastModified", True)
+    position = decode_cursor(token, "lastModified", True)
+    assert keyset_filter(position, "lastModified", True) == {
+        "$or": [
+            {"lastModified": {"$lt": "2023-01-01 00:00:00"}},
+            {
+                "lastModified": "2023-01-01 00:00:00",
+                "_id": {"$lt": doc["_id"]},
+            },
+        ]
+    }
+
+
+def test_keyset_filter_by_id():
+    doc = {"_id": ObjectId()}
+    position = decode_cursor(keyset_cursor(doc, "_id", False), "_id", False)
+    assert keyset_filter(position, "_id", False) == {
+        "_id": {"$gt": doc["_id"]}
+    }
+    assert keyset_sort("_id", False) == [("_id", 1)]
+    assert keyset_sort("title", True) == [("title", -1), ("_id", -1)]
+
+
+def test_cursor_for_other_sort_order_is_rejected():
+    token = offset_cursor(20, "_id", True)
+    assert cursor_offset(decode_cursor(token, "_id", True)) == 20
+    with pytest.raises(ValueError):
+        decode_cursor(token, "title", True)
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor", "_id", True)
+    with pytest.raises(ValueError):
+        keyset_filter(decode_cursor(token, "_id", True), "_id", True)
+
+
+def test_with_sort_field():
+    assert with_sort_field(None, "title") is None
+    assert with_sort_field(["title"], "created") == ["title", "created"]
@@ -0,0 +1,184 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from src.internal.pod_logs import (
+    ContainerLogFollower,
+    LogBroadcasterRegistry,
+    LogStreamEnded,
+    follow_service_logs,
+    split_timestamp,
+    timestamp_key,
+)
+
+
+def test_timestamps_compare_by_value():
+    # Trailing zeros of the fraction are trimmed, so "0.1" > "0.12" as strings
+    assert timestamp_key("2023-01-01T00:00:00.1Z") < timestamp_key(
+        "2023-01-01T00:00:00.12Z"
+    )
+    assert split_timestamp("2023-01-01T00:00:00.1Z hello world") == (
+        "2023-01-01T00:00:00.1Z",
+        "hello world",
+    )
+
+
+@pytest.mark.asyncio
+async def test_follower_resumes_without_repeating_lines():
+    pod = SimpleNamespace(
+        metadata=SimpleNamespace(name="svc-pod"),
+        status=SimpleNamespace(phase="Running"),
+    )
+    streams = [
+        ["2023-01-01T00:00:01Z a", "2023-01-01T00:00:02Z b"],
+        # Reconnect returns lines already sent
+        [
+            "2023-01-01T00:00:01Z a",
+            "2023-01-01T00:00:02Z b",
+            "2023-01-01T00:00:03Z c",
+        ],
+    ]
+    calls: List[dict] = []
+
+    async def get_pods():
+        return [pod]
+
+    follower = ContainerLogFollower(
+        None, "ie", get_pods, tail_lines=10, reconnect_delay=0
+    )
+
+    async def fake_stream(pod_name: str, **kwargs):
+        calls.append(kwargs)
+        for line in streams[len(calls) - 1]:
+            yield line
+
+    follower._stream = fake_stream
+    lines = []
+    async for line in follower.follow():
+        lines.append(line)
+        if len(lines) == 3:
+            break
+
+    assert lines == ["a", "b", "c"]
+    assert calls[0] == {"tail_lines": 10}
+    assert "since_seconds" in calls[1]
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_shares_upstream_and_drops_oldest():
+    upstream = asyncio.Queue()
+    started = []
+    stopped = []
+
+    async def source(tail_lines: int):
+        started.append(tail_lines)
+        try:
+            while True:
+                yield await upstream.get()
+        finally:
+            stopped.append(True)
+
+    registry = LogBroadcasterRegistry()
+    broadcaster = registry.get("svc", source, buffer_lines=100)
+    fast = broadcaster.subscribe(tail_lines=10, max_lines=100)
+    slow = registry.get("svc", source).subscribe(tail_lines=10, max_lines=2)
+    await asyncio.sleep(0)
+
+    await upstream.put(["a", "b"])
+    await upstream.put(["c"])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert started == [10]  # one upstream for both viewers
+    assert await fast.get() == ["a", "b", "c"]
+    assert await slow.get() == ["[... 1 lines skipped ...]", "b", "c"]
+    assert registry.info()["viewers"] == 2
+
+    # Late viewer starts with the recent history
+    late = broadcaster.subscribe(tail_lines=2, max_lines=100)
+    assert await late.get() == ["b", "c"]
+
+    for subscription in (fast, slow, late):
+        subscription.close()
+    await asyncio.sleep(0)
+    assert stopped == [True]
+    assert registry.info()["streams"] == 0
+
+
+@pytest.mark.asyncio
+async def test_follower_retries_when_listing_pods_fails():
+    pod = SimpleNamespace(
+        metadata=SimpleNamespace(name="svc-pod"),
+        status=SimpleNamespace(phase="Running"),
+    )
+    attempts = []
+
+    async def get_pods():
+        attempts.append(True)
+        if len(attempts) == 1:
+            raise ApiException(status=504)
+        return [pod]
+
+    follower = ContainerLogFollower(
+        None, "ie", get_pods, tail_lines=10, reconnect_delay=0
+    )
+
+    async def fake_stream(pod_name: str, **kwargs):
+        yield "2023-01-01T00:00:01Z a"
+
+    follower._stream = fake_stream
+    async for line in follower.follow():
+        break
+
+    assert line == "a"
+    assert follower.reconnects == 1
+
+
+@pytest.mark.asyncio
+async def test_service_logs_stop_when_a_container_stream_fails(monkeypatch):
+    async def follow(self):
+        if self.container == "sidecar":
+            raise RuntimeError("boom")
+        yield "a"
+        await asyncio.Event().wait()
+
+    async def get_pods():
+        return []
+
+    monkeypatch.setattr(ContainerLogFollower, "follow", follow)
+    batches = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for lines in follow_service_logs(
+            None, "ie", get_pods, ["main", "sidecar"]
+        ):
+            batches.append(lines)
+    assert batches in ([], [["[main] a"]])
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_ends_viewers_and_restarts_without_repeats():
+    runs = [[["a", "b"]], [["c"]]]
+    started = []
+
+    async def source(tail_lines: int):
+        started.append(tail_lines)
+        for lines in runs[len(started) - 1]:
+            yield lines
+        raise RuntimeError("connection lost")
+
+    registry = LogBroadcasterRegistry()
+    broadcaster = registry.get("svc", source, buffer_lines=100)
+    viewer = broadcaster.subscribe(tail_lines=10, max_lines=100)
+    assert await viewer.get() == ["a", "b"]
+    with pytest.raises(LogStreamEnded, match="connection lost"):
+        await viewer.get()
+    viewer.close()
+
+    # The stream is started again, without the lines of the stopped one
+    again = registry.get("svc", source).subscribe(tail_lines=10, max_lines=100)
+    assert await again.get() == ["c"]
+    assert started == [10, 10]
+    again.close()
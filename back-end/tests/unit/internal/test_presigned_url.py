@@ -0,0 +1,66 @@
+import asyncio
+
+from src.internal.dependencies import minio_client
+from src.internal.dependencies.minio_client import (
+    get_presigned_url,
+    presigned_url_cache,
+    remove_data,
+)
+
+
+class FakeMinio:
+    def __init__(self):
+        self.signed = 0
+        self.removed = []
+
+    async def presigned_get_object(self, bucket_name, object_name, expires):
+        self.signed += 1
+        return f"http://minio/{bucket_name}/{object_name}?sig={self.signed}"
+
+    async def remove_object(self, bucket_name, object_name):
+        self.removed.append((bucket_name, object_name))
+
+
+def test_presigned_urls_are_reused():
+    presigned_url_cache.clear()
+    client = FakeMinio()
+
+    async def sign_twice():
+        first = await get_presigned_url(client, "a.png", "bucket")
+        second = await get_presigned_url(client, "a.png", "bucket")
+        other = await get_presigned_url(client, "b.png", "bucket")
+        return first, second, other
+
+    first, second, other = asyncio.run(sign_twice())
+    assert first == second
+    assert other != first
+    assert client.signed == 2
+
+
+def test_removed_objects_are_signed_again():
+    presigned_url_cache.clear()
+    client = FakeMinio()
+
+    async def sign_remove_sign():
+        await get_presigned_url(client, "a.png", "bucket")
+        await remove_data(client, "a.png", "bucket")
+        await get_presigned_url(client, "a.png", "bucket")
+
+    asyncio.run(sign_remove_sign())
+    assert client.signed == 2
+
+
+def test_urls_are_not_cached_without_refresh_window(monkeypatch):
+    presigned_url_cache.clear()
+    monkeypatch.setattr(minio_client.config, "PRESIGNED_URL_EXPIRY", 60)
+    monkeypatch.setattr(
+        minio_client.config, "PRESIGNED_URL_REFRESH_MARGIN", 60
+    )
+    client = FakeMinio()
+
+    async def sign_twice():
+        await get_presigned_url(client, "a.png", "bucket")
+        await get_presigned_url(client, "a.png", "bucket")
+
+    asyncio.run(sign_twice())
+    assert client.signed == 2
@@ -0,0 +1,87 @@
+import asyncio
+
+from src.internal import result_cache
+from src.internal.card_events import UPSERTED
+from src.internal.result_cache import SearchResultCache
+
+
+class FakeGenerations:
+    """Stands in for the collection of the shared generation counters."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    async def find_one_and_update(self, query, update, **kwargs):
+        doc = self.docs.setdefault(query["_id"], {"generation": 0})
+        doc["generation"] += update["$inc"]["generation"]
+        return doc
+
+
+def make_db():
+    return {result_cache.GENERATIONS_COLLECTION: FakeGenerations()}
+
+
+def key(cache, db, params):
+    return asyncio.run(cache.key(db, params))
+
+
+def write(cache, db, monkeypatch):
+    monkeypatch.setattr(result_cache, "get_db", lambda: (db, None))
+    asyncio.run(cache.on_card_event(UPSERTED, {}, None))
+
+
+def test_key_ignores_parameter_order():
+    cache, db = SearchResultCache(), make_db()
+    assert key(cache, db, {"a": 1, "b": [2]}) == key(
+        cache, db, {"b": [2], "a": 1}
+    )
+
+
+def test_write_invalidates_responses(monkeypatch):
+    cache, db = SearchResultCache(), make_db()
+    cache.set(key(cache, db, {"page": 1}), {"results": []}, size=20)
+    assert cache.get(key(cache, db, {"page": 1})) == {"results": []}
+
+    write(cache, db, monkeypatch)
+    assert cache.get(key(cache, db, {"page": 1})) is None
+    assert cache.info()["generation"] == 1
+    assert cache.info()["bytes"] == 0
+
+
+def test_writes_of_other_processes_invalidate_responses(monkeypatch):
+    db = make_db()
+    cache, other = SearchResultCache(), SearchResultCache()
+    cache.set(key(cache, db, {"page": 1}), {"results": []}, size=20)
+
+    write(other, db, monkeypatch)
+    assert cache.get(key(cache, db, {"page": 1})) is None
+
+
+def test_response_racing_a_write_is_not_cached(monkeypatch):
+    cache, db = SearchResultCache(), make_db()
+    stale_key = key(cache, db, {"page": 1})
+    write(cache, db, monkeypatch)  # while searching
+    cache.set(stale_key, {"results": ["stale"]}, size=20)
+    assert len(cache._cache) == 0
+
+
+def test_disabled_cache():
+    cache, db = SearchResultCache(maxbytes=0), make_db()
+    cache.set(key(cache, db, {"page": 1}), {"results": []}, size=20)
+    assert cache.get(key(cache, db, {"page": 1})) is None
+
+
+def test_etag_changes_with_shared_generation(monkeypatch):
+    db = make_db()
+    cache, other = SearchResultCache(), SearchResultCache()
+    etag = cache.etag(key(cache, db, {"page": 1}))
+    assert etag == cache.etag(key(cache, db, {"page": 1}))
+    assert etag != cache.etag(key(cache, db, {"page": 2}))
+    # Workers agree on the tag, and see each other's writes
+    assert etag == other.etag(key(other, db, {"page": 1}))
+
+    write(other, db, monkeypatch)
+    assert etag != cache.etag(key(cache, db, {"page": 1}))
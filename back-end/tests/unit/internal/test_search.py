@@ -0,0 +1,57 @@
+from src.internal import search
+from src.internal.search import (
+    PUBLIC_VISIBILITY,
+    REGEX_SEARCH_FIELDS,
+    build_search_text,
+    build_visible_to,
+    search_filter,
+    visibility_filter,
+)
+
+
+def test_search_filter_uses_text_index():
+    query, uses_text_index = search_filter("  object detection ")
+    assert uses_text_index
+    assert query == {"$text": {"$search": "object detection"}}
+
+
+def test_search_filter_short_fragment_uses_regex():
+    query, uses_text_index = search_filter("yo.")
+    assert not uses_text_index
+    assert len(query["$or"]) == len(REGEX_SEARCH_FIELDS)
+    assert query["$or"][0]["title"] == {"$regex": r"yo\.", "$options": "i"}
+
+
+def test_build_search_text_strips_html():
+    card = {
+        "markdown": "<h1>YOLO</h1><p>Detects   <b>objects</b></p>",
+        "performance": None,
+    }
+    assert build_search_text(card) == "YOLO Detects objects"
+
+
+def test_build_visible_to_public_card():
+    assert build_visible_to({"creatorUserId": "a"}) == [PUBLIC_VISIBILITY]
+    card = {
+        "creatorUserId": "a",
+        "accessControl": {"enabled": False, "authorized": ["b"]},
+    }
+    assert build_visible_to(card) == [PUBLIC_VISIBILITY]
+
+
+def test_build_visible_to_restricted_card():
+    card = {
+        "creatorUserId": "a",
+        "accessControl": {"enabled": True, "authorized": ["c", "b", "a"]},
+    }
+    assert build_visible_to(card) == ["a", "b", "c"]
+
+
+def test_visibility_filter(monkeypatch):
+    monkeypatch.setattr(search, "_visibility_ready", True)
+    assert visibility_filter("a") == {
+        "visibleTo": {"$in": [PUBLIC_VISIBILITY, "a"]}
+    }
+    # Cards may lack `visibleTo` until backfilled
+    monkeypatch.setattr(search, "_visibility_ready", False)
+    assert {"creatorUserId": "a"} in visibility_filter("a")["$or"]
@@ -0,0 +1,95 @@
+import asyncio
+
+from bson import ObjectId
+
+from src.internal.card_events import DELETED, UPSERTED
+from src.internal.search_index import (
+    BM25Index,
+    load_search_index_snapshot,
+    save_search_index_snapshot,
+    tokenize,
+)
+
+
+def make_card(title: str, **kwargs) -> dict:
+    return {
+        "_id": ObjectId(),
+        "title": title,
+        "tags": kwargs.pop("tags", []),
+        "markdown": kwargs.pop("markdown", ""),
+        "lastModified": "2023-01-01 00:00:00",
+        **kwargs,
+    }
+
+
+def build_index(*cards) -> BM25Index:
+    index = BM25Index()
+    for card in cards:
+        index.add_card(card)
+    index.ready = True
+    return index
+
+
+def test_tokenize():
+    assert tokenize("YOLOv5: Object-Detection") == [
+        "yolov5",
+        "object",
+        "detection",
+    ]
+
+
+def test_not_ready_index_cannot_search():
+    index = BM25Index()
+    assert index.search("anything") is None
+
+
+def test_title_match_ranks_first():
+    body = make_card("Segmenter", markdown="<p>Better than a detector</p>")
+    title = make_card("Detector")
+    index = build_index(body, title)
+    ranked = [doc_id for doc_id, _ in index.search("detector")]
+    assert ranked == [str(title["_id"]), str(body["_id"])]
+
+
+def test_prefix_and_all_words_must_match():
+    yolo = make_card("YOLO object detection", tags=["vision"])
+    bert = make_card("BERT text classification", tags=["nlp"])
+    index = build_index(yolo, bert)
+    assert [doc_id for doc_id, _ in index.search("obj det")] == [
+        str(yolo["_id"])
+    ]
+    assert index.search("yolo nlp") == []
+
+
+def test_card_events_update_index():
+    card = make_card("Old title")
+    index = build_index(card)
+    index.on_card_event(UPSERTED, {**card, "title": "New title"}, card)
+    assert index.search("old") == []
+    assert len(index.search("new")) == 1
+    index.on_card_event(DELETED, card, card)
+    assert len(index) == 0
+    assert index.info()["terms"] == 0
+
+
+def test_snapshot_round_trip():
+    card = make_card("Speech recognition")
+    index = build_index(card)
+    restored = BM25Index()
+    restored.load_snapshot(index.to_snapshot())
+    restored.ready = True
+    assert restored.search("speech") == index.search("speech")
+    assert restored.versions() == {str(card["_id"]): card["lastModified"]}
+    assert not restored.dirty
+
+
+def test_snapshot_file_replaced_without_leftovers(tmp_path):
+    card = make_card("Speech recognition")
+    index = build_index(card)
+    path = str(tmp_path / "index.json.gz")
+    asyncio.run(save_search_index_snapshot(index, path))
+    asyncio.run(save_search_index_snapshot(index, path))
+    restored = BM25Index()
+    assert asyncio.run(load_search_index_snapshot(restored, path))
+    assert restored.versions() == index.versions()
+    assert [p.name for p in tmp_path.iterdir()] == ["index.json.gz"]
@@ -0,0 +1,77 @@
+import asyncio
+
+from src.internal.card_events import DELETED, UPSERTED
+from src.internal.suggest import SuggestIndex, card_suggest_values
+
+CARDS = [
+    {
+        "title": "YOLOv5",
+        "tags": ["yolo", "Detection"],
+        "frameworks": ["PyTorch"],
+        "task": "Object Detection",
+        "creatorUserId": "alice",
+    },
+    {
+        "title": "YOLOX",
+        "tags": ["yolo"],
+        "frameworks": ["PyTorch"],
+        "task": "Object Detection",
+        "creatorUserId": "bob",
+    },
+]
+
+
+def test_card_suggest_values_skips_restricted_cards():
+    card = {**CARDS[0], "accessControl": {"enabled": True, "authorized": []}}
+    assert card_suggest_values(card) == []
+    assert ("creator", "alice") in card_suggest_values(CARDS[0])
+
+
+def test_suggest_ranks_by_count():
+    index = SuggestIndex()
+    index.load(CARDS)
+    assert index.suggest("yo") == [
+        {"value": "yolo", "kind": "tag", "count": 2},
+        {"value": "YOLOX", "kind": "title", "count": 1},
+        {"value": "YOLOv5", "kind": "title", "count": 1},
+    ]
+    assert index.suggest("obj", kinds=["task"]) == [
+        {"value": "Object Detection", "kind": "task", "count": 2}
+    ]
+    assert index.suggest("yo", limit=1)[0]["value"] == "yolo"
+    assert index.suggest("  ") == []
+    assert index.suggest("zzz") == []
+
+
+def test_suggest_follows_card_writes():
+    index = SuggestIndex()
+    index.load(CARDS)
+    updated = {**CARDS[1], "title": "Detector", "tags": []}
+    index.on_card_event(UPSERTED, updated, CARDS[1])
+    assert [s["value"] for s in index.suggest("yo")] == ["yolo", "YOLOv5"]
+    assert index.suggest("yolo")[0]["count"] == 1
+    assert index.suggest("det", kinds=["title"])[0]["value"] == "Detector"
+
+    index.on_card_event(DELETED, CARDS[0], CARDS[0])
+    assert index.suggest("yo") == []
+    index.on_card_event(DELETED, updated, updated)
+    assert len(index) == 0
+
+
+def test_concurrent_first_requests_build_once():
+    index = SuggestIndex()
+    builds = []
+
+    async def rebuild(db):
+        builds.append(db)
+        await asyncio.sleep(0)
+        index.load(CARDS)
+
+    index.rebuild = rebuild
+
+    async def burst():
+        await asyncio.gather(*(index.ensure_ready("db") for _ in range(5)))
+
+    asyncio.run(burst())
+    assert builds == ["db"]
+    assert index.ready